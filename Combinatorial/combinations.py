@@ -7,23 +7,33 @@
 
 Simple command line demonstration of combinatorial usage:
 
-Use <<python>> combinations.py a:3 b:4 c:5 c=2 s=1
+Use <<python>> combinations.py a:3 b:4 c:5 c=2 s=1 o=rows.csv f=csv t=1
 
 Where:
 - <<name>>:<<number>> gives the dimension name and number of values
 - c=<<number>> sets the coverage
 - s=<<number>> sets the random seed
+- o=<<path>> writes the rows to the file rather than printing them
+- f=<<format>> sets the file format, csv, jsonl, binary or suite
+- z=1 gzip compresses the file, other than a suite
+- t=1 prints a timing summary to stderr
 
 """
 
 
 if __name__ == '__main__':
 
-    from sys import argv
-    from combinatorials import Combinatorial, Dimension
+    from sys import argv, exit, stderr
+    from time import perf_counter
+    from combinatorials import Combinatorial, Dimension, Suite, \
+        Writer
 
     coverage = 0
     seed = None
+    path = None
+    format_ = 'csv'
+    compress = False
+    timing = False
     dimensions = []
     for arg in argv[1:]:
         if ':' in arg:
@@ -35,12 +45,37 @@ if __name__ == '__main__':
                 coverage = int(value)
             elif setting == 's':
                 seed = int(value)
+            elif setting == 'o':
+                path = value
+            elif setting == 'f':
+                format_ = value
+            elif setting == 'z':
+                compress = bool(int(value))
+            elif setting == 't':
+                timing = bool(int(value))
+    formats = (*Writer.FORMATS, 'suite')
+    if format_ not in formats:
+        print(f'Unknown format: {format_}, expected one of '
+              f'{", ".join(formats)}', file=stderr)
+        print(__doc__, file=stderr)
+        exit(2)
 
+    start = perf_counter()
     combinatorial = Combinatorial(dimensions, [], coverage, seed)
-    count = 0
-    for combination in combinatorial:
-        print(combination)
-        count += 1
-    print(f'Count: {count} '
-          f'({combinatorial.generator.minimum} - '
-          f'{combinatorial.generator.maximum})')
+    if path is None:
+        count = 0
+        for combination in combinatorial:
+            print(combination)
+            count += 1
+        print(f'Count: {count} '
+              f'({combinatorial.generator.minimum} - '
+              f'{combinatorial.generator.maximum})')
+    elif format_ == 'suite':
+        count = Suite.write(combinatorial, path)
+    else:
+        count = Writer(combinatorial, format_, compress).write(path)
+    if timing:
+        seconds = perf_counter() - start
+        print(f'Rows: {count} Seconds: {seconds:.3f} '
+              f'Rows/s: {count / seconds if seconds else 0:.0f}',
+              file=stderr)
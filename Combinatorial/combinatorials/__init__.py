@@ -9,15 +9,34 @@ Classes designed for combinatorial generation.
 
 """
 
+from .batch import Batch
+from .cache import Cache
+from .checkpoint import Checkpoint
 from .combinatorial import Combinatorial
 from .configuration import Configuration
 from .constraint import Constraint
+from .delta import Delta
 from .dimension import Dimension
+from .evaluator import Evaluator
 from .extent import Extent
 from .feature import Feature
 from .fillgenerator import FillGenerator
 from .generator import Generator_
+from .library import Library
+from .librarygenerator import LibraryGenerator
 from .minusonegenerator import MinusOneGenerator
+from .optimiser import Optimiser
 from .option import Option
+from .orderer import Orderer
+from .packer import Packer
+from .portfolio import Portfolio
+from .producer import Producer
+from .reducer import Reducer
+from .retirementqueue import RetirementQueue
+from .scheduler import Scheduler
 from .sequencegenerator import SequenceGenerator
+from .streamer import Streamer
 from .subcombination import SubCombination
+from .suite import Suite
+from .tally import Tally
+from .writer import Writer
@@ -0,0 +1,74 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-21
+:Compatibility: Python 3.9
+:License:       MIT
+
+Batch generation of independent models over a process pool.
+"""
+
+from collections.abc import Collection, Generator
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from time import perf_counter
+from typing import Any, Optional
+from utility import check
+from utility.defaults import NONE_TYPE
+from .combinatorial import Combinatorial
+
+
+class Batch:
+
+    """Generate independent models across a process pool, yielding each
+    result as it completes.
+
+    Models are submitted most expensive first, by estimate, so the longest
+    generations are not left to last. Each model is generated from a copy in
+    a worker process, so the models themselves are not iterated.
+    """
+
+    def __init__(self, models: Collection[Combinatorial],
+                 workers: Optional[int] = None):
+        """Construct a Batch object.
+
+        :param models: Combinatorial models to generate.
+        :param workers: Maximum number of processes, None for the number of
+            processors, 0 to generate in process.
+        """
+        assert isinstance(models, Collection), check()
+        assert next((False for m in models
+                     if not isinstance(m, Combinatorial)), True), check()
+        assert isinstance(workers, (int, NONE_TYPE)), check()
+        # ----------
+        self._models = list(models)
+        self._workers = workers
+
+    def generate(self) \
+            -> Generator[tuple[int, list[tuple[Any, ...]], float], None, None]:
+        """Generate the models, yielding the position of each model in the
+        models, its rows and the generation time in seconds as it
+        completes."""
+        models = self._models
+        order = sorted(range(len(models)), key=lambda n: models[n].estimate,
+                       reverse=True)
+        if self._workers == 0:
+            for number in order:
+                yield (number, *self._generate(models[number]))
+        else:
+            with ProcessPoolExecutor(self._workers) as executor:
+                futures = {executor.submit(self._generate, models[n]): n
+                           for n in order}
+                try:
+                    for future in as_completed(futures):
+                        yield (futures[future], *future.result())
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+    @classmethod
+    def _generate(cls, model: Combinatorial) \
+            -> tuple[list[tuple[Any, ...]], float]:
+        # Generate the rows of a model and time the generation.
+        start = perf_counter()
+        rows = list(model)
+        return rows, perf_counter() - start
@@ -0,0 +1,146 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-09-30
+:Compatibility: Python 3.9
+:License:       MIT
+
+Persistent on-disk cache of generated rows.
+"""
+
+from array import array
+from collections.abc import Collection
+from os import getpid, replace, utime
+from pathlib import Path
+from struct import calcsize, pack, unpack
+from sys import byteorder
+from threading import get_ident
+from typing import Optional, Union
+from utility import check
+from utility.defaults import ENDIAN
+
+
+class Cache:
+
+    """Directory of generated rows keyed by the structure of the model.
+
+    Rows are stored as matrices of value indexes so that a hit can be mapped
+    back to the current values of the model. Each entry is written to a
+    temporary file and renamed into place, so processes sharing a cache on
+    one host never see a partial entry. Entries are evicted least recently
+    used first once the entry or size limit is exceeded.
+
+    :var MARKER: File marker for cache entries.
+    :var SUFFIX: File suffix for cache entries.
+    :var HEADER: Struct format of the entry header; marker, item size,
+        columns and rows.
+    :var TYPECODES: Array type codes for the supported item sizes.
+    """
+
+    MARKER: bytes = b'CMBC'
+    SUFFIX: str = '.cmbc'
+    HEADER: str = '>4sBII'
+    TYPECODES: dict[int, str] = {array(t).itemsize: t
+                                 for t in reversed('BHILQ')}
+
+    def __init__(self, path: Union[str, Path], entries: int = 1024,
+                 size: int = 64 * 1024 * 1024):
+        """Construct a Cache object.
+
+        :param path: Directory of the cache, created if required.
+        :param entries: Maximum number of entries.
+        :param size: Maximum total size of the entries in bytes.
+        """
+        assert isinstance(path, (str, Path)), check()
+        assert isinstance(entries, int) and entries > 0, check()
+        assert isinstance(size, int) and size > 0, check()
+        # ----------
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._entries = entries
+        self._size = size
+
+    def get(self, key: str) -> Optional[list[tuple[int, ...]]]:
+        """Return the rows for the key, None if there is no entry.
+
+        :param key: Key of the entry.
+        """
+        assert isinstance(key, str), check()
+        # ----------
+        path = self._path / (key + self.SUFFIX)
+        try:
+            data = path.read_bytes()
+            # Record the use for eviction.
+            utime(path)
+        except OSError:
+            return None
+        header = calcsize(self.HEADER)
+        if len(data) < header:
+            return None
+        marker, itemsize, columns, count = unpack(self.HEADER, data[:header])
+        if marker != self.MARKER or itemsize not in self.TYPECODES:
+            return None
+        values = array(self.TYPECODES[itemsize])
+        values.frombytes(data[header:])
+        if len(values) != columns * count:
+            return None
+        if byteorder != ENDIAN:
+            values.byteswap()
+        return [tuple(values[n:n + columns])
+                for n in range(0, len(values), columns)] if columns else \
+            [()] * count
+
+    def put(self, key: str, rows: Collection[Collection[int]]):
+        """Store the rows for the key.
+
+        :param key: Key of the entry.
+        :param rows: Value indexes of the rows.
+        """
+        assert isinstance(key, str), check()
+        assert isinstance(rows, Collection), check()
+        # ----------
+        columns = len(next(iter(rows), ()))
+        maximum = max((max(r, default=0) for r in rows), default=0)
+        itemsize = next(s for s in sorted(self.TYPECODES)
+                        if maximum < 256 ** s)
+        values = array(self.TYPECODES[itemsize],
+                       [v for r in rows for v in r])
+        if byteorder != ENDIAN:
+            values.byteswap()
+        data = pack(self.HEADER, self.MARKER, itemsize, columns, len(rows))
+        path = self._path / (key + self.SUFFIX)
+        temporary = path.with_suffix(f'.{getpid()}.{get_ident()}.tmp')
+        temporary.write_bytes(data + values.tobytes())
+        replace(temporary, path)
+        self.evict()
+
+    def evict(self):
+        """Evict least recently used entries beyond the limits."""
+        entries = []
+        for path in self._path.glob('*' + self.SUFFIX):
+            try:
+                status = path.stat()
+            except OSError:
+                # Evicted by another process.
+                continue
+            entries.append((status.st_mtime, status.st_size, path))
+        entries.sort(reverse=True)
+        size = 0
+        for count, (_, size_, path) in enumerate(entries):
+            size += size_
+            if count >= self._entries or size > self._size:
+                path.unlink(missing_ok=True)
+
+    def clear(self):
+        """Remove all entries."""
+        for path in self._path.glob('*' + self.SUFFIX):
+            path.unlink(missing_ok=True)
+
+    @property
+    def path(self) -> Path:
+        """Directory of the cache."""
+        return self._path
+
+    def __len__(self) -> int:
+        # Return the number of entries.
+        return len(list(self._path.glob('*' + self.SUFFIX)))
@@ -0,0 +1,107 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-11-11
+:Compatibility: Python 3.9
+:License:       MIT
+
+Checkpoint files of the state of a generation run.
+"""
+
+from json import dumps, loads
+from os import getpid, replace
+from pathlib import Path
+from threading import get_ident
+from time import perf_counter
+from typing import Optional, Union
+from utility import check
+from utility.defaults import ENCODING, NONE_TYPE
+
+
+class Checkpoint:
+
+    """Checkpoint of a run, as the number of rows consumed and the journal of
+    evaluations of its generator, saved for the key of the model that
+    determines the rows.
+
+    A checkpoint is constructed per run and is saved at most every INTERVAL
+    seconds from its construction. The file is a line of JSON for the key
+    followed by a line per save, of the rows consumed and the journal
+    entries added since the previous save, so that saving is proportional
+    to the evaluations made since. The first save of a run replaces the
+    file atomically and later saves append to it. A save torn by an
+    interruption is ignored, with those after it, when the checkpoint is
+    loaded. A checkpoint file is written by one run at a time. A checkpoint
+    without a path does nothing, so that runs need not check whether
+    checkpoints are enabled.
+
+    :var INTERVAL: Minimum interval in seconds between saves.
+    """
+
+    INTERVAL: float = 60.0
+
+    def __init__(self, path: Union[str, Path, NONE_TYPE],
+                 key: Optional[str]):
+        """Construct a Checkpoint object.
+
+        :param path: Path of the checkpoint file, None for no checkpoint.
+        :param key: Key of the model, None if the rows are not repeatable.
+        """
+        assert isinstance(path, (str, Path, NONE_TYPE)), check()
+        assert isinstance(key, (str, NONE_TYPE)), check()
+        # ----------
+        self._path = None if path is None else Path(path)
+        self._key = key
+        self._saved = perf_counter()
+        self._written = None
+
+    def load(self) -> Optional[tuple[int, list]]:
+        """Return the rows consumed and the journal of the checkpoint, None
+        if there is no checkpoint for the key."""
+        if self._path is None or self._key is None:
+            return None
+        try:
+            lines = self._path.read_text(encoding=ENCODING).split('\n')
+            if loads(lines[0]).get('key') != self._key:
+                return None
+        except (OSError, ValueError, AttributeError):
+            return None
+        count, journal = None, []
+        # The last line is empty, or a save torn by an interruption.
+        for line in lines[1:-1]:
+            try:
+                save = loads(line)
+            except ValueError:
+                break
+            count = save['count']
+            journal.extend(save['journal'])
+        return None if count is None else (count, journal)
+
+    def save(self, count: int, journal: Optional[list]):
+        """Save the state if the interval has passed.
+
+        :param count: Number of rows consumed.
+        :param journal: Journal of the generator, of which entries already
+            saved are unchanged.
+        """
+        if self._path is not None and \
+                perf_counter() - self._saved >= self.INTERVAL:
+            journal = journal or []
+            save = dumps({'count': count,
+                          'journal': journal[self._written or 0:]})
+            if self._written is None:
+                text = dumps({'key': self._key}) + '\n' + save + '\n'
+                temporary = self._path.with_name(
+                    f'{self._path.name}.{getpid()}.{get_ident()}.tmp')
+                temporary.write_text(text, encoding=ENCODING)
+                replace(temporary, self._path)
+            else:
+                with self._path.open('a', encoding=ENCODING) as file:
+                    file.write(save + '\n')
+            self._written = len(journal)
+            self._saved = perf_counter()
+
+    def remove(self):
+        """Remove the checkpoint of a complete run."""
+        if self._path is not None:
+            self._path.unlink(missing_ok=True)
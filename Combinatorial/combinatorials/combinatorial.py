@@ -8,39 +8,82 @@
 Provide a user-level combinatorial API.
 """
 
-from collections.abc import Collection, Generator
-from typing import Any, Optional
+from array import array
+from collections.abc import AsyncGenerator, Collection, Generator
+from collections.abc import Iterator
+from hashlib import sha256
+from json import dumps
+from math import comb
+from pathlib import Path
+from typing import Any, Optional, Union
 from utility import check
-from utility.defaults import NONE_TYPE
+from utility.defaults import ENCODING, NONE_TYPE
+from .cache import Cache
+from .checkpoint import Checkpoint
 from .configuration import Configuration
 from .constraint import Constraint
 from .dimension import Dimension
 from .generator import Generator_
+from .optimiser import Optimiser
+from .option import Option
+from .orderer import Orderer
+from .packer import Packer
+from .producer import Producer
+from .reducer import Reducer
+from .scheduler import Scheduler
+from .streamer import Streamer
+from .tally import Tally
 
 
 class Combinatorial(Configuration):
 
-    """Combinatorial generator that provides n-level solution sets."""
+    """Combinatorial generator that provides n-level solution sets.
+
+    :var VERSION: Version of the generated rows, included in the key.
+    """
+
+    VERSION: int = 2
 
     def __init__(self, dimensions: Collection[Dimension] = (),
                  constraints: Collection[Constraint] = (),
-                 coverage: int = 0, seed: Optional[int] = None):
+                 coverage: int = 0, seed: Optional[int] = None,
+                 executed: Collection[Collection[Any]] = ()):
         """Construct a Combinatorial object.
 
         :param dimensions: Dimensions in the configuration.
         :param constraints: Constraints in the configuration.
         :param coverage: Required coverage.
         :param seed: Randomising seed.
+        :param executed: Rows already executed, as values per dimension. Only
+            the rows needed to complete coverage are generated.
         """
         assert isinstance(dimensions, Collection), check()
         assert isinstance(constraints, Collection), check()
         assert isinstance(coverage, int), check()
         assert isinstance(seed, (int, NONE_TYPE)), check()
+        assert isinstance(executed, Collection), check()
+        assert next((False for r in executed
+                     if len(r) != len(dimensions)), True), check()
         # ----------
         self._dimensions = dimensions
         self._coverage = coverage
+        self._executed = [tuple(r) for r in executed]
+        self._reduce = False
+        self._optimise = 0
+        self._order = False
+        self._schedule = False
+        self._cache = None
+        self._checkpoint = None
+        self._memoise = False
+        self._target = None
+        self._limit = None
+        self._metrics = {'achieved': None, 'curve': [], 'cost': 0}
+        self._rows = None
+        self._count = 0
+        self._measures = (None, [])
+        self._ranked = None
         self._generator = self.get_generator(dimensions, constraints,
-                                             coverage, seed)
+                                             coverage, seed, executed)
         super().__init__()
 
     @property
@@ -68,10 +111,657 @@ class Combinatorial(Configuration):
         """Randomising seed for configuration."""
         return self._generator.seed
 
+    @property
+    def executed(self) -> list[tuple[Any, ...]]:
+        """Rows already executed, as values per dimension."""
+        return self._executed
+
+    @property
+    def reduce(self) -> bool:
+        """True if the rows are reduced after generation, False otherwise.
+        Reduction removes redundant rows and merges rows that differ only in
+        don't care features, at the cost of generating all rows before the
+        first is yielded."""
+        return self._reduce
+
+    @reduce.setter
+    def reduce(self, value: bool):
+        assert isinstance(value, bool), check()
+        # ----------
+        self._reduce = value
+        self.invalidate()
+
+    @property
+    def optimise(self) -> int:
+        """Iteration budget for local search optimisation of the rows after
+        generation, 0 to disable. Optimisation deletes rows and repairs the
+        coverage, at the cost of generating all rows before the first is
+        yielded."""
+        return self._optimise
+
+    @optimise.setter
+    def optimise(self, value: int):
+        assert isinstance(value, int), check()
+        assert value >= 0, check()
+        # ----------
+        self._optimise = value
+        self.invalidate()
+
+    @property
+    def order(self) -> bool:
+        """True if the rows are ordered after generation so that each covers
+        as many sub-combination indexes not covered by earlier rows as
+        possible, False otherwise. Rows run in order then reach coverage
+        soonest if they are stopped early, at the cost of generating all
+        rows before the first is yielded. The coverage curve is measured."""
+        return self._order
+
+    @order.setter
+    def order(self, value: bool):
+        assert isinstance(value, bool), check()
+        # ----------
+        self._order = value
+        self.invalidate()
+
+    @property
+    def schedule(self) -> bool:
+        """True if the rows are ordered after generation, and after any
+        order, to minimise the total cost of switching values between
+        consecutive rows, by the switch cost of each dimension, False
+        otherwise. Only per-dimension switch costs are supported, not costs
+        per pair of values. The rows are unchanged, and all are generated
+        before the first is yielded. The coverage curve is measured."""
+        return self._schedule
+
+    @schedule.setter
+    def schedule(self, value: bool):
+        assert isinstance(value, bool), check()
+        # ----------
+        self._schedule = value
+        self.invalidate()
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes for the evaluation of rows with many
+        candidate solutions, 0 to evaluate in process. The rows are
+        independent of the number of workers."""
+        return self._generator.workers
+
+    @workers.setter
+    def workers(self, value: int):
+        assert isinstance(value, int), check()
+        assert value >= 0, check()
+        # ----------
+        self._generator.workers = value
+
+    @property
+    def target(self) -> Optional[float]:
+        """Fraction of the coverable sub-combination indexes at which
+        iteration stops, None for full coverage. Greedy generation covers
+        most indexes in the early rows, so a target below 1 saves the long
+        tail of rows that each cover few indexes."""
+        return self._target
+
+    @target.setter
+    def target(self, value: Optional[float]):
+        assert isinstance(value, (int, float, NONE_TYPE)), check()
+        assert value is None or 0 < value <= 1, check()
+        # ----------
+        self._target = value
+        self.invalidate()
+
+    @property
+    def limit(self) -> Optional[int]:
+        """Maximum number of rows, None for no maximum."""
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: Optional[int]):
+        assert isinstance(value, (int, NONE_TYPE)), check()
+        assert value is None or value >= 0, check()
+        # ----------
+        self._limit = value
+        self.invalidate()
+
+    @property
+    def achieved(self) -> Optional[float]:
+        """Fraction of the coverable sub-combination indexes covered by the
+        rows yielded by the last iteration to end, including one stopped
+        early, measured where there is a target, limit or order, None
+        otherwise. An iteration in progress is not reflected, so concurrent
+        iterations do not overwrite each other's measures. Indexes are
+        coverable unless excluded by a constraint on the dimensions of their
+        sub-combination or covered by an executed row. Replayed rows are not
+        measured, but report the measures of the iteration that recorded
+        them."""
+        return self._metrics['achieved']
+
+    @property
+    def curve(self) -> list[float]:
+        """Fraction of the coverable sub-combination indexes covered after
+        each row yielded by the last iteration to end, measured as
+        achieved."""
+        return self._metrics['curve']
+
+    @property
+    def cost(self) -> float:
+        """Total estimated cost of the rows yielded by the last iteration
+        to end, the sum over the rows of the cost of each value, 1 where the
+        dimension has no costs."""
+        return self._metrics['cost']
+
+    @property
+    def candidates(self) -> int:
+        """Number of candidate solutions evaluated per row by the search
+        generators before the best so far is taken, 0 for no limit."""
+        return self._generator.candidates
+
+    @candidates.setter
+    def candidates(self, value: int):
+        assert isinstance(value, int), check()
+        assert value >= 0, check()
+        # ----------
+        self._generator.candidates = value
+        self.invalidate()
+
+    @property
+    def budget(self) -> Optional[float]:
+        """Time budget of generation in seconds by the search generators,
+        None for no budget. Once it is spent the row being evaluated takes
+        the best candidate solution so far and each row after evaluates at
+        most Generator_.FALLBACK candidates, so that generation completes
+        with full coverage at the cost of more rows. Rows generated with a
+        budget are not repeatable, so they have no key."""
+        return self._generator.budget
+
+    @budget.setter
+    def budget(self, value: Optional[float]):
+        assert isinstance(value, (int, float, NONE_TYPE)), check()
+        assert value is None or value >= 0, check()
+        # ----------
+        self._generator.budget = value
+        self.invalidate()
+
+    @property
+    def cache(self) -> Optional[Cache]:
+        """Cache of generated rows, None for no caching."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: Optional[Cache]):
+        assert isinstance(value, (Cache, NONE_TYPE)), check()
+        # ----------
+        self._cache = value
+
+    @property
+    def checkpoint(self) -> Optional[Path]:
+        """Path of the checkpoint file, None for no checkpoints. The state
+        of an iteration is saved at most every Checkpoint.INTERVAL seconds,
+        as the number of rows consumed and the journal of evaluations of the
+        generator, and the file is removed once iteration is complete. An
+        iteration that finds a checkpoint for the same key resumes from it,
+        replaying the journal to restore the coverage, feature counts and
+        random state without scoring candidates, and yields only the rows
+        that remained. Resumed rows are neither memoised nor cached."""
+        return self._checkpoint
+
+    @checkpoint.setter
+    def checkpoint(self, value: Union[str, Path, NONE_TYPE]):
+        assert isinstance(value, (str, Path, NONE_TYPE)), check()
+        # Resumed rows must be repeatable.
+        assert value is None or self.key is not None, check()
+        # ----------
+        self._checkpoint = None if value is None else Path(value)
+
+    @property
+    def memoise(self) -> bool:
+        """True if the rows of the first iteration are recorded and replayed
+        by later iterations, False otherwise. Replayed rows are not loaded
+        into the dimensions."""
+        return self._memoise
+
+    @memoise.setter
+    def memoise(self, value: bool):
+        assert isinstance(value, bool), check()
+        # ----------
+        self._memoise = value
+        if not value:
+            self.invalidate()
+
+    def invalidate(self):
+        """Discard the recorded rows so that the next iteration generates
+        them again. Required if the dimensions or constraints are changed."""
+        self._rows = None
+        self._ranked = None
+
+    @property
+    def indexed(self) -> bool:
+        """True if the rows can be accessed by rank, False otherwise. This
+        holds for the deterministic generators without post-generation
+        stages or early stopping."""
+        return self._generator.INDEXED and not self._reduce and \
+            not self._optimise and not self._order and \
+            not self._schedule and self._target is None and self._limit is None
+
+    def row(self, rank: int) -> tuple[Any, ...]:
+        """Return the row at the rank, as values per dimension, without
+        generating the rows before it. The combinatorial must be indexed.
+
+        :param rank: Rank of the row, 0 to len - 1.
+        """
+        assert self.indexed, check()
+        assert isinstance(rank, int), check()
+        # ----------
+        generator, tables, count = self._get_ranked()
+        assert 0 <= rank < count, check()
+        # ----------
+        row = self._get_positions(generator, tables, generator.unrank(rank))
+        return tuple(list(d.values)[i] for i, d in zip(row, self._dimensions))
+
+    def shard(self, number: int, count: int) \
+            -> Generator[tuple[Any, ...], None, None]:
+        """Iterate through one of a number of contiguous shards of the rows,
+        each of which can be generated independently. The shards together
+        yield the rows of the combinatorial, in order. The combinatorial must
+        be indexed.
+
+        :param number: Number of the shard, 0 to count - 1.
+        :param count: Number of shards.
+        """
+        assert self.indexed, check()
+        assert isinstance(count, int) and count > 0, check()
+        assert isinstance(number, int) and 0 <= number < count, check()
+        # ----------
+        generator, tables, length = self._get_ranked()
+        values = [list(d.values) for d in self._dimensions]
+        for rank in range(length * number // count,
+                          length * (number + 1) // count):
+            row = self._get_positions(generator, tables,
+                                      generator.unrank(rank))
+            yield tuple(v[i] for i, v in zip(row, values))
+
+    @property
+    def tables(self) -> list[list[Any]]:
+        """Value lookup table per dimension, indexed by the value positions
+        of iter_batches."""
+        return [list(d.values) for d in self._dimensions]
+
+    def iter_batches(self, size: int = 1024) \
+            -> Generator[list[array], None, None]:
+        """Iterate through blocks of up to size rows as columns, one array of
+        value positions per dimension, to be resolved through the tables.
+        Values are not materialised and no tuple is created per row. The
+        arrays support the buffer protocol, so they can be wrapped without
+        copying, by numpy.frombuffer for example.
+
+        :param size: Maximum number of rows per block.
+        """
+        assert isinstance(size, int) and size > 0, check()
+        # ----------
+        maximum = max((len(d) for d in self._dimensions), default=1) - 1
+        itemsize = next(s for s in sorted(Cache.TYPECODES)
+                        if maximum < 256 ** s)
+        typecode = Cache.TYPECODES[itemsize]
+        columns = [array(typecode) for _ in self._dimensions]
+        count = 0
+        for row in self._iterate_positions():
+            for column, position in zip(columns, row):
+                column.append(position)
+            count += 1
+            if count == size:
+                yield columns
+                columns = [array(typecode) for _ in self._dimensions]
+                count = 0
+        if count:
+            yield columns
+
+    @property
+    def packer(self) -> Packer:
+        """Packer of the rows of iter_packed."""
+        return Packer(self._dimensions)
+
+    def iter_packed(self) -> Generator[int, None, None]:
+        """Iterate through the rows packed as mixed-radix integers of value
+        positions, without materialising the values. Rows are decoded by the
+        packer."""
+        packer = self.packer
+        for row in self._iterate_positions():
+            yield packer.pack(row)
+
+    def background(self, size: int = 64) \
+            -> Generator[tuple[Any, ...], None, None]:
+        """Iterate through the rows as they are generated in a background
+        thread, handed over through a queue of bounded size, as by
+        Producer.
+
+        :param size: Maximum number of rows held in the queue.
+        """
+        assert isinstance(size, int) and size > 0, check()
+        # ----------
+        return iter(Producer(self, size))
+
+    def aiter(self, chunk: int = 64) \
+            -> AsyncGenerator[tuple[Any, ...], None]:
+        """Asynchronously iterate through the rows, generated in chunks in a
+        worker thread so that the event loop is not blocked, as by Streamer.
+
+        :param chunk: Number of rows generated per chunk.
+        """
+        assert isinstance(chunk, int) and chunk > 0, check()
+        # ----------
+        return Streamer(self, chunk).__aiter__()
+
+    @property
+    def estimate(self) -> int:
+        """Estimated relative cost of generation, the minimum number of rows
+        times the number of sub-combinations scored per row."""
+        generator = self._generator
+        return generator.minimum * comb(len(generator.dimensions),
+                                        generator.coverage)
+
+    @property
+    def key(self) -> Optional[str]:
+        """Canonical hash of the model structure that determines the rows,
+        None if the rows are not repeatable. Values are represented by their
+        position in the dimension so that the key is independent of the
+        values themselves."""
+        option, iterator_seed = self.get_option(self._generator)
+        if self.seed is None and not option & Option.NO_SHUFFLE or \
+                self._generator.budget is not None:
+            return None
+        identities = [d.identity for d in self._dimensions]
+        values = [list(d.values) for d in self._dimensions]
+        constraints = []
+        for constraint in self.constraints:
+            extents = []
+            for extent in constraint.extents:
+                if extent.identity in identities:
+                    position = identities.index(extent.identity)
+                    extents.append([position, sorted(
+                        values[position].index(v) for v in extent.values
+                        if v in values[position])])
+            constraints.append(sorted(extents))
+        structure = {
+            'version': self.VERSION,
+            'generator': str(self._generator),
+            'option': option.value,
+            'iterator_seed': iterator_seed,
+            'seed': self.seed,
+            'sizes': [len(v) for v in values],
+            'coverage': self._coverage,
+            'constraints': sorted(constraints),
+            'executed': [[v.index(e) if e in v else -1
+                          for e, v in zip(r, values)]
+                         for r in self._executed],
+            'reduce': self._reduce,
+            'optimise': self._optimise}
+        if self._order:
+            structure['order'] = self._order
+        if next((True for d in self._dimensions if d.costs), False):
+            structure['costs'] = [d.costs for d in self._dimensions]
+        if self._schedule:
+            structure['schedule'] = [d.switch for d in self._dimensions]
+        if self._generator.candidates:
+            structure['candidates'] = self._generator.candidates
+        if self._target is not None:
+            structure['target'] = self._target
+        if self._limit is not None:
+            structure['limit'] = self._limit
+        text = dumps(structure, sort_keys=True)
+        return sha256(text.encode(ENCODING)).hexdigest()
+
     def __iter__(self) -> Generator[tuple[Any], None, None]:
         # iterate through the generator and yield the value sets.
+        values = [list(d.values) for d in self._dimensions]
+        for row in self._iterate_positions():
+            yield tuple(v[i] for i, v in zip(row, values))
+
+    def __len__(self) -> int:
+        # Return the number of rows, recording them first if required.
+        if self._rows is None:
+            if self.indexed:
+                if next((True for d in self._dimensions if len(d) == 0),
+                        False):
+                    return 0
+                return self._get_ranked()[2]
+            if not self._memoise:
+                raise TypeError('length requires memoise or indexed')
+            if self._get_checkpoint().load() is not None:
+                # Resumed rows are not recorded.
+                raise TypeError('length requires the checkpoint resumed')
+            for _ in self:
+                pass
+        return self._count
+
+    def __bool__(self) -> bool:
+        # Truth does not depend on the length.
+        return True
+
+    def _get_ranked(self) -> tuple[Generator_, list[list[int]], int]:
+        # Return a copy of the generator indexed for access by rank, its
+        # value position tables and the number of rows, indexing it on first
+        # use. Concurrent first use may index more than one copy, which is
+        # harmless as the copies are equal and unrank does not modify them.
+        ranked = self._ranked
+        if ranked is None:
+            generator = self._generator.copy()
+            option, _ = self.get_option(generator)
+            count = generator.index(option)
+            ranked = generator, self._get_tables(generator), count
+            self._ranked = ranked
+        return ranked
+
+    @classmethod
+    def _get_tables(cls, generator: Generator_) -> list[list[int]]:
+        # Return the value position of each feature of each dimension of an
+        # initialised generator. Features usually hold the values themselves,
+        # so positions are found by identity, then by equality for values
+        # created on iteration, such as those of a range.
+        tables = []
+        for dimension in generator.dimensions:
+            values = list(dimension.values)
+            positions = {}
+            for position, value in enumerate(values):
+                positions.setdefault(id(value), position)
+            tables.append([positions[id(f.value)] if id(f.value) in positions
+                           else values.index(f.value)
+                           for f in dimension.features])
+        return tables
+
+    def _get_positions(self, generator: Generator_,
+                       tables: list[list[int]],
+                       indexes: Collection[Optional[int]]) -> tuple[int, ...]:
+        # Return the value positions of a row of feature indexes of the
+        # generator. Unset features are filled as by get_value. Dimensions of
+        # one value are not in the generator and are constant.
+        positions = [t[d.get_index() if i is None else i] for d, t, i in
+                     zip(generator.dimensions, tables, indexes)]
+        if len(positions) == len(self._dimensions):
+            return tuple(positions)
+        positions = iter(positions)
+        return tuple(0 if len(d) == 1 else next(positions)
+                     for d in self._dimensions)
+
+    def _resolve(self, generator: Generator_, iterator: Iterator[Any]) \
+            -> Generator[tuple[int, ...], None, None]:
+        # Yield the value positions of the rows loaded by the iterator. The
+        # features are initialised once iteration has started.
+        tables = None
+        for _ in iterator:
+            if tables is None:
+                tables = self._get_tables(generator)
+            yield self._get_positions(
+                generator, tables,
+                [d.feature_index for d in generator.dimensions])
+
+    def _iterate_positions(self) -> Generator[tuple[int, ...], None, None]:
+        # Iterate through the rows as value positions per dimension,
+        # totalling their estimated cost. The measures of the iteration are
+        # kept for it and published as it ends.
+        metrics = {'achieved': None, 'curve': [], 'cost': 0}
+        costs = [(n, d.costs) for n, d in enumerate(self._dimensions)
+                 if d.costs]
+        fixed = len(self._dimensions) - len(costs)
+        try:
+            for row in self._replay_positions(metrics):
+                metrics['cost'] += fixed + sum(c[row[n]] for n, c in costs)
+                yield row
+        finally:
+            self._metrics = metrics
+
+    def _replay_positions(self, metrics: dict[str, Any]) \
+            -> Generator[tuple[int, ...], None, None]:
+        # Iterate through the rows as value positions per dimension,
+        # replaying recorded or cached rows where possible.
         if next((False for d in self._dimensions if len(d) == 0), True):
-            # Return an iterator through the Generator.
-            option, iterator_seed = self.get_option(self._generator)
-            for _ in self._generator.iterate(option, iterator_seed):
-                yield tuple(d.get_value() for d in self._dimensions)
+            if self._rows is not None:
+                # Replay the recorded rows, with the measures recorded.
+                metrics['achieved'] = self._measures[0]
+                metrics['curve'] = list(self._measures[1])
+                columns = len(self._dimensions)
+                for n in range(0, self._count * columns, columns) \
+                        if columns else [0] * self._count:
+                    yield tuple(self._rows[n:n + columns])
+                return
+            state = self._get_checkpoint().load()
+            if state is not None:
+                # Resume, yielding the remaining rows only. Indexed rows
+                # are resolved from the rank reached, others are replayed.
+                skip = 0 if self.indexed else state[0]
+                for count, row in enumerate(self._measure(
+                        self._iterate(state), metrics), 1):
+                    if count > skip:
+                        yield row
+                return
+            key = self.key if self._cache is not None else None
+            rows = self._cache.get(key) if key else None
+            if rows is None:
+                rows = []
+                for row in self._measure(self._iterate(), metrics):
+                    if key or self._memoise:
+                        rows.append(row)
+                    yield row
+                if key:
+                    self._cache.put(key, rows)
+            else:
+                yield from self._measure(iter(rows), metrics)
+            if self._memoise:
+                self._measures = (metrics['achieved'], metrics['curve'])
+                self._rows = self._get_matrix(rows)
+                self._count = len(rows)
+        elif self._memoise:
+            self._measures = (None, [])
+            self._rows = self._get_matrix([])
+            self._count = 0
+
+    def _measure(self, iterator: Iterator[tuple[int, ...]],
+                 metrics: dict[str, Any]) \
+            -> Generator[tuple[int, ...], None, None]:
+        # Yield the rows of value positions, measuring the coverage achieved
+        # into the metrics, until the target or limit is reached. Generation
+        # stops with the iteration, which is then complete.
+        if self._target is None and self._limit is None and \
+                not self._order and not self._schedule:
+            yield from iterator
+            return
+        generator = self._generator.copy()
+        option, _ = self.get_option(generator)
+        generator.initialise((), option)
+        sub_combinations = generator.get_sub_combinations()
+        total = sum(s.uncovered for s in sub_combinations)
+        # Indexes constrained or executed are counted in advance, so that
+        # only coverable indexes are measured. Features are mapped to the
+        # positions of their values.
+        tally = Tally(generator.dimensions, generator.coverage)
+        numbers = {id(d): n for n, d in enumerate(generator.dimensions)}
+        tables = {id(d): [list(d.values).index(f.value) for f in d.features]
+                  for d in generator.dimensions}
+        for sub_combination in sub_combinations:
+            for index in range(len(sub_combination)):
+                if sub_combination[index]:
+                    row = [None] * len(numbers)
+                    value = index
+                    for dimension in sub_combination.dimensions:
+                        value, feature = divmod(value, len(dimension))
+                        row[numbers[id(dimension)]] = \
+                            tables[id(dimension)][feature]
+                    tally.add(row)
+        positions = [n for n, d in enumerate(self._dimensions)
+                     if len(d) != 1]
+        covered = 0
+        metrics['achieved'] = 1.0 if total == 0 else 0.0
+        for count, row in enumerate(iterator if self._limit != 0 else (),
+                                    1):
+            row_ = [row[p] for p in positions]
+            covered += sum(1 for i in tally.indexes(row_)
+                           if not tally.counts[i])
+            tally.add(row_)
+            metrics['achieved'] = 1.0 if total == 0 else covered / total
+            metrics['curve'].append(metrics['achieved'])
+            yield row
+            if count == self._limit or self._target is not None and \
+                    covered >= self._target * total:
+                break
+        self._get_checkpoint().remove()
+
+    @classmethod
+    def _get_matrix(cls, rows: list[Collection[int]]) -> array:
+        # Return the rows of value indexes as a flat array of the smallest
+        # item size.
+        maximum = max((max(r, default=0) for r in rows), default=0)
+        itemsize = next(s for s in sorted(Cache.TYPECODES)
+                        if maximum < 256 ** s)
+        return array(Cache.TYPECODES[itemsize], [i for r in rows for i in r])
+
+    def _get_checkpoint(self) -> Checkpoint:
+        # Return the checkpoint of a run.
+        return Checkpoint(self._checkpoint, self.key)
+
+    def _iterate(self, state: Optional[tuple[int, list]] = None) \
+            -> Generator[tuple[int, ...], None, None]:
+        # Iterate through a copy of the generator, applying any
+        # post-generation stages, and yield the value positions. The copy
+        # holds the state of the run, so the dimensions and constraints are
+        # not modified and runs may be concurrent. A checkpoint state
+        # replays the journal and keeps the count of rows consumed until it
+        # is passed, or for an indexed generator starts at the count.
+        generator = self._generator.copy()
+        option, iterator_seed = self.get_option(generator)
+        start, journal = (0, []) if state is None else state
+        checkpoint = self._get_checkpoint()
+        if self._checkpoint is not None:
+            generator.journal = journal
+        if self.indexed:
+            # Rows are resolved by rank so they match row and shard.
+            count = generator.index(option)
+            tables = self._get_tables(generator)
+            for rank in range(start, count):
+                yield self._get_positions(generator, tables,
+                                          generator.unrank(rank))
+                checkpoint.save(rank + 1, generator.journal)
+            checkpoint.remove()
+            return
+        iterator = generator.iterate(option, iterator_seed)
+        if self._reduce or self._optimise or self._order:
+            # Rows are taken from the dimensions, as by _resolve, as not
+            # every generator yields combinations in dimension order.
+            rows = []
+            for _ in iterator:
+                rows.append([d.feature_index for d in generator.dimensions])
+                checkpoint.save(start, generator.journal)
+            if self._reduce:
+                rows = Reducer(generator).reduce(rows)
+            if self._optimise:
+                optimiser = Optimiser(generator, self._optimise)
+                rows = optimiser.optimise(rows)
+            if self._order:
+                rows = Orderer(generator).order(rows)
+            iterator = (generator.load(r) for r in rows)
+        rows = self._resolve(generator, iterator)
+        if self._schedule:
+            rows = Scheduler(self._dimensions).schedule(list(rows))
+        for count, row in enumerate(rows, 1):
+            yield row
+            checkpoint.save(max(count, start), generator.journal)
+        checkpoint.remove()
+
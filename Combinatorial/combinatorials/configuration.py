@@ -9,13 +9,14 @@ Provide selection and configuration of generators from user specified values.
 """
 
 from collections.abc import Collection
-from typing import Optional
+from typing import Any, Optional
 from utility import check
 from utility.defaults import NONE_TYPE
 from .constraint import Constraint
 from .dimension import Dimension
 from .fillgenerator import FillGenerator
 from .generator import Generator_
+from .librarygenerator import LibraryGenerator
 from .minusonegenerator import MinusOneGenerator
 from .option import Option
 from .sequencegenerator import SequenceGenerator
@@ -68,29 +69,43 @@ class Configuration:
     def get_generator(cls, dimensions: Collection[Dimension] = (),
                       constraints: Collection[Constraint] = (),
                       coverage: int = 0,
-                      seed: Optional[int] = None) -> Generator_:
+                      seed: Optional[int] = None,
+                      executed: Collection[Collection[Any]] = ()) \
+            -> Generator_:
         """Select the best generator for the configuration.
 
         :param dimensions: Dimensions in the configuration.
         :param constraints: Constraints in the configuration.
         :param coverage: Required coverage.
         :param seed: Randomising seed.
+        :param executed: Rows already executed, as values per dimension.
         """
         assert isinstance(dimensions, Collection), check()
         assert isinstance(constraints, Collection), check()
         assert isinstance(coverage, int), check()
         assert isinstance(seed, (int, NONE_TYPE)), check()
+        assert isinstance(executed, Collection), check()
         # ----------
+        executed = [[v for v, d in zip(r, dimensions) if len(d) != 1]
+                    for r in executed]
         dimensions = [d for d in dimensions if len(d) != 1]
         coverage = cls.get_coverage(dimensions, coverage)
-        # Select from deterministic generators.
-        for generator in (Generator_, MinusOneGenerator):
+        # Select from deterministic generators. The MinusOneGenerator and
+        # LibraryGenerator cannot take account of executed rows.
+        generators = (Generator_,) if executed else \
+            (Generator_, MinusOneGenerator, LibraryGenerator)
+        for generator in generators:
             if generator.is_supported(dimensions, constraints, coverage):
-                return generator(dimensions, constraints, coverage, seed)
-        # Select best non-deterministic generator.
-        for generator in (FillGenerator, SequenceGenerator):
+                return generator(dimensions, constraints, coverage, seed,
+                                 executed)
+        # Select best non-deterministic generator. Only the SequenceGenerator
+        # generates purely from the uncovered sub-combinations.
+        generators = (SequenceGenerator,) if executed else \
+            (FillGenerator, SequenceGenerator)
+        for generator in generators:
             if generator.is_supported(dimensions, constraints, coverage):
-                return generator(dimensions, constraints, coverage, seed)
+                return generator(dimensions, constraints, coverage, seed,
+                                 executed)
         # This condition should never occur.
         raise Exception('No supporting generators found.')
 
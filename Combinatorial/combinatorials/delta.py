@@ -0,0 +1,100 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-09-23
+:Compatibility: Python 3.9
+:License:       MIT
+
+Provide delta generation between a previous and a new model.
+"""
+
+from collections.abc import Collection
+from typing import Any, Optional
+from utility import check
+from .combinatorial import Combinatorial
+from .constraint import Constraint
+from .dimension import Dimension
+
+
+class Delta(Combinatorial):
+
+    """Combinatorial that yields only the rows needed to restore coverage of
+    a new model, given the rows generated for a previous model.
+
+    Previous rows are remapped to the new model by dimension identity and
+    value, so they are independent of dimension order and of the feature
+    order set by Dimension.initialise. A previous row is retained if every
+    dimension of the new model has a value in the row that is still present
+    in the dimension, and the row is not constrained in the new model.
+    Dimensions with a single value are filled where they are new.
+    """
+
+    def __init__(self, dimensions: Collection[Dimension] = (),
+                 constraints: Collection[Constraint] = (),
+                 coverage: int = 0, seed: Optional[int] = None,
+                 previous: Collection[Dimension] = (),
+                 rows: Collection[Collection[Any]] = ()):
+        """Construct a Delta object.
+
+        :param dimensions: Dimensions in the new configuration.
+        :param constraints: Constraints in the new configuration.
+        :param coverage: Required coverage.
+        :param seed: Randomising seed.
+        :param previous: Dimensions in the previous configuration.
+        :param rows: Rows of the previous configuration, as values per
+            previous dimension.
+        """
+        assert isinstance(previous, Collection), check()
+        assert isinstance(rows, Collection), check()
+        assert next((False for r in rows
+                     if len(r) != len(previous)), True), check()
+        # ----------
+        generator = self.get_generator(dimensions, constraints, coverage,
+                                       seed).copy()
+        generator.initialise()
+        identities = [d.identity for d in previous]
+        self._retained = []
+        self._discarded = []
+        for row in rows:
+            remapped = self._remap(dimensions, identities, row)
+            if remapped is not None:
+                values = [v for v, d in zip(remapped, dimensions)
+                          if len(d) != 1]
+                for value, dimension in zip(values, generator.dimensions):
+                    dimension.feature = dimension.get_feature(value)
+            if remapped is None or generator.is_constrained():
+                self._discarded.append(tuple(row))
+            else:
+                self._retained.append(remapped)
+        super().__init__(dimensions, constraints, coverage, seed,
+                         self._retained)
+
+    @property
+    def retained(self) -> list[tuple[Any, ...]]:
+        """Previous rows still valid, as values per new dimension."""
+        return self._retained
+
+    @property
+    def discarded(self) -> list[tuple[Any, ...]]:
+        """Previous rows no longer valid, as values per previous dimension."""
+        return self._discarded
+
+    @classmethod
+    def _remap(cls, dimensions: Collection[Dimension],
+               identities: list[str],
+               row: Collection[Any]) -> Optional[tuple[Any, ...]]:
+        # Remap a previous row to the new dimensions, None if the row has no
+        # valid value for a dimension.
+        row = list(row)
+        result = []
+        for dimension in dimensions:
+            if dimension.identity in identities:
+                value = row[identities.index(dimension.identity)]
+                if dimension.get_feature(value) is None:
+                    return None
+            elif len(dimension) == 1:
+                value = dimension.features[0].value
+            else:
+                return None
+            result.append(value)
+        return tuple(result)
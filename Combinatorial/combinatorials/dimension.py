@@ -21,13 +21,25 @@ class Dimension(FeatureSet):
 
     """Dimension definition for combinatorial generation."""
 
-    def __init__(self, identity: str, values: Collection[Any]):
+    def __init__(self, identity: str, values: Collection[Any],
+                 switch: float = 0,
+                 costs: Optional[Collection[float]] = None):
         """Construct a Dimension object.
 
         :param identity: The identity of the Dimension.
         :param values: The values in the Dimension.
+        :param switch: Cost of changing the value between consecutive rows,
+            whichever values are switched between.
+        :param costs: Estimated cost of a row per value, in value order,
+            None for a cost of 1 each.
         """
+        assert isinstance(switch, (int, float)) and switch >= 0, check()
+        assert isinstance(costs, (Collection, NONE_TYPE)), check()
+        assert costs is None or len(costs) == len(values), check()
+        # ----------
         self._feature = None
+        self._switch = switch
+        self._costs = None if costs is None else tuple(costs)
         super().__init__(identity, values)
         self.initialise()
 
@@ -38,17 +50,18 @@ class Dimension(FeatureSet):
         """
         assert isinstance(random, (Random, NONE_TYPE)), check()
         # ----------
-        values = list(self._values)
+        values = list(zip(self._values, self._costs or
+                          [1] * len(self._values)))
         if random:
             random.shuffle(values)
-        self._features = [Feature(n, v) for n, v in enumerate(values)]
+        self._features = [Feature(n, v, c) for n, (v, c) in enumerate(values)]
         if len(self._features) == 1:
             self._feature = self._features[0]
 
     def get_features(self, order:
                      Union[int, Random, NONE_TYPE] = None) -> list[Feature]:
         """Return an ordered copy of the features. This can be:
-        - ordered by usage, ascending
+        - ordered by usage weighted by cost, ascending
         - randomly ordered
         - forward, starting at a fixed point
         - backwards, starting at a fixed point
@@ -61,7 +74,7 @@ class Dimension(FeatureSet):
         if not features:
             return []
         elif order is None:
-            features.sort(key=lambda f: f.count)
+            features.sort(key=lambda f: f.usage)
             return features
         elif isinstance(order, Random):
             order.shuffle(features)
@@ -71,23 +84,51 @@ class Dimension(FeatureSet):
         order = order % len(features)
         return features[order:] + features[:order]
 
+    def get_feature(self, value: Any) -> Optional[Feature]:
+        """Return the feature with the value, None if there is no such
+        feature.
+
+        :param value: Value of the feature.
+        """
+        return next((f for f in self._features if f.value == value), None)
+
     def get_value(self) -> Any:
         """Return the feature value for the dimension. If the feature is not
-        set, select the one with the lowest count and record it. This method
-        is expected to be used to fill in unfilled dimensions when iterating
-        the final result."""
+        set, select the one with the lowest usage weighted by cost and record
+        it. This method is expected to be used to fill in unfilled dimensions
+        when iterating the final result."""
+        index = self.get_index()
+        if index is None:
+            return None
+        else:
+            return self._features[index].value
+
+    def get_index(self) -> Optional[int]:
+        """Return the feature index for the dimension, as get_value, None if
+        there are no features."""
         if self._features:
             if self._feature:
-                return self._feature.value
+                return self._feature.index
             else:
-                features = list(self._features)
-                features.sort(key=lambda f: f.count)
-                feature = features[0]
+                # The first feature with the lowest weighted usage.
+                feature = min(self._features, key=lambda f: f.usage)
                 feature.count += 1
-                return feature.value
+                return feature.index
         else:
             return None
 
+    @property
+    def switch(self) -> float:
+        """Cost of changing the value between consecutive rows, whichever
+        values are switched between."""
+        return self._switch
+
+    @property
+    def costs(self) -> Optional[tuple[float, ...]]:
+        """Estimated cost of a row per value, in value order, None for a
+        cost of 1 each."""
+        return self._costs
+
     @property
     def feature(self) -> Optional[Feature]:
         """Current feature value of the dimension."""
@@ -0,0 +1,237 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-21
+:Compatibility: Python 3.9
+:License:       MIT
+
+Evaluation of the candidate solutions for a row, optionally across worker
+processes.
+"""
+
+from collections.abc import Collection
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from math import ceil, prod
+from time import perf_counter
+from typing import Any, Optional
+from utility import check
+from .dimension import Dimension
+from .feature import Feature
+from .subcombination import SubCombination
+
+
+class Evaluator:
+
+    """Select the candidate solution for a row that covers the most
+    uncovered sub-combination indexes.
+
+    Candidates are the product of the feature sets of the variable
+    dimensions. The first candidate, in product order, that leaves the fewest
+    sub-combinations covered already is selected, and of those the one of
+    least cost, the sum of the costs of its features. Where there are workers
+    and enough candidates, the product is split into contiguous index ranges
+    that are scored in worker processes from a snapshot of the coverage, and
+    the per-range results reduced to the same selection. Where the generator
+    limits the candidates per row, the product is evaluated in blocks of the
+    limit until a block has a valid candidate, and the selection is made
+    from that block. The result is therefore independent of the number of
+    workers, unless the time budget of the generator is spent during the
+    evaluation, which then takes the best valid candidate so far. Each
+    evaluation is recorded in the journal of the generator, if it has one,
+    and entries already in the journal are replayed in place of evaluation.
+
+    :var THRESHOLD: Minimum number of candidates for evaluation in workers.
+    :var RANGES: Number of index ranges per worker.
+    """
+
+    THRESHOLD: int = 65536
+    RANGES: int = 4
+
+    def __init__(self, generator: Any, workers: int = 0):
+        """Construct an Evaluator object.
+
+        :param generator: Generator_ resolving the row, used to evaluate
+            constraints.
+        :param workers: Number of worker processes, 0 to evaluate in
+            process.
+        """
+        assert isinstance(workers, int) and workers >= 0, check()
+        # ----------
+        self._generator = generator
+        self._workers = workers
+        self._executor = None
+
+    def evaluate(self, dimensions: Collection[Dimension],
+                 variable: list[Dimension],
+                 feature_sets: list[list[Feature]],
+                 sub_combinations: list[SubCombination]) \
+            -> tuple[int, tuple[Feature, ...]]:
+        """Return the number of sub-combinations covered already and the
+        selected features of the variable dimensions, which are empty if
+        there is no unconstrained candidate. The dimensions are left loaded
+        with an arbitrary candidate.
+
+        :param dimensions: Dimensions of the row.
+        :param variable: Dimensions to resolve.
+        :param feature_sets: Ordered candidate features per variable
+            dimension.
+        :param sub_combinations: Sub-combinations to score against.
+        """
+        entry = self._generator.replay()
+        if entry is not None:
+            count, indexes = entry
+            for index, dimension in zip(indexes, variable):
+                dimension.feature_index = index
+            return count, tuple(d.feature for d in variable) if indexes \
+                else ()
+        count, best = self._evaluate(dimensions, variable, feature_sets,
+                                     sub_combinations)
+        self._generator.record(count, [f.index for f in best])
+        return count, best
+
+    def close(self):
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'Evaluator':
+        # Enter the context.
+        return self
+
+    def __exit__(self, *args: Any):
+        # Exit the context, shutting down the worker processes.
+        self.close()
+
+    def _evaluate(self, dimensions: Collection[Dimension],
+                  variable: list[Dimension],
+                  feature_sets: list[list[Feature]],
+                  sub_combinations: list[SubCombination]) \
+            -> tuple[int, tuple[Feature, ...]]:
+        # Evaluate the candidates in process or in the workers.
+        total = prod(len(f) for f in feature_sets)
+        limit, deadline = self._generator.get_limit()
+        limit = limit or total
+        if self._workers and min(limit, total) >= self.THRESHOLD:
+            return self._evaluate_ranges(dimensions, variable, feature_sets,
+                                         sub_combinations, limit, deadline)
+        best = ()
+        count = len(sub_combinations)
+        cheapest = None
+        floor = sum(min((f.cost for f in s), default=0)
+                    for s in feature_sets)
+        for number, solution in enumerate(product(*feature_sets)):
+            if best and (number % limit == 0 or deadline is not None and
+                         perf_counter() >= deadline):
+                # Take the best of the block, or so far once out of time.
+                break
+            for feature, dimension in zip(solution, variable):
+                dimension.feature = feature
+            if not self._generator.is_constrained():
+                covered = sum(1 for s in sub_combinations if s.is_covered)
+                if covered > count:
+                    continue
+                cost = sum(f.cost for f in solution)
+                if covered < count or best and cost < cheapest:
+                    count = covered
+                    cheapest = cost
+                    best = solution
+                    if covered == 0 and cost == floor:
+                        # No candidate can be better.
+                        return 0, solution
+        return count, best
+
+    def _evaluate_ranges(self, dimensions: Collection[Dimension],
+                         variable: list[Dimension],
+                         feature_sets: list[list[Feature]],
+                         sub_combinations: list[SubCombination],
+                         limit: int, deadline: Optional[float]) \
+            -> tuple[int, tuple[Feature, ...]]:
+        # Evaluate contiguous index ranges of the candidates in the workers,
+        # a block of the limit at a time, until the deadline.
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self._workers)
+        positions = {id(d): n for n, d in enumerate(dimensions)}
+        snapshot = (
+            [d.feature_index for d in dimensions],
+            [(positions[id(d)], [f.index for f in s], [f.cost for f in s])
+             for d, s in zip(variable, feature_sets)],
+            [([positions[id(d)] for d in s.dimensions],
+              [prod(len(d) for d in s.dimensions[:n])
+               for n in range(len(s.dimensions))],
+              bytes(s.data)) for s in sub_combinations],
+            [[(positions[id(e.dimension)], {f.index for f in e.features})
+              for e in c.extents] for c in self._generator.constraints
+             if next((False for e in c.extents if e.dimension is None),
+                     True)])
+        total = prod(len(f) for f in feature_sets)
+        count, index = len(sub_combinations), None
+        for start in range(0, total, limit):
+            stop = min(start + limit, total)
+            size = ceil((stop - start) / (self._workers * self.RANGES))
+            # Workers time the remainder, as their clocks may differ.
+            remaining = None if deadline is None else \
+                deadline - perf_counter()
+            futures = [self._executor.submit(self._score, snapshot, n,
+                                             min(n + size, stop), remaining)
+                       for n in range(start, stop, size)]
+            count, _, index = min((r for r in (f.result() for f in futures)
+                                   if r[2] is not None),
+                                  default=(count, None, None))
+            if index is not None:
+                break
+        if index is None:
+            return count, ()
+        solution = []
+        for feature_set in reversed(feature_sets):
+            index, position = divmod(index, len(feature_set))
+            solution.append(feature_set[position])
+        return count, tuple(reversed(solution))
+
+    @classmethod
+    def _score(cls, snapshot: tuple, start: int, stop: int,
+               remaining: Optional[float] = None) \
+            -> tuple[int, Optional[float], Optional[int]]:
+        # Score an index range of the candidates in a worker, until the
+        # remaining seconds have passed once there is a valid candidate.
+        # Return the fewest sub-combinations covered already, the least cost
+        # and the first index to achieve them, None if every candidate is
+        # constrained.
+        deadline = None if remaining is None else perf_counter() + remaining
+        indexes, variable, sub_combinations, constraints = snapshot
+        count = len(sub_combinations)
+        cheapest = None
+        best = None
+        costs = [0] * len(variable)
+        floor = sum(min(c, default=0) for _, _, c in variable)
+        for index in range(start, stop):
+            if best is not None and deadline is not None and \
+                    perf_counter() >= deadline:
+                break
+            value = index
+            for number in range(len(variable) - 1, -1, -1):
+                position, features, feature_costs = variable[number]
+                value, feature = divmod(value, len(features))
+                indexes[position] = features[feature]
+                costs[number] = feature_costs[feature]
+            if next((True for c in constraints
+                     if next((False for p, f in c
+                              if indexes[p] not in f), True)), False):
+                continue
+            covered = 0
+            for positions, shifts, data in sub_combinations:
+                offset = sum(indexes[p] * s for p, s in zip(positions,
+                                                            shifts))
+                if data[offset >> 3] >> (offset & 7) & 1:
+                    covered += 1
+            if covered > count:
+                continue
+            cost = sum(costs)
+            if covered < count or best is not None and cost < cheapest:
+                count = covered
+                cheapest = cost
+                best = index
+                if covered == 0 and cost == floor:
+                    return 0, cost, index
+        return count, cheapest, best
@@ -16,16 +16,19 @@ class Feature:
 
     """Feature tracking definition for a combinatorial Dimension."""
 
-    def __init__(self, index: int, value: Any):
+    def __init__(self, index: int, value: Any, cost: float = 1):
         """Construct a Feature object.
 
         :param index: The index of the feature.
         :param value: The value of the feature.
+        :param cost: The estimated cost of a row with the feature.
         """
         assert isinstance(index, int), check()
+        assert isinstance(cost, (int, float)) and cost > 0, check()
         # ----------
         self._index = index
         self._value = value
+        self._cost = cost
         self._count = 0
 
     @property
@@ -49,6 +52,16 @@ class Feature:
         # ----------
         self._count = value
 
+    @property
+    def cost(self) -> float:
+        """The estimated cost of a row with the feature."""
+        return self._cost
+
+    @property
+    def usage(self) -> float:
+        """The usage count of the feature weighted by its cost."""
+        return self._count * self._cost
+
     def __str__(self) -> str:
         # Example: 'value (0)'
         return f'{self._value} ({self._index})'
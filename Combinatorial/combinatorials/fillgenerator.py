@@ -10,12 +10,12 @@ greater than the coverage.
 """
 
 from collections.abc import Collection, Generator
-from itertools import product
 from random import Random
 from typing import Optional
 from utility import check
 from .constraint import Constraint
 from .dimension import Dimension
+from .evaluator import Evaluator
 from .feature import Feature
 from .generator import Generator_
 from .minusonegenerator import MinusOneGenerator
@@ -28,9 +28,11 @@ class FillGenerator(Generator_):
     covered by the Generator_.
 
     :var OPTION: Default option for this generator.
+    :var INDEXED: True if the rows can be accessed by rank, False otherwise.
     """
 
     OPTION: Option = Option.FEATURE_RANDOM | Option.RETIRE_RANDOM
+    INDEXED: bool = False
 
     @classmethod
     def is_supported(cls, dimensions: Collection[Dimension],
@@ -66,38 +68,27 @@ class FillGenerator(Generator_):
         # Select feature order.
         random = Random(iterator_seed)
         order = random if option & Option.FEATURE_RANDOM else None
-        for features in minus.iterate(option, iterator_seed):
-            # Select feature order.
-            best = []
-            count = len(sub_combinations)
-            feature_sets = [d.get_features(order) for d in variable]
-            if features[-1] is not None:
-                feature_sets[0] = [features[-1]]
-            for solution in product(*feature_sets):
-                for feature, dimension in zip(solution, variable):
-                    dimension.feature = feature
-                if not self.is_constrained():
-                    covered = sum(1 for s in sub_combinations if s.is_covered)
-                    if covered == 0:
-                        count = 0
-                        best = solution
-                        break
-                    elif covered < count:
-                        count = covered
-                        best = solution
-            if best:
-                if count > 0:
+        with Evaluator(self, self._workers) as evaluator:
+            for features in minus.iterate(option, iterator_seed):
+                # Select feature order.
+                feature_sets = [d.get_features(order) for d in variable]
+                if features[-1] is not None:
+                    feature_sets[0] = [features[-1]]
+                _, best = evaluator.evaluate(dimensions, variable,
+                                             feature_sets, sub_combinations)
+                if best:
                     # Reload best.
                     for feature, dimension in zip(best, variable):
                         dimension.feature = feature
-                # Cover the solution and yield.
-                for sub_combination in sub_combinations:
-                    sub_combination.cover()
-                for dimension in dimensions:
-                    dimension.feature.count += 1
-                yield [d.feature for d in self._dimensions]
-                # Remove complete sub_combinations.
-                sub_combinations = [s for s in sub_combinations if False in s]
+                    # Cover the solution and yield.
+                    for sub_combination in sub_combinations:
+                        sub_combination.cover()
+                    for dimension in dimensions:
+                        dimension.feature.count += 1
+                    yield [d.feature for d in self._dimensions]
+                    # Remove complete sub_combinations.
+                    sub_combinations = [s for s in sub_combinations
+                                        if s.uncovered]
 
         # Use the complete method to fill the remaining sub_combinations.
         yield from self._fill_to_completion(dimensions, sub_combinations,
@@ -13,13 +13,17 @@ from collections.abc import Collection, Generator
 from itertools import combinations, product
 from math import prod
 from random import Random
+from time import perf_counter
 from typing import Any, Optional
 from utility import check
 from utility.defaults import NONE_TYPE
 from .constraint import Constraint
 from .dimension import Dimension
+from .evaluator import Evaluator
+from .extent import Extent
 from .feature import Feature
 from .option import Option
+from .retirementqueue import RetirementQueue
 from .subcombination import SubCombination
 
 
@@ -29,9 +33,14 @@ class Generator_:
     all generations that can be satisfied by the cartesian product.
 
     :var OPTION: Default option for this generator.
+    :var INDEXED: True if the rows can be accessed by rank, False otherwise.
+    :var FALLBACK: Maximum number of candidate solutions evaluated per row
+        once the budget is spent.
     """
 
     OPTION: Option = Option.NONE
+    INDEXED: bool = True
+    FALLBACK: int = 64
 
     @classmethod
     def is_supported(cls, dimensions: Collection[Dimension],
@@ -54,13 +63,16 @@ class Generator_:
 
     def __init__(self, dimensions: Collection[Dimension],
                  constraints: Collection[Constraint],
-                 coverage: int, seed: Optional[int] = None):
+                 coverage: int, seed: Optional[int] = None,
+                 executed: Collection[Collection[Any]] = ()):
         """Construct a Generator_ object.
 
         :param dimensions: Dimensions in the configuration.
         :param constraints: Constraints in the configuration.
         :param coverage: Required coverage.
         :param seed: Randomising seed.
+        :param executed: Rows already executed, as values per dimension.
+            Their sub-combinations are treated as covered.
         """
         assert isinstance(dimensions, Collection), check()
         # The generators do not support dimensions with less than 2 features.
@@ -76,11 +88,22 @@ class Generator_:
             assert 0 < coverage <= len(dimensions), check()
         assert isinstance(seed, (int, NONE_TYPE)), check()
         assert self.is_supported(dimensions, constraints, coverage), check()
+        assert isinstance(executed, Collection), check()
+        assert next((False for r in executed
+                     if len(r) != len(dimensions)), True), check()
         # ----------
         self._dimensions = dimensions
         self._constraints = constraints
         self._coverage = coverage
         self._seed = seed
+        self._executed = [tuple(r) for r in executed]
+        self._workers = 0
+        self._candidates = 0
+        self._budget = None
+        self._deadline = None
+        self._ranking = None
+        self._journal = None
+        self._replayed = 0
 
     def initialise(self, dimensions: Collection[Dimension] = (),
                    option: Option = OPTION) -> list[Dimension]:
@@ -91,6 +114,9 @@ class Generator_:
         :param option: Option for this iteration.
         """
         random = None if option & Option.NO_SHUFFLE else Random(self._seed)
+        # Start the time budget.
+        self._deadline = None if self._budget is None else \
+            perf_counter() + self._budget
         # Initialise the dimensions.
         for dimension in self._dimensions:
             dimension.initialise(random)
@@ -105,8 +131,74 @@ class Generator_:
             random.shuffle(dimensions)
         return dimensions
 
+    def copy(self) -> 'Generator_':
+        """Return a Generator_ of the same class and configuration over
+        copies of the dimensions and constraints. The copy holds the state of
+        a single run, the current features, feature counts and constraint
+        bindings, so that runs neither modify nor share the model
+        definitions."""
+        dimensions = [Dimension(d.identity, d.values, d.switch, d.costs)
+                      for d in self._dimensions]
+        constraints = [Constraint([Extent(e.identity, e.values)
+                                   for e in c.extents])
+                       for c in self._constraints]
+        generator = self.__class__(dimensions, constraints, self._coverage,
+                                   self._seed, self._executed)
+        generator.workers = self._workers
+        generator.candidates = self._candidates
+        generator.budget = self._budget
+        return generator
+
+    def index(self, option: Option = OPTION) -> int:
+        """Initialise the generator for access to the rows by rank and
+        return the number of rows. Ranks follow the order of iteration. Where
+        rows are skipped as constrained or executed, the product indexes of
+        the remaining rows are counted here so that each rank is resolved
+        directly.
+
+        :param option: Option for this iteration.
+        """
+        assert self.INDEXED, check()
+        assert isinstance(option, Option), check()
+        # ----------
+        dimensions = self.initialise(self._dimensions, option)
+        positions = [next(n for n, e in enumerate(self._dimensions) if e is d)
+                     for d in dimensions]
+        ranks = None
+        if self._constraints or self._executed:
+            executed = self.get_sub_combinations() if self._executed else []
+            ranks = []
+            for rank, combination in enumerate(
+                    product(*[d.features for d in dimensions])):
+                for feature, dimension in zip(combination, dimensions):
+                    dimension.feature = feature
+                if not self.is_constrained() and \
+                        next((False for s in executed if s.is_covered), True):
+                    ranks.append(rank)
+        self._ranking = (list(zip(positions, dimensions)), ranks)
+        return prod(len(d) for d in dimensions) if ranks is None else \
+            len(ranks)
+
+    def unrank(self, rank: int) -> list[Optional[int]]:
+        """Return the feature indexes of the row at the rank, one per
+        dimension. The generator must have been indexed.
+
+        :param rank: Rank of the row.
+        """
+        assert self._ranking is not None, check()
+        assert isinstance(rank, int), check()
+        # ----------
+        dimensions, ranks = self._ranking
+        if ranks is not None:
+            rank = ranks[rank]
+        indexes = [None] * len(self._dimensions)
+        for position, dimension in reversed(dimensions):
+            rank, indexes[position] = divmod(rank, len(dimension))
+        return indexes
+
     def get_sub_combinations(self) -> list[SubCombination]:
         """Get a set of SubCombinations for the required coverage level.
+        Constrained and executed sub-combinations are covered.
 
         Initial order for the sub-combinations is based on length, high to
         low.
@@ -120,12 +212,30 @@ class Generator_:
             for sub_combination in sub_combinations:
                 for constraint in self._constraints:
                     sub_combination.apply_constraint(constraint)
+            # Pre-cover executed rows. Values no longer in a dimension leave
+            # the feature unset and cover nothing through that dimension.
+            for row in self._executed:
+                for value, dimension in zip(row, self._dimensions):
+                    dimension.feature = dimension.get_feature(value)
+                for sub_combination in sub_combinations:
+                    sub_combination.cover()
             # Sort and return.
-            sub_combinations.sort(key=lambda s: s.count(False), reverse=True)
+            sub_combinations.sort(key=lambda s: s.uncovered, reverse=True)
             return sub_combinations
         else:
             return []
 
+    def load(self, indexes: Collection[Optional[int]]):
+        """Load the feature indexes of a row into the dimensions.
+
+        :param indexes: Feature indexes, one per dimension.
+        """
+        assert isinstance(indexes, Collection), check()
+        assert len(indexes) == len(self._dimensions), check()
+        # ----------
+        for index, dimension in zip(indexes, self._dimensions):
+            dimension.feature_index = index
+
     def is_constrained(self) -> bool:
         """True if the current combination is constrained, False otherwise."""
         return next((True for c in self._constraints if c.evaluate()), False)
@@ -142,11 +252,13 @@ class Generator_:
         assert isinstance(iterator_seed, int), check()
         # ----------
         dimensions = self.initialise(self._dimensions, option)
+        executed = self.get_sub_combinations() if self._executed else []
         # Iterate through the combinations.
         for combination in product(*[d.features for d in dimensions]):
             for feature, dimension in zip(combination, dimensions):
                 dimension.feature = feature
-            if not self.is_constrained():
+            if not self.is_constrained() and \
+                    next((False for s in executed if s.is_covered), True):
                 for feature in combination:
                     feature.count += 1
                 yield [d.feature for d in dimensions]
@@ -171,6 +283,106 @@ class Generator_:
         """Randomising seed."""
         return self._seed
 
+    @property
+    def executed(self) -> list[tuple[Any, ...]]:
+        """Rows already executed, as values per dimension."""
+        return self._executed
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes for the evaluation of rows with many
+        candidate solutions, 0 to evaluate in process. The rows generated are
+        independent of the number of workers."""
+        return self._workers
+
+    @workers.setter
+    def workers(self, value: int):
+        assert isinstance(value, int), check()
+        assert value >= 0, check()
+        # ----------
+        self._workers = value
+
+    @property
+    def candidates(self) -> int:
+        """Number of candidate solutions evaluated per row before the best
+        so far is taken, 0 for no limit. Where no candidate is valid the
+        limit is extended by the same number again. The rows generated are
+        independent of the number of workers."""
+        return self._candidates
+
+    @candidates.setter
+    def candidates(self, value: int):
+        assert isinstance(value, int), check()
+        assert value >= 0, check()
+        # ----------
+        self._candidates = value
+
+    @property
+    def budget(self) -> Optional[float]:
+        """Time budget of a run in seconds, None for no budget. A row
+        being evaluated as it is spent takes the best candidate solution so
+        far, and each row after evaluates at most FALLBACK candidates, so
+        generation completes quickly at the cost of more rows. Rows
+        generated with a budget depend on timing."""
+        return self._budget
+
+    @budget.setter
+    def budget(self, value: Optional[float]):
+        assert isinstance(value, (int, float, NONE_TYPE)), check()
+        assert value is None or value >= 0, check()
+        # ----------
+        self._budget = value
+
+    def get_limit(self) -> tuple[int, Optional[float]]:
+        """Return the number of candidate solutions to evaluate for the
+        next row, 0 for no limit, and the perf_counter time at which to take
+        the best candidate so far, None for no time."""
+        if self._deadline is None:
+            return self._candidates, None
+        elif perf_counter() >= self._deadline:
+            return min(self._candidates or self.FALLBACK, self.FALLBACK), None
+        else:
+            return self._candidates, self._deadline
+
+    @property
+    def journal(self) -> Optional[list[tuple[int, list[int]]]]:
+        """Evaluations of the run as the number of sub-combinations covered
+        already and the selected feature indexes, None for no journal.
+        Entries present when the journal is set are replayed in place of
+        evaluation, so a run resumed from its journal makes the same
+        selections without scoring the candidates again."""
+        return self._journal
+
+    @journal.setter
+    def journal(self, value: Optional[list[tuple[int, list[int]]]]):
+        assert isinstance(value, (list, NONE_TYPE)), check()
+        # ----------
+        self._journal = value
+        self._replayed = 0
+
+    def replay(self) -> Optional[tuple[int, list[int]]]:
+        """Return the next evaluation to replay from the journal, None once
+        the journal is exhausted."""
+        if self._journal is not None and \
+                self._replayed < len(self._journal):
+            self._replayed += 1
+            return self._journal[self._replayed - 1]
+        else:
+            return None
+
+    def record(self, count: int, indexes: list[int]):
+        """Append an evaluation to the journal, if there is one.
+
+        :param count: Number of sub-combinations covered already.
+        :param indexes: Selected feature indexes, empty for no selection.
+        """
+        assert isinstance(count, int), check()
+        assert isinstance(indexes, list), check()
+        # ----------
+        if self._journal is not None:
+            self._journal.append((count, indexes))
+            self._replayed += 1
+
     @property
     def minimum(self) -> int:
         """Minimum length possible for unconstrained generation."""
@@ -211,46 +423,38 @@ class Generator_:
         # Select feature order.
         random = Random(iterator_seed)
         order = random if option & Option.FEATURE_RANDOM else None
+        queue = RetirementQueue(sub_combinations, option, random)
+        sub_combinations = queue.sub_combinations
 
-        while sub_combinations:
-            # Select the next sub_conbination to retire.
-            retire = sub_combinations[0]
-            if option & Option.RETIRE_RANDOM:
-                retire.sub_combination_index = retire.random_index(False,
-                                                                   random)
-            else:
-                retire.sub_combination_index = retire.index(False)
-            variable = [d for d in dimensions if d not in retire.dimensions]
-            # Resolve a solution.
-            best = []
-            count = len(sub_combinations)
-            for solution in product(*[d.get_features(order)
-                                      for d in variable]):
-                for feature, dimension in zip(solution, variable):
-                    dimension.feature = feature
-                if not self.is_constrained():
-                    covered = sum(1 for s in sub_combinations if s.is_covered)
-                    if covered == 0:
-                        count = 0
-                        best = solution
-                        break
-                    elif covered < count:
-                        count = covered
-                        best = solution
-            if best:
-                if count > 0:
+        with Evaluator(self, self._workers) as evaluator:
+            while sub_combinations:
+                # Select the next sub_conbination to retire.
+                retire = queue.select()
+                if option & Option.RETIRE_RANDOM:
+                    retire.sub_combination_index = retire.random_index(
+                        False, random)
+                else:
+                    retire.sub_combination_index = retire.index(False)
+                variable = [d for d in dimensions
+                            if d not in retire.dimensions]
+                # Resolve a solution.
+                _, best = evaluator.evaluate(
+                    dimensions, variable,
+                    [d.get_features(order) for d in variable],
+                    sub_combinations)
+                if best:
                     # Reload best.
                     for feature, dimension in zip(best, variable):
                         dimension.feature = feature
-                # Cover the solution and yield.
-                for sub_combination in sub_combinations:
-                    sub_combination.cover()
-                for dimension in dimensions:
-                    dimension.feature.count += 1
-                yield [d.feature for d in self._dimensions]
-            else:
-                # In this case there is no unconstrained solution for the
-                # retiring sub-combination.
-                retire.cover()
-            # Remove complete sub_combinations.
-            sub_combinations = [s for s in sub_combinations if False in s]
+                    # Cover the solution and yield.
+                    complete = queue.cover()
+                    for dimension in dimensions:
+                        dimension.feature.count += 1
+                    yield [d.feature for d in self._dimensions]
+                else:
+                    # In this case there is no unconstrained solution for the
+                    # retiring sub-combination.
+                    complete = queue.retire()
+                # Remove complete sub_combinations.
+                if complete:
+                    sub_combinations = queue.sub_combinations
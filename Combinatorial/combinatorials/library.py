@@ -0,0 +1,247 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-07
+:Compatibility: Python 3.9
+:License:       MIT
+
+Library of best-known covering arrays with structural lookup.
+"""
+
+from collections.abc import Callable, Collection
+from itertools import combinations, product
+from math import ceil, comb, prod
+from typing import Optional
+from utility import check
+from .tally import Tally
+
+
+class Library:
+
+    """Library of best-known covering arrays indexed by dimension sizes and
+    coverage.
+
+    Arrays are constructed on first use and validated before they are
+    stored:
+    - Reed-Solomon orthogonal arrays, q^t rows for q + 1 dimensions of q
+      features, where q is a prime power
+    - Kleitman-Spencer binary arrays for coverage 2
+    - The 12 row Plackett-Burman array, which has coverage 3
+    A stored array serves any configuration it can be reduced to by dropping
+    dimensions and collapsing features. Reductions are found once per shape,
+    the sizes in descending order and the coverage, and their columns
+    arranged for the order of the sizes requested.
+
+    :var TOLERANCE: Maximum ratio of rows to the minimum for a library array
+        to be used.
+    :var FIELDS: Prime powers with their modulus polynomial, 0 for primes.
+    """
+
+    TOLERANCE: float = 1.5
+    FIELDS: dict[int, int] = {3: 0, 4: 0b111, 5: 0, 7: 0, 8: 0b1011}
+
+    _arrays: Optional[list[tuple[tuple[int, ...], int,
+                                 list[tuple[int, ...]]]]] = None
+    _results: dict[tuple[tuple[int, ...], int],
+                   Optional[list[tuple[int, ...]]]] = {}
+
+    @classmethod
+    def get(cls, sizes: Collection[int],
+            coverage: int) -> Optional[list[tuple[int, ...]]]:
+        """Return the rows of feature indexes for the sizes and coverage,
+        None if the library has no suitable array.
+
+        :param sizes: Number of features of each dimension.
+        :param coverage: Required coverage.
+        """
+        assert isinstance(sizes, Collection), check()
+        assert isinstance(coverage, int), check()
+        # ----------
+        sizes = tuple(sizes)
+        key = (tuple(sorted(sizes, reverse=True)), coverage)
+        if key not in cls._results:
+            cls._results[key] = cls._get(key[0], coverage)
+        rows = cls._results[key]
+        if rows is None:
+            return None
+        # Arrange the columns of the shape in the order of the sizes.
+        order = sorted(range(len(sizes)), key=lambda n: sizes[n],
+                       reverse=True)
+        columns = [order.index(n) for n in range(len(sizes))]
+        return [tuple(r[c] for c in columns) for r in rows]
+
+    @classmethod
+    def get_bound(cls, sizes: Collection[int], coverage: int) -> int:
+        """Return a lower bound on the rows of any covering array for the
+        sizes and coverage. The rows of each value of the largest dimension
+        cover the remaining dimensions to one less coverage, and an array
+        of coverage 2 collapses to a binary array, which needs the rows of
+        the Kleitman-Spencer construction.
+
+        :param sizes: Number of features of each dimension.
+        :param coverage: Required coverage.
+        """
+        assert isinstance(sizes, Collection), check()
+        assert isinstance(coverage, int), check()
+        # ----------
+        sizes = sorted(sizes, reverse=True)
+        if coverage < 2 or len(sizes) <= coverage:
+            return prod(sizes[:coverage])
+        elif coverage == 2:
+            count = 2
+            while comb(count - 1, ceil(count / 2)) < len(sizes):
+                count += 1
+            return max(sizes[0] * sizes[1], count)
+        else:
+            return sizes[0] * cls.get_bound(sizes[1:], coverage - 1)
+
+    @classmethod
+    def arrays(cls) -> list[tuple[tuple[int, ...], int,
+                                  list[tuple[int, ...]]]]:
+        """Return the validated arrays in the library as sizes, coverage and
+        rows."""
+        if cls._arrays is None:
+            cls._arrays = []
+            for construct, arguments in cls._get_constructions():
+                sizes, coverage, rows = construct(*arguments)
+                if cls._is_valid(sizes, coverage, rows):
+                    cls._arrays.append((sizes, coverage, rows))
+        return cls._arrays
+
+    @classmethod
+    def _get(cls, sizes: tuple[int, ...],
+             coverage: int) -> Optional[list[tuple[int, ...]]]:
+        # Find the smallest reduction of a library array.
+        if not sizes or coverage < 2 or coverage >= len(sizes) or \
+                min(sizes) < 2:
+            return None
+        order = sorted(range(len(sizes)), key=lambda n: sizes[n],
+                       reverse=True)
+        best = None
+        for sizes_, coverage_, rows in cls.arrays():
+            if coverage_ == coverage and len(sizes_) >= len(sizes) and \
+                    (best is None or len(rows) < len(best)):
+                columns = sorted(range(len(sizes_)), key=lambda n: sizes_[n],
+                                 reverse=True)
+                if next((False for n, c in zip(order, columns)
+                         if sizes[n] > sizes_[c]), True):
+                    mapping = dict(zip(order, columns))
+                    reduced = cls._reduce(sizes, coverage, rows, [
+                        mapping[n] for n in range(len(sizes))])
+                    if best is None or len(reduced) < len(best):
+                        best = reduced
+        minimum = prod(sorted(sizes, reverse=True)[:coverage])
+        if best is None or len(best) > minimum * cls.TOLERANCE:
+            return None
+        else:
+            return best
+
+    @classmethod
+    def _reduce(cls, sizes: tuple[int, ...], coverage: int,
+                rows: list[tuple[int, ...]],
+                columns: list[int]) -> list[tuple[int, ...]]:
+        # Drop unused columns and collapse features beyond the size. Every
+        # combination of retained features is unchanged so coverage holds.
+        result = []
+        for row in rows:
+            row = tuple(row[c] % s for c, s in zip(columns, sizes))
+            if row not in result:
+                result.append(row)
+        # Remove rows made redundant by collapsing.
+        tally = Tally([range(s) for s in sizes], coverage, result)
+        for row in list(reversed(result)):
+            if tally.minimum(row) > 1:
+                tally.remove(row)
+                result.remove(row)
+        return result
+
+    @classmethod
+    def _is_valid(cls, sizes: tuple[int, ...], coverage: int,
+                  rows: list[tuple[int, ...]]) -> bool:
+        # True if the rows cover every index of every sub-combination.
+        if next((True for r in rows for i, s in zip(r, sizes)
+                 if not 0 <= i < s), False):
+            return False
+        tally = Tally([range(s) for s in sizes], coverage, rows)
+        return 0 not in tally.counts
+
+    @classmethod
+    def _get_constructions(cls) -> list[tuple[Callable, tuple]]:
+        # Return the constructions and their arguments.
+        constructions = []
+        for field in cls.FIELDS:
+            for coverage in (2, 3):
+                constructions.append((cls._reed_solomon, (field, coverage)))
+        for count in range(5, 9):
+            constructions.append((cls._kleitman_spencer, (count,)))
+        constructions.append((cls._plackett_burman, ()))
+        return constructions
+
+    @classmethod
+    def _reed_solomon(cls, field: int, coverage: int) \
+            -> tuple[tuple[int, ...], int, list[tuple[int, ...]]]:
+        # Each row is a polynomial of degree less than the coverage over
+        # GF(field), evaluated at every element, with the leading coefficient
+        # as the final dimension.
+        multiply = cls._get_multiply(field)
+        add = cls._get_add(field)
+        rows = []
+        for coefficients in product(range(field), repeat=coverage):
+            row = []
+            for point in range(field):
+                value = 0
+                for coefficient in coefficients:
+                    value = add(multiply(value, point), coefficient)
+                row.append(value)
+            row.append(coefficients[0])
+            rows.append(tuple(row))
+        return (field,) * (field + 1), coverage, rows
+
+    @classmethod
+    def _kleitman_spencer(cls, count: int) \
+            -> tuple[tuple[int, ...], int, list[tuple[int, ...]]]:
+        # Each dimension is a column with a leading 0 and a distinct choice
+        # of half the remaining rows set to 1.
+        columns = [[0] + [int(n in c) for n in range(count - 1)]
+                   for c in combinations(range(count - 1), ceil(count / 2))]
+        rows = [tuple(c[n] for c in columns) for n in range(count)]
+        return (2,) * len(columns), 2, rows
+
+    @classmethod
+    def _plackett_burman(cls) \
+            -> tuple[tuple[int, ...], int, list[tuple[int, ...]]]:
+        # Cyclic shifts of the generating row plus a row of zeroes. Every
+        # three columns project onto a full factorial.
+        generator = (1, 1, 0, 1, 1, 1, 0, 0, 0, 1, 0)
+        rows = [generator[n:] + generator[:n] for n in range(11)]
+        rows.append((0,) * 11)
+        return (2,) * 11, 3, rows
+
+    @classmethod
+    def _get_add(cls, field: int) -> Callable[[int, int], int]:
+        # Return the addition for the field.
+        if cls.FIELDS[field]:
+            return lambda a, b: a ^ b
+        else:
+            return lambda a, b: (a + b) % field
+
+    @classmethod
+    def _get_multiply(cls, field: int) -> Callable[[int, int], int]:
+        # Return the multiplication for the field.
+        modulus = cls.FIELDS[field]
+        if not modulus:
+            return lambda a, b: a * b % field
+
+        def multiply(a: int, b: int) -> int:
+            # Carry-less multiplication reduced by the modulus polynomial.
+            result = 0
+            while b:
+                if b & 1:
+                    result ^= a
+                b >>= 1
+                a <<= 1
+                if a & field:
+                    a ^= modulus
+            return result
+
+        return multiply
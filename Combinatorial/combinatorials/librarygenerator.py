@@ -0,0 +1,98 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-07
+:Compatibility: Python 3.9
+:License:       MIT
+
+Combinatorial generator for configurations served by the Library of
+best-known covering arrays.
+"""
+
+from collections.abc import Collection, Generator
+from typing import Optional
+from utility import check
+from .constraint import Constraint
+from .dimension import Dimension
+from .feature import Feature
+from .generator import Generator_
+from .library import Library
+from .option import Option
+
+
+class LibraryGenerator(Generator_):
+
+    """High performance generator that yields a best-known covering array
+    from the Library. The conditions under which this succeeds are:
+    - The generator is unconstrained
+    - The Library holds an array that reduces to the configuration
+    - The array is no longer than the lower bound of the Library, so no
+      other generator can yield fewer rows
+
+    :var OPTION: Default option for this generator.
+    """
+
+    OPTION: Option = Option.NONE
+
+    @classmethod
+    def is_supported(cls, dimensions: Collection[Dimension],
+                     constraints: Collection[Constraint],
+                     coverage: int) -> bool:
+        """True if the generator supports this configuration, False otherwise.
+
+        :param dimensions: Dimensions in the configuration.
+        :param constraints: Constraints in the configuration.
+        :param coverage: Required coverage.
+        """
+        if constraints:
+            return False
+        else:
+            sizes = [len(d) for d in dimensions]
+            rows = Library.get(sizes, coverage)
+            return rows is not None and \
+                len(rows) <= Library.get_bound(sizes, coverage)
+
+    def iterate(self, option: Option = OPTION, iterator_seed: int = 0) \
+            -> Generator[Collection[Optional[Feature]], None, None]:
+        """Iterate through a set of combinations that satisfy this
+        generation.
+
+        :param option: Option for this iteration.
+        :param iterator_seed: Randomising seed for iteration.
+        """
+        assert isinstance(option, Option), check()
+        assert isinstance(iterator_seed, int), check()
+        # ----------
+        self.initialise((), option)
+        rows = Library.get([len(d) for d in self._dimensions],
+                           self._coverage)
+        for row in rows:
+            self.load(row)
+            for dimension in self._dimensions:
+                dimension.feature.count += 1
+            yield [d.feature for d in self._dimensions]
+
+    def index(self, option: Option = OPTION) -> int:
+        """Initialise the generator for access to the rows by rank and
+        return the number of rows. Ranks follow the order of iteration.
+
+        :param option: Option for this iteration.
+        """
+        assert isinstance(option, Option), check()
+        # ----------
+        self.initialise((), option)
+        self._ranking = Library.get([len(d) for d in self._dimensions],
+                                    self._coverage)
+        return len(self._ranking)
+
+    def unrank(self, rank: int) -> list[Optional[int]]:
+        """Return the feature indexes of the row at the rank, one per
+        dimension. The generator must have been indexed.
+
+        :param rank: Rank of the row.
+        """
+        assert self._ranking is not None, check()
+        assert isinstance(rank, int), check()
+        # ----------
+        return list(self._ranking[rank])
+
@@ -11,6 +11,7 @@ one greater than the coverage and there are no constraints.
 
 from collections.abc import Collection, Generator
 from itertools import product
+from math import prod
 from typing import Optional
 from utility import check
 from .constraint import Constraint
@@ -78,3 +79,42 @@ class MinusOneGenerator(Generator_):
             else:
                 final.feature = None
             yield [d.feature for d in self._dimensions]
+
+    def index(self, option: Option = OPTION) -> int:
+        """Initialise the generator for access to the rows by rank and
+        return the number of rows. Ranks follow the order of iteration.
+
+        :param option: Option for this iteration.
+        """
+        assert isinstance(option, Option), check()
+        # ----------
+        dimensions = list(self._dimensions)
+        dimensions.sort(key=lambda d: len(d), reverse=True)
+        fixed = self.initialise(dimensions[:self._coverage], option)
+        final = dimensions[self._coverage]
+        cadence = len(dimensions[self._coverage - 1])
+        positions = [next(n for n, e in enumerate(self._dimensions) if e is d)
+                     for d in fixed + [final]]
+        self._ranking = (positions, fixed, final, cadence)
+        return prod(len(d) for d in fixed)
+
+    def unrank(self, rank: int) -> list[Optional[int]]:
+        """Return the feature indexes of the row at the rank, one per
+        dimension. The generator must have been indexed. Where iteration
+        leaves the final dimension unset, the feature is selected by rank so
+        that the row is independent of the rows before it.
+
+        :param rank: Rank of the row.
+        """
+        assert self._ranking is not None, check()
+        assert isinstance(rank, int), check()
+        # ----------
+        positions, fixed, final, cadence = self._ranking
+        indexes = [None] * len(self._dimensions)
+        value = rank
+        for position, dimension in reversed(list(zip(positions, fixed))):
+            value, indexes[position] = divmod(value, len(dimension))
+        count = sum(indexes[p] for p in positions[:-1]) % cadence
+        indexes[positions[-1]] = count if count < len(final) else \
+            rank % len(final)
+        return indexes
@@ -0,0 +1,159 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-09-16
+:Compatibility: Python 3.9
+:License:       MIT
+
+Local search optimisation of the rows yielded by a generator.
+"""
+
+from collections import deque
+from collections.abc import Collection
+from math import exp
+from random import Random
+from time import monotonic
+from typing import Optional
+from utility import check
+from utility.defaults import NONE_TYPE
+from .generator import Generator_
+from .tally import Tally
+
+
+class Optimiser:
+
+    """Shrink the rows of a Generator_ by local search.
+
+    The row contributing the least unique coverage is deleted and the
+    uncovered indexes are repaired by simulated annealing over single feature
+    moves, with recently moved features held in a tabu list. Each time
+    coverage is fully repaired the result is recorded and another row is
+    deleted. The search ends when the iteration or time budget is exhausted
+    and the last fully covering set of rows is returned.
+
+    :var TEMPERATURE: Initial annealing temperature.
+    :var COOLING: Temperature multiplier applied each iteration.
+    :var TABU: Number of recent moves that may not be reversed.
+    """
+
+    TEMPERATURE: float = 1.0
+    COOLING: float = 0.999
+    TABU: int = 8
+
+    def __init__(self, generator: Generator_, iterations: int = 10000,
+                 duration: Optional[float] = None,
+                 seed: Optional[int] = None):
+        """Construct an Optimiser object.
+
+        :param generator: Generator_ that yielded the rows. The generator must
+            have been iterated so that constraints are resolved.
+        :param iterations: Maximum number of moves.
+        :param duration: Maximum time in seconds.
+        :param seed: Randomising seed, defaulting to the generator seed.
+        """
+        assert isinstance(generator, Generator_), check()
+        assert isinstance(iterations, int), check()
+        assert isinstance(duration, (int, float, NONE_TYPE)), check()
+        assert isinstance(seed, (int, NONE_TYPE)), check()
+        # ----------
+        self._generator = generator
+        self._iterations = iterations
+        self._duration = duration
+        self._seed = generator.seed if seed is None else seed
+        self._iteration = 0
+        self._stop = None
+
+    def optimise(self, rows: Collection[Collection[Optional[int]]]) \
+            -> list[tuple[Optional[int], ...]]:
+        """Return the optimised rows.
+
+        :param rows: Feature indexes of the rows, one per dimension.
+        """
+        assert isinstance(rows, Collection), check()
+        # ----------
+        rows = [list(r) for r in rows]
+        best = [tuple(r) for r in rows]
+        tally = Tally(self._generator.dimensions, self._generator.coverage,
+                      rows)
+        required = [c > 0 for c in tally.counts]
+        random = Random(self._seed)
+        self._iteration = 0
+        self._stop = None if self._duration is None else \
+            monotonic() + self._duration
+        while len(rows) > 1 and not self._is_exhausted():
+            # Delete the row with the least unique coverage.
+            unique = [sum(1 for i in tally.indexes(r) if tally.counts[i] == 1)
+                      for r in rows]
+            row = rows.pop(unique.index(min(unique)))
+            tally.remove(row)
+            uncovered = {i for i in tally.indexes(row)
+                         if required[i] and not tally.counts[i]}
+            if self._repair(rows, tally, required, uncovered, random):
+                # Moves can leave rows, including duplicates, redundant.
+                for row in list(reversed(rows)):
+                    if tally.minimum(row) is not None and \
+                            tally.minimum(row) > 1:
+                        rows.remove(row)
+                        tally.remove(row)
+                best = [tuple(r) for r in rows]
+            else:
+                break
+        return best
+
+    def _repair(self, rows: list[list[Optional[int]]], tally: Tally,
+                required: list[bool], uncovered: set[int],
+                random: Random) -> bool:
+        # Repair the uncovered indexes by simulated annealing. True if all
+        # indexes are covered, False if the budget is exhausted.
+        temperature = self.TEMPERATURE
+        tabu = deque(maxlen=self.TABU)
+        while uncovered:
+            if self._is_exhausted():
+                return False
+            self._iteration += 1
+            temperature *= self.COOLING
+            # Select the row closest to a random uncovered index.
+            positions, features = tally.locate(random.choice(
+                sorted(uncovered)))
+            differences = [[p for p, f in zip(positions, features)
+                            if r[p] != f] for r in rows]
+            closest = min(len(d) for d in differences)
+            candidates = [n for n, d in enumerate(differences)
+                          if len(d) == closest]
+            number = random.choice(candidates)
+            row = rows[number]
+            position = random.choice(differences[number])
+            feature = features[positions.index(position)]
+            # Tabu moves are allowed only if they complete the index.
+            if (number, position) in tabu and closest > 1:
+                continue
+            # Evaluate the move.
+            lost = {i for i in tally.indexes(row, position)
+                    if required[i] and tally.counts[i] == 1}
+            previous = row[position]
+            row[position] = feature
+            gained = {i for i in tally.indexes(row, position)
+                      if required[i] and not tally.counts[i]}
+            self._generator.load(row)
+            delta = len(lost) - len(gained)
+            if self._generator.is_constrained() or (
+                    delta > 0 and
+                    random.random() >= exp(-delta / temperature)):
+                # Reject the move.
+                row[position] = previous
+            else:
+                row[position] = previous
+                tally.remove(row, position)
+                row[position] = feature
+                tally.add(row, position)
+                uncovered -= gained
+                uncovered |= lost
+                tabu.append((number, position))
+        return True
+
+    def _is_exhausted(self) -> bool:
+        # True if the iteration or time budget is exhausted.
+        if self._iteration >= self._iterations:
+            return True
+        else:
+            return self._stop is not None and monotonic() >= self._stop
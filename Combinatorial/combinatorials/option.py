@@ -21,9 +21,18 @@ class Option(Flag):
     :var NO_SHUFFLE:
     :var FEATURE_RANDOM: Randomise order of features in product generation.
     :var RETIRE_RANDOM: Select the retirement sub-combination randomly.
+    :var RETIRE_MOST: Retire the sub-combination with the most uncovered
+        indexes first, rather than in the initial order.
+    :var RETIRE_FEWEST: Retire the sub-combination with the fewest uncovered
+        indexes first, rather than in the initial order.
+    :var RETIRE_WEIGHTED: Retire sub-combinations randomly, weighted by the
+        number of uncovered indexes.
     """
 
     NONE = 0
     NO_SHUFFLE = auto()
     FEATURE_RANDOM = auto()
     RETIRE_RANDOM = auto()
+    RETIRE_MOST = auto()
+    RETIRE_WEIGHTED = auto()
+    RETIRE_FEWEST = auto()
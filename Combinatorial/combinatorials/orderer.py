@@ -0,0 +1,73 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-11-18
+:Compatibility: Python 3.9
+:License:       MIT
+
+Post-generation ordering of the rows yielded by a generator.
+"""
+
+from collections.abc import Collection
+from heapq import heapify, heappop, heappush
+from typing import Optional
+from utility import check
+from .generator import Generator_
+from .tally import Tally
+
+
+class Orderer:
+
+    """Order the rows of a Generator_ so that coverage is reached as early
+    as possible.
+
+    Each row is selected greedily as the one covering the most indexes not
+    covered by the rows before it. Ties are resolved by the new indexes of
+    each lower coverage in turn, down to single features, so that rows of
+    equal coverage, such as those of an orthogonal array, are ordered for
+    diversity, and then by the earlier row. Gains only fall as rows are
+    selected, so a stored gain is an upper bound that is recomputed only
+    when the row reaches the top of the queue. The order is the same as
+    recomputing every gain at every selection. Features that are not set
+    cover nothing.
+    """
+
+    def __init__(self, generator: Generator_):
+        """Construct an Orderer object.
+
+        :param generator: Generator_ that yielded the rows.
+        """
+        assert isinstance(generator, Generator_), check()
+        # ----------
+        self._generator = generator
+
+    def order(self, rows: Collection[Collection[Optional[int]]]) \
+            -> list[tuple[Optional[int], ...]]:
+        """Return the ordered rows.
+
+        :param rows: Feature indexes of the rows, one per dimension.
+        """
+        assert isinstance(rows, Collection), check()
+        # ----------
+        rows = [tuple(r) for r in rows]
+        tallies = [Tally(self._generator.dimensions, c)
+                   for c in range(self._generator.coverage, 0, -1)]
+        indexes = [[list(t.indexes(r)) for t in tallies] for r in rows]
+        covered = [bytearray(len(t.counts)) for t in tallies]
+        heap = [(tuple(-len(i) for i in s), n)
+                for n, s in enumerate(indexes)]
+        heapify(heap)
+        result = []
+        while heap:
+            _, position = heappop(heap)
+            gain = tuple(-sum(1 for i in s if not c[i])
+                         for s, c in zip(indexes[position], covered))
+            if heap and (gain, position) > heap[0]:
+                # Another row may now cover more.
+                heappush(heap, (gain, position))
+            else:
+                for sub_indexes, covered_ in zip(indexes[position], covered):
+                    for index in sub_indexes:
+                        covered_[index] = 1
+                result.append(rows[position])
+        return result
@@ -0,0 +1,98 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-28
+:Compatibility: Python 3.9
+:License:       MIT
+
+Packing of rows of value positions into mixed-radix integers.
+"""
+
+from collections.abc import Collection
+from math import prod
+from typing import Any
+from utility import check
+from utility.defaults import ENDIAN
+from .dimension import Dimension
+
+
+class Packer:
+
+    """Pack rows of value positions into single integers, or fixed length
+    bytes, and decode them back to positions or values.
+
+    The first dimension is the least significant digit, as for the index of
+    a SubCombination, so a packed row is also the rank of the row in the
+    cartesian product of the dimensions. Packed rows can be stored, hashed,
+    deduplicated and sent between processes cheaply, and values resolved
+    only where needed.
+    """
+
+    def __init__(self, dimensions: Collection[Dimension]):
+        """Construct a Packer object.
+
+        :param dimensions: Dimensions of the rows.
+        """
+        assert isinstance(dimensions, Collection), check()
+        # ----------
+        self._sizes = [len(d) for d in dimensions]
+        self._values = [list(d.values) for d in dimensions]
+        self._size = max(1, (prod(self._sizes) - 1).bit_length() + 7 >> 3)
+
+    @property
+    def size(self) -> int:
+        """Number of bytes of a packed row."""
+        return self._size
+
+    def pack(self, positions: Collection[int]) -> int:
+        """Return the row of value positions packed as an integer.
+
+        :param positions: Value position per dimension.
+        """
+        assert isinstance(positions, Collection), check()
+        assert len(positions) == len(self._sizes), check()
+        # ----------
+        result = 0
+        for position, size in zip(reversed(list(positions)),
+                                  reversed(self._sizes)):
+            result = result * size + position
+        return result
+
+    def unpack(self, packed: int) -> tuple[int, ...]:
+        """Return the value positions of a packed row.
+
+        :param packed: Packed row.
+        """
+        assert isinstance(packed, int), check()
+        # ----------
+        positions = []
+        for size in self._sizes:
+            packed, position = divmod(packed, size)
+            positions.append(position)
+        return tuple(positions)
+
+    def decode(self, packed: int) -> tuple[Any, ...]:
+        """Return the values of a packed row.
+
+        :param packed: Packed row.
+        """
+        return tuple(v[p] for p, v in zip(self.unpack(packed), self._values))
+
+    def to_bytes(self, packed: int) -> bytes:
+        """Return a packed row as bytes of the packed size.
+
+        :param packed: Packed row.
+        """
+        assert isinstance(packed, int), check()
+        # ----------
+        return packed.to_bytes(self._size, ENDIAN)
+
+    def from_bytes(self, data: bytes) -> int:
+        """Return a packed row from its bytes.
+
+        :param data: Bytes of the packed row.
+        """
+        assert isinstance(data, (bytes, bytearray)), check()
+        assert len(data) == self._size, check()
+        # ----------
+        return int.from_bytes(data, ENDIAN)
@@ -0,0 +1,168 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-14
+:Compatibility: Python 3.9
+:License:       MIT
+
+Multi-seed portfolio search over a process pool.
+"""
+
+from collections.abc import Collection, Generator
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from itertools import product
+from typing import Any, Optional
+from utility import check
+from utility.defaults import NONE_TYPE
+from .configuration import Configuration
+from .constraint import Constraint
+from .dimension import Dimension
+from .fillgenerator import FillGenerator
+from .option import Option
+from .sequencegenerator import SequenceGenerator
+from .tally import Tally
+
+
+class Portfolio:
+
+    """Run variants of the non-deterministic generators across a process
+    pool and keep the shortest result.
+
+    Each variant is a generator class, an option and a seed, which is also
+    used as the iterator seed. Variants that do not cover as many
+    sub-combination indexes as the best seen are rejected. Once a variant
+    reaches the target, or the minimum for the configuration, pending
+    variants are cancelled; variants already running are left to finish in
+    the background and their results are ignored. Without early
+    cancellation the result is independent of the completion order, ties
+    being resolved by variant order.
+
+    :var OPTIONS: Default options of the variants.
+    :var GENERATORS: Default generator classes of the variants.
+    """
+
+    OPTIONS: tuple[Option, ...] = (
+        Option.FEATURE_RANDOM | Option.RETIRE_RANDOM,
+        Option.FEATURE_RANDOM | Option.RETIRE_WEIGHTED,
+        Option.FEATURE_RANDOM,
+        Option.NONE)
+    GENERATORS: tuple[type, ...] = (FillGenerator, SequenceGenerator)
+
+    def __init__(self, dimensions: Collection[Dimension] = (),
+                 constraints: Collection[Constraint] = (),
+                 coverage: int = 0, seeds: Collection[int] = range(4),
+                 options: Collection[Option] = OPTIONS,
+                 generators: Collection[type] = GENERATORS,
+                 workers: Optional[int] = None,
+                 target: Optional[int] = None):
+        """Construct a Portfolio object.
+
+        :param dimensions: Dimensions in the configuration.
+        :param constraints: Constraints in the configuration.
+        :param coverage: Required coverage.
+        :param seeds: Randomising seeds of the variants.
+        :param options: Options of the variants.
+        :param generators: Generator classes of the variants, unsupported
+            classes are skipped.
+        :param workers: Maximum number of processes, None for the number of
+            processors.
+        :param target: Row count at which to stop, None for the minimum.
+        """
+        assert isinstance(dimensions, Collection), check()
+        assert isinstance(constraints, Collection), check()
+        assert isinstance(coverage, int), check()
+        assert isinstance(seeds, Collection), check()
+        assert next((False for s in seeds if not isinstance(s, int)),
+                    True), check()
+        assert isinstance(options, Collection), check()
+        assert next((False for o in options if not isinstance(o, Option)),
+                    True), check()
+        assert isinstance(generators, Collection), check()
+        assert isinstance(workers, (int, NONE_TYPE)), check()
+        assert isinstance(target, (int, NONE_TYPE)), check()
+        # ----------
+        self._dimensions = dimensions
+        self._constraints = constraints
+        self._coverage = coverage
+        self._workers = workers
+        effective = [d for d in dimensions if len(d) != 1]
+        coverage = Configuration.get_coverage(effective, coverage)
+        self._variants = [
+            (g, o, s) for g, o, s in product(generators, options, seeds)
+            if g.is_supported(effective, constraints, coverage)]
+        minimum = Configuration.get_generator(
+            dimensions, constraints, self._coverage).minimum
+        self._target = minimum if target is None else max(target, minimum)
+        self._rows = None
+        self._variant = None
+
+    @property
+    def variants(self) -> list[tuple[type, Option, int]]:
+        """Supported variants as generator class, option and seed."""
+        return self._variants
+
+    @property
+    def rows(self) -> Optional[list[tuple[Any, ...]]]:
+        """Shortest rows found, as values per dimension, None before the
+        search."""
+        return self._rows
+
+    @property
+    def variant(self) -> Optional[tuple[type, Option, int]]:
+        """Variant that generated the shortest rows, None before the
+        search."""
+        return self._variant
+
+    def run(self) -> list[tuple[Any, ...]]:
+        """Run the search and return the shortest rows, as values per
+        dimension."""
+        for _ in self:
+            pass
+        return self._rows
+
+    def __iter__(self) -> Generator[tuple[type, Option, int, int],
+                                    None, None]:
+        # Run the variants and yield each as generator class, option, seed
+        # and row count as it completes.
+        values = [list(d.values) for d in self._dimensions]
+        best = None
+        executor = ProcessPoolExecutor(self._workers)
+        try:
+            futures = {executor.submit(
+                self._run, self._dimensions, self._constraints,
+                self._coverage, *v): n for n, v in enumerate(self._variants)}
+            for future in as_completed(futures):
+                number = futures[future]
+                rows, covered = future.result()
+                result = (covered, -len(rows), -number)
+                if best is None or result > best:
+                    best = result
+                    self._rows = [tuple(v[i] for i, v in zip(r, values))
+                                  for r in rows]
+                    self._variant = self._variants[number]
+                generator, option, seed = self._variants[number]
+                yield generator, option, seed, len(rows)
+                if -best[1] <= self._target:
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _run(cls, dimensions: Collection[Dimension],
+             constraints: Collection[Constraint], coverage: int,
+             generator: type, option: Option,
+             seed: int) -> tuple[list[tuple[int, ...]], int]:
+        # Run a variant in a worker process. Return the rows as value
+        # positions per dimension, and the number of covered indexes.
+        effective = [d for d in dimensions if len(d) != 1]
+        coverage = Configuration.get_coverage(effective, coverage)
+        instance = generator(effective, constraints, coverage, seed)
+        values = [list(d.values) for d in dimensions]
+        rows = []
+        indexes = []
+        for features in instance.iterate(option, seed):
+            rows.append(tuple(v.index(d.get_value())
+                              for d, v in zip(dimensions, values)))
+            indexes.append([f.index if f else None for f in features])
+        tally = Tally(instance.dimensions, coverage, indexes)
+        return rows, sum(1 for c in tally.counts if c)
@@ -0,0 +1,88 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-28
+:Compatibility: Python 3.9
+:License:       MIT
+
+Background production of the items of an iterable.
+"""
+
+from collections.abc import Generator, Iterable
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import Any
+from utility import check
+
+
+class Producer:
+
+    """Iterate through the items of an iterable as they are produced in a
+    background thread, handed over through a queue of bounded size so that
+    production stays at most that many items ahead.
+
+    Each iteration starts its own thread. Closing the iterator stops
+    production and an exception raised by production is raised in the
+    iterating thread.
+
+    :var TIMEOUT: Interval in seconds at which a producer waiting on a full
+        queue checks for cancellation.
+    """
+
+    TIMEOUT: float = 0.1
+
+    def __init__(self, iterable: Iterable[Any], size: int = 64):
+        """Construct a Producer object.
+
+        :param iterable: Iterable producing the items.
+        :param size: Maximum number of items held in the queue.
+        """
+        assert isinstance(iterable, Iterable), check()
+        assert isinstance(size, int) and size > 0, check()
+        # ----------
+        self._iterable = iterable
+        self._size = size
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        # Iterate through the items as they are produced.
+        queue = Queue(self._size)
+        stop = Event()
+
+        def put(item: tuple[bool, Any]) -> bool:
+            # Put an item, waiting for space unless stopped. True if the
+            # item was put, False if stopped.
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=self.TIMEOUT)
+                    return True
+                except Full:
+                    pass
+            return False
+
+        def produce():
+            # Produce the items into the queue, then the end with any
+            # exception. The end is put however production stops, so that
+            # the iterating thread is never left waiting.
+            end = None
+            try:
+                for item in self._iterable:
+                    if not put((False, item)):
+                        return
+            except BaseException as exception:
+                end = exception
+            finally:
+                put((True, end))
+
+        thread = Thread(target=produce, daemon=True)
+        thread.start()
+        try:
+            while True:
+                end, item = queue.get()
+                if end:
+                    if item is not None:
+                        raise item
+                    return
+                yield item
+        finally:
+            stop.set()
+            thread.join()
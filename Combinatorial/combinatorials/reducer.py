@@ -0,0 +1,149 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-09-09
+:Compatibility: Python 3.9
+:License:       MIT
+
+Post-generation reduction of the rows yielded by a generator.
+"""
+
+from collections.abc import Collection
+from typing import Optional
+from utility import check
+from .generator import Generator_
+from .tally import Tally
+
+
+class Reducer:
+
+    """Reduce the rows of a Generator_ while retaining their coverage.
+
+    Reduction is made in three stages:
+    - Remove rows where every index covered is also covered by another row
+    - Release features to don't care where every index covered through the
+      feature is also covered by another row
+    - Merge rows that differ only in don't care features
+    The result is validated against the coverage of the original rows and
+    the original rows are returned if validation fails.
+    """
+
+    def __init__(self, generator: Generator_):
+        """Construct a Reducer object.
+
+        :param generator: Generator_ that yielded the rows. The generator must
+            have been iterated so that constraints are resolved.
+        """
+        assert isinstance(generator, Generator_), check()
+        # ----------
+        self._generator = generator
+
+    def reduce(self, rows: Collection[Collection[Optional[int]]]) \
+            -> list[tuple[Optional[int], ...]]:
+        """Return the reduced rows.
+
+        :param rows: Feature indexes of the rows, one per dimension.
+        """
+        assert isinstance(rows, Collection), check()
+        # ----------
+        rows = [tuple(r) for r in rows]
+        dimensions = self._generator.dimensions
+        coverage = self._generator.coverage
+        tally = Tally(dimensions, coverage, rows)
+        required = Tally(dimensions, coverage, rows)
+        reduced = self._remove(rows, tally)
+        released = self._release(reduced, tally)
+        reduced = self._merge(reduced, released)
+        tally = Tally(dimensions, coverage, reduced)
+        reduced = self._remove(reduced, tally)
+        # Validate the coverage of the result.
+        if tally.covers(required):
+            return reduced
+        else:
+            return rows
+
+    @classmethod
+    def _remove(cls, rows: list[tuple[Optional[int], ...]],
+                tally: Tally) -> list[tuple[Optional[int], ...]]:
+        # Remove redundant rows. Later rows are tested first as these tend to
+        # contribute least to the coverage.
+        result = []
+        for row in reversed(rows):
+            minimum = tally.minimum(row)
+            if minimum is not None and minimum > 1:
+                tally.remove(row)
+            else:
+                result.append(row)
+        result.reverse()
+        return result
+
+    @classmethod
+    def _release(cls, rows: list[tuple[Optional[int], ...]],
+                 tally: Tally) -> list[set[int]]:
+        # Find the positions in each row that can be released to don't care.
+        # The tally only retains the counts of features that are not
+        # released.
+        result = []
+        for row in reversed(rows):
+            released = set()
+            for position, index in enumerate(row):
+                if index is not None:
+                    # Test against the row with previous releases applied.
+                    row_ = [None if p in released else i
+                            for p, i in enumerate(row)]
+                    minimum = tally.minimum(row_, position)
+                    if minimum is not None and minimum > 1:
+                        tally.remove(row_, position)
+                        released.add(position)
+            result.append(released)
+        result.reverse()
+        return result
+
+    def _merge(self, rows: list[tuple[Optional[int], ...]],
+               released: list[set[int]]) -> list[tuple[Optional[int], ...]]:
+        # Merge compatible rows. Released features take the value from the
+        # other row where it is set, otherwise the original value is kept.
+        # Every index covered through a feature that is not released is
+        # retained by the merge, so coverage is unchanged.
+        rows = list(rows)
+        released = list(released)
+        position = 0
+        while position < len(rows):
+            other = position + 1
+            while other < len(rows):
+                merged = self._get_merged(rows[position], released[position],
+                                          rows[other], released[other])
+                if merged is None:
+                    other += 1
+                else:
+                    rows[position], released[position] = merged
+                    del rows[other]
+                    del released[other]
+            position += 1
+        return rows
+
+    def _get_merged(self, row: tuple[Optional[int], ...], released: set[int],
+                    other: tuple[Optional[int], ...],
+                    other_released: set[int]) \
+            -> Optional[tuple[tuple[Optional[int], ...], set[int]]]:
+        # Return the merged row and its released positions, None if the rows
+        # cannot be merged.
+        merged = []
+        merged_released = set()
+        for position, (index, other_index) in enumerate(zip(row, other)):
+            if position in released:
+                if position in other_released:
+                    merged.append(index)
+                    merged_released.add(position)
+                else:
+                    merged.append(other_index)
+            elif position in other_released or index == other_index:
+                merged.append(index)
+            else:
+                return None
+        # The merged row must not be constrained.
+        self._generator.load(merged)
+        if self._generator.is_constrained():
+            return None
+        else:
+            return tuple(merged), merged_released
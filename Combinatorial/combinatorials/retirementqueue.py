@@ -0,0 +1,161 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-09-02
+:Compatibility: Python 3.9
+:License:       MIT
+
+Priority selection of the SubCombination to retire during fill to completion.
+"""
+
+from collections.abc import Collection
+from heapq import heappop, heappush
+from random import Random
+from typing import Optional
+from utility import check
+from utility.defaults import NONE_TYPE
+from .option import Option
+from .subcombination import SubCombination
+
+
+class RetirementQueue:
+
+    """Queue of SubCombinations keyed by their live uncovered count.
+
+    Counts are updated incrementally as SubCombinations are covered and the
+    retirement target is selected in O(log S) according to the option:
+    - default, the first incomplete in the initial order, which is of most
+      uncovered indexes first
+    - RETIRE_MOST, most uncovered first
+    - RETIRE_FEWEST, fewest uncovered first
+    - RETIRE_WEIGHTED, randomly weighted by the uncovered count
+    Ties are resolved by the initial order of the SubCombinations.
+    """
+
+    def __init__(self, sub_combinations: Collection[SubCombination],
+                 option: Option = Option.NONE,
+                 random: Optional[Random] = None):
+        """Construct a RetirementQueue object.
+
+        :param sub_combinations: SubCombinations to retire.
+        :param option: Option for this iteration.
+        :param random: Random generator for weighted selection.
+        """
+        assert isinstance(sub_combinations, Collection), check()
+        assert isinstance(option, Option), check()
+        assert isinstance(random, (Random, NONE_TYPE)), check()
+        # ----------
+        self._sub_combinations = list(sub_combinations)
+        self._counts = [s.uncovered for s in self._sub_combinations]
+        self._live = [p for p, c in enumerate(self._counts) if c]
+        self._remaining = len(self._live)
+        self._selected = None
+        self._random = random or Random(0)
+        self._weighted = bool(option & Option.RETIRE_WEIGHTED)
+        # The sign of the count in the key, 0 for the initial order.
+        if option & Option.RETIRE_MOST:
+            self._sign = -1
+        elif option & Option.RETIRE_FEWEST:
+            self._sign = 1
+        else:
+            self._sign = 0
+        # Heap entries are (key, position, count) and are invalidated lazily
+        # when the count no longer matches the live count.
+        self._heap = []
+        # Fenwick tree of counts for weighted selection.
+        self._tree = [0] * (len(self._counts) + 1)
+        for position, count in enumerate(self._counts):
+            if count:
+                heappush(self._heap, (self._sign * count, position, count))
+                self._add(position, count)
+
+    def select(self) -> Optional[SubCombination]:
+        """Select the SubCombination to retire next, None if complete."""
+        if not self._remaining:
+            self._selected = None
+        elif self._weighted:
+            total = self._prefix(len(self._tree) - 1)
+            target = self._random.randrange(total)
+            self._selected = self._find(target)
+        else:
+            while self._heap[0][2] != self._counts[self._heap[0][1]]:
+                heappop(self._heap)
+            self._selected = self._heap[0][1]
+        if self._selected is None:
+            return None
+        else:
+            return self._sub_combinations[self._selected]
+
+    def cover(self) -> bool:
+        """Cover all incomplete SubCombinations at the current features. True
+        if any SubCombination is now complete, False otherwise."""
+        complete = False
+        for position in self._live:
+            if self._sub_combinations[position].cover():
+                complete |= self._update(position)
+        if complete:
+            self._live = [p for p in self._live if self._counts[p]]
+        return complete
+
+    def retire(self) -> bool:
+        """Cover only the selected SubCombination at the current features.
+        True if it is now complete, False otherwise."""
+        assert self._selected is not None, check()
+        # ----------
+        complete = False
+        if self._sub_combinations[self._selected].cover():
+            complete = self._update(self._selected)
+        if complete:
+            self._live.remove(self._selected)
+        return complete
+
+    @property
+    def sub_combinations(self) -> list[SubCombination]:
+        """SubCombinations with uncovered indexes."""
+        return [self._sub_combinations[p] for p in self._live]
+
+    def __len__(self) -> int:
+        # Return the number of SubCombinations with uncovered indexes.
+        return self._remaining
+
+    def _add(self, position: int, value: int):
+        # Add the value to the tree at the position.
+        position += 1
+        while position < len(self._tree):
+            self._tree[position] += value
+            position += position & -position
+
+    def _prefix(self, position: int) -> int:
+        # Return the sum of the counts up to and including the position.
+        total = 0
+        while position > 0:
+            total += self._tree[position]
+            position -= position & -position
+        return total
+
+    def _find(self, target: int) -> int:
+        # Return the position whose cumulative count range includes target.
+        position = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            following = position + step
+            if following < len(self._tree) and \
+                    self._tree[following] <= target:
+                position = following
+                target -= self._tree[following]
+            step >>= 1
+        return position
+
+    def _update(self, position: int) -> bool:
+        # Refresh the count at the position. True if now complete.
+        count = self._sub_combinations[position].uncovered
+        previous = self._counts[position]
+        if count != previous:
+            self._counts[position] = count
+            self._add(position, count - previous)
+            if count:
+                heappush(self._heap, (self._sign * count, position, count))
+            else:
+                self._remaining -= 1
+                return True
+        return False
@@ -0,0 +1,117 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-11-25
+:Compatibility: Python 3.9
+:License:       MIT
+
+Post-generation ordering of rows by the cost of switching between them.
+"""
+
+from collections.abc import Collection
+from utility import check
+from .dimension import Dimension
+
+
+class Scheduler:
+
+    """Order rows of value positions to minimise the total cost of switching
+    values between consecutive rows, leaving the rows themselves unchanged.
+
+    Rows are first grouped by the dimensions with a switch cost, most costly
+    first, with the order within alternate groups reversed as in a Gray
+    code. The most costly dimensions then change least often, once per
+    value where possible, and the rows either side of a group boundary
+    share the values of the cheaper dimensions. The order is then improved
+    by 2-opt, reversing runs of up to WINDOW rows where that lowers the
+    cost, for up to PASSES passes where there are at most LIMIT rows.
+
+    The cost of a switch is that of each dimension whose value changes, as
+    given by its switch cost. Costs that depend on the values switched
+    between are not supported.
+
+    :var PASSES: Maximum number of 2-opt passes.
+    :var WINDOW: Maximum number of rows reversed by a 2-opt move.
+    :var LIMIT: Maximum number of rows improved by 2-opt.
+    """
+
+    PASSES: int = 4
+    WINDOW: int = 32
+    LIMIT: int = 10000
+
+    def __init__(self, dimensions: Collection[Dimension]):
+        """Construct a Scheduler object.
+
+        :param dimensions: Dimensions of the rows.
+        """
+        assert isinstance(dimensions, Collection), check()
+        # ----------
+        self._costs = sorted(((d.switch, n) for n, d in enumerate(dimensions)
+                              if d.switch), key=lambda c: -c[0])
+
+    def schedule(self, rows: Collection[Collection[int]]) \
+            -> list[tuple[int, ...]]:
+        """Return the scheduled rows.
+
+        :param rows: Value positions of the rows, one per dimension.
+        """
+        assert isinstance(rows, Collection), check()
+        # ----------
+        rows = self._group([tuple(r) for r in rows],
+                           [n for _, n in self._costs])
+        if len(rows) <= self.LIMIT:
+            self._improve(rows)
+        return rows
+
+    def cost(self, rows: Collection[Collection[int]]) -> float:
+        """Return the total cost of switching between consecutive rows.
+
+        :param rows: Value positions of the rows, one per dimension.
+        """
+        assert isinstance(rows, Collection), check()
+        # ----------
+        rows = list(rows)
+        return sum(self._get_cost(a, b) for a, b in zip(rows, rows[1:]))
+
+    @classmethod
+    def _group(cls, rows: list[tuple[int, ...]],
+               positions: list[int]) -> list[tuple[int, ...]]:
+        # Group the rows by the value at the first position, in reflected
+        # order of the remaining positions within each group.
+        if not positions or len(rows) < 2:
+            return rows
+        groups = {}
+        for row in rows:
+            groups.setdefault(row[positions[0]], []).append(row)
+        result = []
+        for number, value in enumerate(sorted(groups)):
+            group = cls._group(groups[value], positions[1:])
+            if number % 2:
+                group.reverse()
+            result.extend(group)
+        return result
+
+    def _improve(self, rows: list[tuple[int, ...]]):
+        # Reverse runs of rows in place while that lowers the cost. Runs
+        # are limited to the window, so a pass is linear in the rows.
+        for _ in range(self.PASSES):
+            improved = False
+            for first in range(len(rows) - 2):
+                for last in range(first + 2,
+                                  min(first + 1 + self.WINDOW, len(rows))):
+                    before = self._get_cost(rows[first], rows[first + 1])
+                    after = self._get_cost(rows[first], rows[last])
+                    if last + 1 < len(rows):
+                        before += self._get_cost(rows[last], rows[last + 1])
+                        after += self._get_cost(rows[first + 1],
+                                                rows[last + 1])
+                    if after < before:
+                        rows[first + 1:last + 1] = rows[last:first:-1]
+                        improved = True
+            if not improved:
+                break
+
+    def _get_cost(self, row: tuple[int, ...], other: tuple[int, ...]) \
+            -> float:
+        # Return the cost of switching between two rows.
+        return sum(c for c, n in self._costs if row[n] != other[n])
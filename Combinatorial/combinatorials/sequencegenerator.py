@@ -25,9 +25,11 @@ class SequenceGenerator(Generator_):
     covered by the Generator_.
 
     :var OPTION: Default option for this generator.
+    :var INDEXED: True if the rows can be accessed by rank, False otherwise.
     """
 
     OPTION: Option = Option.FEATURE_RANDOM | Option.RETIRE_RANDOM
+    INDEXED: bool = False
 
     @classmethod
     def is_supported(cls, dimensions: Collection[Dimension],
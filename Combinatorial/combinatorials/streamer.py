@@ -0,0 +1,57 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-28
+:Compatibility: Python 3.9
+:License:       MIT
+
+Asynchronous iteration of the items of an iterable.
+"""
+
+from asyncio import wrap_future
+from collections.abc import AsyncGenerator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any
+from utility import check
+
+
+class Streamer:
+
+    """Asynchronously iterate through the items of an iterable, produced in
+    chunks in a worker thread so that the event loop is not blocked.
+
+    Cancellation takes effect at the await of the current chunk and
+    production stops once that chunk is complete. A single thread runs the
+    chunks, and the final close of the iterator, in order.
+    """
+
+    def __init__(self, iterable: Iterable[Any], chunk: int = 64):
+        """Construct a Streamer object.
+
+        :param iterable: Iterable producing the items.
+        :param chunk: Number of items produced per chunk.
+        """
+        assert isinstance(iterable, Iterable), check()
+        assert isinstance(chunk, int) and chunk > 0, check()
+        # ----------
+        self._iterable = iterable
+        self._chunk = chunk
+
+    async def __aiter__(self) -> AsyncGenerator[Any, None]:
+        # Asynchronously iterate through the items.
+        iterator = iter(self._iterable)
+        executor = ThreadPoolExecutor(1)
+        try:
+            while True:
+                items = await wrap_future(executor.submit(
+                    lambda: list(islice(iterator, self._chunk))))
+                if not items:
+                    return
+                for item in items:
+                    yield item
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                executor.submit(close)
+            executor.shutdown(wait=False)
@@ -32,6 +32,7 @@ class SubCombination(BitArray):
         # ----------
         self._dimensions = dimensions
         super().__init__(prod(len(v) for v in self.dimensions))
+        self._uncovered = self._length
 
     def apply_constraint(self, constraint: Constraint):
         """Apply the constraint to this sub_combination.
@@ -51,11 +52,20 @@ class SubCombination(BitArray):
                     dimension.feature = feature
                 self.cover()
 
-    def cover(self):
-        """Cover the SubCombination."""
+    def cover(self) -> bool:
+        """Cover the SubCombination. True if this covered a previously
+        uncovered index, False otherwise."""
         index = self.sub_combination_index
-        if index is not None:
+        if index is not None and not self[index]:
             self[index] = True
+            return True
+        else:
+            return False
+
+    def zero(self):
+        """Zero all values without changing array size."""
+        super().zero()
+        self._uncovered = self._length
 
     @property
     def dimensions(self) -> Collection[Dimension]:
@@ -86,6 +96,12 @@ class SubCombination(BitArray):
             for dimension in self._dimensions:
                 value, dimension.feature_index = divmod(value, len(dimension))
 
+    @property
+    def uncovered(self) -> int:
+        """Number of uncovered indexes, maintained as the SubCombination is
+        covered so that no scan of the BitArray is required."""
+        return self._uncovered
+
     @property
     def is_covered(self) -> Optional[bool]:
         """True if the SubCombination is covered, False otherwise."""
@@ -94,3 +110,9 @@ class SubCombination(BitArray):
             return None
         else:
             return self[index]
+
+    def _set_value(self, index: int, value: bool):
+        # Set the value at the index and track the uncovered count.
+        if self._get_value(index) != value:
+            self._uncovered += -1 if value else 1
+        super()._set_value(index, value)
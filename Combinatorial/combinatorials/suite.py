@@ -0,0 +1,226 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-11-11
+:Compatibility: Python 3.9
+:License:       MIT
+
+Memory mapped suite files of generated rows.
+"""
+
+from array import array
+from collections.abc import Generator
+from json import dumps, loads
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import calcsize, pack, unpack
+from sys import byteorder
+from typing import Any, Optional, Union
+from utility import check
+from utility.defaults import ENCODING
+from .cache import Cache
+from .combinatorial import Combinatorial
+
+
+class Suite:
+
+    """Read only view of a suite file, mapped into memory so that rows and
+    columns are accessed without parsing or loading the file.
+
+    A suite file is laid out as:
+    - HEADER, big endian: MARKER, VERSION, item size in bytes, byte order
+      of the matrix (0 little, 1 big), a pad byte, column count, row count
+      and metadata length in bytes
+    - Metadata, a UTF-8 JSON object of the dimension identities, the value
+      table per dimension, coverage, seed, generator and Combinatorial
+      version; values that are not JSON types are written as strings
+    - Zero padding to a multiple of ALIGN bytes from the start of the file
+    - The rows as a row-major matrix of unsigned value positions of the item
+      size, in the byte order of the writing host
+    Any number of processes can map the same file. The matrix is used in
+    place where the byte order matches the host and copied once otherwise.
+    Column views share the map, so they must be released before close.
+
+    :var MARKER: File marker for suite files.
+    :var VERSION: Version of the file layout.
+    :var HEADER: Struct format of the header.
+    :var ALIGN: Alignment in bytes of the start of the matrix.
+    """
+
+    MARKER: bytes = b'CMBS'
+    VERSION: int = 1
+    HEADER: str = '>4sBBBxIQI'
+    ALIGN: int = 8
+
+    def __init__(self, path: Union[str, Path]):
+        """Construct a Suite object.
+
+        :param path: Path of the suite file.
+        """
+        assert isinstance(path, (str, Path)), check()
+        # ----------
+        with open(path, 'rb') as stream:
+            self._map = mmap(stream.fileno(), 0, access=ACCESS_READ)
+        size = calcsize(self.HEADER)
+        marker, version, itemsize, order, columns, count, length = unpack(
+            self.HEADER, self._map[:size])
+        if marker != self.MARKER or version != self.VERSION:
+            self._map.close()
+            raise ValueError(f'{path} is not a suite file')
+        self._metadata = loads(self._map[size:size + length].decode(
+            ENCODING))
+        self._columns = columns
+        self._count = count
+        start = self._get_offset(length)
+        self._view = memoryview(self._map)[
+            start:start + count * columns * itemsize]
+        matrix = self._view.cast(Cache.TYPECODES[itemsize])
+        if order != (byteorder == 'big'):
+            # Copy the matrix in the byte order of the host.
+            matrix = array(Cache.TYPECODES[itemsize], matrix)
+            matrix.byteswap()
+        self._matrix = matrix
+
+    @property
+    def identities(self) -> list[str]:
+        """Identity per dimension."""
+        return self._metadata['identities']
+
+    @property
+    def tables(self) -> list[list[Any]]:
+        """Value lookup table per dimension, indexed by the value
+        positions."""
+        return self._metadata['tables']
+
+    @property
+    def coverage(self) -> int:
+        """Coverage of the rows."""
+        return self._metadata['coverage']
+
+    @property
+    def seed(self) -> Optional[int]:
+        """Randomising seed of the rows."""
+        return self._metadata['seed']
+
+    @property
+    def generator(self) -> str:
+        """Generator of the rows."""
+        return self._metadata['generator']
+
+    def positions(self, rank: int) -> tuple[int, ...]:
+        """Return the value positions of a row.
+
+        :param rank: Rank of the row, 0 to len - 1.
+        """
+        assert isinstance(rank, int) and 0 <= rank < self._count, check()
+        # ----------
+        start = rank * self._columns
+        return tuple(self._matrix[start:start + self._columns])
+
+    def column(self, index: int, start: int = 0,
+               stop: Optional[int] = None) -> memoryview:
+        """Return a view of the value positions of a column over a range of
+        rows, without copying.
+
+        :param index: Index of the column.
+        :param start: Rank of the first row.
+        :param stop: Rank after the last row, None for the row count.
+        """
+        assert isinstance(index, int) and 0 <= index < self._columns, \
+            check()
+        assert isinstance(start, int) and 0 <= start, check()
+        # ----------
+        stop = self._count if stop is None else min(stop, self._count)
+        start = min(start, stop)
+        return memoryview(self._matrix)[
+            start * self._columns + index:stop * self._columns:
+            self._columns]
+
+    def close(self):
+        """Release the file."""
+        if self._map is not None:
+            if isinstance(self._matrix, memoryview):
+                self._matrix.release()
+            self._view.release()
+            self._map.close()
+            self._map = None
+
+    @classmethod
+    def write(cls, combinatorial: Combinatorial,
+              path: Union[str, Path]) -> int:
+        """Write the rows of a Combinatorial to a suite file as they are
+        generated and return the number of rows.
+
+        :param combinatorial: Combinatorial to write.
+        :param path: Path of the file.
+        """
+        assert isinstance(combinatorial, Combinatorial), check()
+        assert isinstance(path, (str, Path)), check()
+        # ----------
+        dimensions = combinatorial.dimensions
+        maximum = max((len(d) for d in dimensions), default=1) - 1
+        itemsize = next(s for s in sorted(Cache.TYPECODES)
+                        if maximum < 256 ** s)
+        metadata = dumps({
+            'identities': [d.identity for d in dimensions],
+            'tables': combinatorial.tables,
+            'coverage': combinatorial.coverage,
+            'seed': combinatorial.seed,
+            'generator': str(combinatorial.generator),
+            'version': Combinatorial.VERSION}, default=str).encode(ENCODING)
+        with open(path, 'wb') as stream:
+            stream.write(cls._get_header(itemsize, len(dimensions), 0,
+                                         len(metadata)))
+            stream.write(metadata)
+            stream.write(bytes(cls._get_offset(len(metadata)) -
+                               stream.tell()))
+            count = 0
+            if dimensions:
+                for block in combinatorial.iter_batches():
+                    matrix = block[0][:0]
+                    for row in zip(*block):
+                        matrix.extend(row)
+                    stream.write(matrix.tobytes())
+                    count += len(block[0])
+            else:
+                count = sum(1 for _ in combinatorial)
+            # Record the row count once it is known.
+            stream.seek(0)
+            stream.write(cls._get_header(itemsize, len(dimensions), count,
+                                         len(metadata)))
+        return count
+
+    def __getitem__(self, rank: int) -> tuple[Any, ...]:
+        # Return the values of a row.
+        return tuple(t[p] for p, t in zip(self.positions(rank),
+                                          self._metadata['tables']))
+
+    def __iter__(self) -> Generator[tuple[Any, ...], None, None]:
+        # Iterate through the values of the rows.
+        for rank in range(self._count):
+            yield self[rank]
+
+    def __len__(self) -> int:
+        # Return the number of rows.
+        return self._count
+
+    def __enter__(self) -> 'Suite':
+        # Enter the context.
+        return self
+
+    def __exit__(self, *args: Any):
+        # Exit the context, releasing the file.
+        self.close()
+
+    @classmethod
+    def _get_header(cls, itemsize: int, columns: int, count: int,
+                    length: int) -> bytes:
+        # Return the header for the matrix in the byte order of the host.
+        return pack(cls.HEADER, cls.MARKER, cls.VERSION, itemsize,
+                    int(byteorder == 'big'), columns, count, length)
+
+    @classmethod
+    def _get_offset(cls, length: int) -> int:
+        # Return the offset of the matrix after metadata of the length.
+        offset = calcsize(cls.HEADER) + length
+        return -(-offset // cls.ALIGN) * cls.ALIGN
@@ -0,0 +1,135 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-09-09
+:Compatibility: Python 3.9
+:License:       MIT
+
+Coverage counts of sub-combination indexes over a set of generated rows.
+"""
+
+from bisect import bisect
+from collections.abc import Collection, Generator
+from itertools import combinations
+from math import prod
+from typing import Optional
+from utility import check
+from .dimension import Dimension
+
+
+class Tally:
+
+    """Count of the rows covering each index of each sub-combination.
+
+    Rows are collections of feature indexes, one per dimension, where None
+    marks a feature that is not set. Sub-combination indexes follow the same
+    ordering as the SubCombination.
+    """
+
+    def __init__(self, dimensions: Collection[Dimension], coverage: int,
+                 rows: Collection[Collection[Optional[int]]] = ()):
+        """Construct a Tally object.
+
+        :param dimensions: Dimensions in the configuration.
+        :param coverage: Required coverage.
+        :param rows: Initial rows to count.
+        """
+        assert isinstance(dimensions, Collection), check()
+        assert isinstance(coverage, int), check()
+        assert isinstance(rows, Collection), check()
+        # ----------
+        sizes = [len(d) for d in dimensions]
+        self._sub_combinations = []
+        offset = 0
+        for positions in combinations(range(len(sizes)), coverage):
+            shifts = [prod(sizes[p] for p in positions[:n])
+                      for n in range(len(positions))]
+            self._sub_combinations.append((offset, positions, shifts))
+            offset += prod(sizes[p] for p in positions)
+        self._offsets = [o for o, _, _ in self._sub_combinations]
+        self._counts = [0] * offset
+        for row in rows:
+            self.add(row)
+
+    def add(self, row: Collection[Optional[int]],
+            position: Optional[int] = None):
+        """Count the indexes covered by the row.
+
+        :param row: Feature indexes of the row.
+        :param position: Restrict to sub-combinations including this position.
+        """
+        for index in self.indexes(row, position):
+            self._counts[index] += 1
+
+    def remove(self, row: Collection[Optional[int]],
+               position: Optional[int] = None):
+        """Remove the count of the indexes covered by the row.
+
+        :param row: Feature indexes of the row.
+        :param position: Restrict to sub-combinations including this position.
+        """
+        for index in self.indexes(row, position):
+            self._counts[index] -= 1
+
+    def indexes(self, row: Collection[Optional[int]],
+                position: Optional[int] = None) -> Generator[int, None, None]:
+        """Yield the tally indexes covered by the row.
+
+        :param row: Feature indexes of the row.
+        :param position: Restrict to sub-combinations including this position.
+        """
+        for offset, positions, shifts in self._sub_combinations:
+            if position is None or position in positions:
+                index = offset
+                for position_, shift in zip(positions, shifts):
+                    if row[position_] is None:
+                        break
+                    index += row[position_] * shift
+                else:
+                    yield index
+
+    def minimum(self, row: Collection[Optional[int]],
+                position: Optional[int] = None) -> Optional[int]:
+        """Lowest count of the indexes covered by the row, None if the row
+        covers no indexes.
+
+        :param row: Feature indexes of the row.
+        :param position: Restrict to sub-combinations including this position.
+        """
+        return min((self._counts[i] for i in self.indexes(row, position)),
+                   default=None)
+
+    def locate(self, index: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """Return the dimension positions and feature indexes of a tally
+        index.
+
+        :param index: Tally index to locate.
+        """
+        assert isinstance(index, int), check()
+        assert 0 <= index < len(self._counts), check()
+        # ----------
+        offset, positions, shifts = \
+            self._sub_combinations[bisect(self._offsets, index) - 1]
+        index -= offset
+        features = []
+        for shift in reversed(shifts):
+            feature, index = divmod(index, shift)
+            features.append(feature)
+        return positions, tuple(reversed(features))
+
+    def covers(self, other: 'Tally') -> bool:
+        """True if every index counted in the other Tally is counted in this
+        Tally, False otherwise.
+
+        :param other: Tally to compare.
+        """
+        assert isinstance(other, Tally), check()
+        assert len(other.counts) == len(self._counts), check()
+        # ----------
+        return next((False for c, o in zip(self._counts, other.counts)
+                     if o and not c), True)
+
+    @property
+    def counts(self) -> list[int]:
+        """Row count for each index of each sub-combination."""
+        return self._counts
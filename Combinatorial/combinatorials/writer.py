@@ -0,0 +1,149 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-11-04
+:Compatibility: Python 3.9
+:License:       MIT
+
+Streaming export of the rows of a Combinatorial.
+"""
+
+from collections.abc import Generator
+from csv import writer
+from gzip import open as open_gzip
+from json import dumps
+from pathlib import Path
+from struct import pack
+from sys import byteorder
+from typing import Any, BinaryIO, TextIO, Union
+from utility import check
+from utility.defaults import ENCODING, ENDIAN
+from .combinatorial import Combinatorial
+
+
+class Writer:
+
+    """Write the rows of a Combinatorial to a file as they are generated.
+
+    Rows are written in blocks, so there is one write per block rather than
+    per row, and the file is gzip compressed if required. The formats are:
+    - csv: a header of dimension identities then a line of values per row
+    - jsonl: an object of values keyed by dimension identity per line
+    - binary: a header of MARKER, item size and column count, as HEADER,
+      then the value positions of the rows as a row-major matrix of
+      unsigned integers in ENDIAN byte order; the row count follows from
+      the length
+
+    :var FORMATS: Supported formats.
+    :var MARKER: File marker for the binary format.
+    :var HEADER: Struct format of the binary header.
+    :var BLOCK: Number of rows per write.
+    """
+
+    FORMATS: tuple[str, ...] = ('csv', 'jsonl', 'binary')
+    MARKER: bytes = b'CMBM'
+    HEADER: str = '>4sBI'
+    BLOCK: int = 4096
+
+    def __init__(self, combinatorial: Combinatorial, format_: str = 'csv',
+                 compress: bool = False):
+        """Construct a Writer object.
+
+        :param combinatorial: Combinatorial to write.
+        :param format_: Format of the file, one of FORMATS.
+        :param compress: True to gzip compress the file, False otherwise.
+        """
+        assert isinstance(combinatorial, Combinatorial), check()
+        assert format_ in self.FORMATS, check()
+        assert isinstance(compress, bool), check()
+        # ----------
+        self._combinatorial = combinatorial
+        self._format = format_
+        self._compress = compress
+
+    def write(self, path: Union[str, Path]) -> int:
+        """Write the rows to the file and return the number of rows.
+
+        :param path: Path of the file.
+        """
+        assert isinstance(path, (str, Path)), check()
+        # ----------
+        if self._format == 'binary':
+            with self._open(path, 'wb') as stream:
+                return self._write_binary(stream)
+        else:
+            with self._open(path, 'wt') as stream:
+                if self._format == 'csv':
+                    return self._write_csv(stream)
+                else:
+                    return self._write_jsonl(stream)
+
+    def _open(self, path: Union[str, Path],
+              mode: str) -> Union[BinaryIO, TextIO]:
+        # Open the file for writing, compressed if required.
+        encoding = None if 'b' in mode else ENCODING
+        newline = None if 'b' in mode else ''
+        if self._compress:
+            return open_gzip(path, mode, encoding=encoding, newline=newline)
+        else:
+            return open(path, mode, encoding=encoding, newline=newline)
+
+    def _write_csv(self, stream: TextIO) -> int:
+        # Write the rows as comma separated values.
+        csv = writer(stream)
+        csv.writerow([d.identity for d in self._combinatorial.dimensions])
+        count = 0
+        for block in self._get_blocks():
+            csv.writerows(block)
+            count += len(block)
+        return count
+
+    def _write_jsonl(self, stream: TextIO) -> int:
+        # Write the rows as JSON lines. Values that are not JSON types are
+        # written as strings.
+        identities = [d.identity for d in self._combinatorial.dimensions]
+        count = 0
+        for block in self._get_blocks():
+            stream.write(''.join(
+                dumps(dict(zip(identities, r)), default=str) + '\n'
+                for r in block))
+            count += len(block)
+        return count
+
+    def _write_binary(self, stream: BinaryIO) -> int:
+        # Write the value positions as a matrix, one block of columns at a
+        # time.
+        columns = len(self._combinatorial.dimensions)
+        if columns == 0:
+            # Rows without columns have no data.
+            stream.write(pack(self.HEADER, self.MARKER, 1, columns))
+            return sum(1 for _ in self._combinatorial)
+        count = 0
+        header = False
+        for block in self._combinatorial.iter_batches(self.BLOCK):
+            if not header:
+                stream.write(pack(self.HEADER, self.MARKER,
+                                  block[0].itemsize, columns))
+                header = True
+            matrix = block[0][:0]
+            for row in zip(*block):
+                matrix.extend(row)
+            if byteorder != ENDIAN:
+                matrix.byteswap()
+            stream.write(matrix.tobytes())
+            count += len(block[0])
+        if not header:
+            stream.write(pack(self.HEADER, self.MARKER, 1, columns))
+        return count
+
+    def _get_blocks(self) \
+            -> Generator[list[tuple[Any, ...]], None, None]:
+        # Yield the rows in blocks.
+        block = []
+        for row in self._combinatorial:
+            block.append(row)
+            if len(block) == self.BLOCK:
+                yield block
+                block = []
+        if block:
+            yield block
@@ -6,13 +6,34 @@
 :License:       MIT
 """
 
+from ._batch import _Batch
+from ._cache import _Cache
+from ._checkpoint import _Checkpoint
 from ._combinatorial import _Combinatorial
 from ._configuration import _Configuration
 from ._constraint import _Constraint
+from ._delta import _Delta
 from ._dimension import _Dimension
+from ._evaluator import _Evaluator
 from ._extent import _Extent
 from ._generator import _Generator
+from ._library import _Library
+from ._optimiser import _Optimiser
+from ._orderer import _Orderer
+from ._packer import _Packer
+from ._portfolio import _Portfolio
+from ._producer import _Producer
+from ._reducer import _Reducer
+from ._retirementqueue import _RetirementQueue
+from ._scheduler import _Scheduler
+from ._streamer import _Streamer
 from ._subcombination import _SubCombination
+from ._suite import _Suite
+from ._writer import _Writer
 
-__all__ = ['_Combinatorial', '_Configuration', '_Constraint', '_Dimension',
-           '_Extent', '_Generator', '_SubCombination']
+__all__ = ['_Batch', '_Cache', '_Checkpoint', '_Combinatorial',
+           '_Configuration', '_Constraint', '_Delta', '_Dimension',
+           '_Evaluator', '_Extent', '_Generator', '_Library', '_Optimiser',
+           '_Orderer', '_Packer', '_Portfolio', '_Producer', '_Reducer',
+           '_RetirementQueue', '_Scheduler', '_Streamer', '_SubCombination',
+           '_Suite', '_Writer']
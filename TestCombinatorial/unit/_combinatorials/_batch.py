@@ -0,0 +1,31 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-21
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from unittest import TestCase
+from combinatorials import Batch, Combinatorial, Dimension
+
+
+class _Batch(TestCase):
+
+    """Unit tests for Batch class."""
+
+    def test_generate(self):
+        """Models are generated in workers, most expensive first."""
+        models = [Combinatorial([Dimension(str(n), 'abc')
+                                 for n in range(count)], (), 2, count)
+                  for count in (2, 5, 3)]
+        expected = [list(m) for m in models]
+        results = list(Batch(models, 0).generate())
+        self.assertEqual([r[0] for r in results], [1, 2, 0])
+        for number, rows, seconds in results:
+            self.assertEqual(rows, expected[number])
+            self.assertGreaterEqual(seconds, 0)
+        results = list(Batch(models, 2).generate())
+        self.assertEqual(sorted(r[0] for r in results), [0, 1, 2])
+        for number, rows, _ in results:
+            self.assertEqual(rows, expected[number])
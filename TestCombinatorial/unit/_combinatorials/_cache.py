@@ -0,0 +1,82 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-09-30
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from combinatorials import Cache, Combinatorial, Constraint, Dimension
+from combinatorials import Extent
+
+
+class _Cache(TestCase):
+
+    """Unit tests for Cache class."""
+
+    def setUp(self):
+        """Create a temporary cache directory."""
+        self.directory = TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the temporary cache directory."""
+        self.directory.cleanup()
+
+    def test_put_get(self):
+        """Rows are returned as stored."""
+        cache = Cache(self.directory.name)
+        self.assertIsNone(cache.get('key'))
+        rows = [(0, 1, 2), (2, 1, 0), (1, 300, 1)]
+        cache.put('key', rows)
+        self.assertEqual(cache.get('key'), rows)
+        cache.put('empty', [(), ()])
+        self.assertEqual(cache.get('empty'), [(), ()])
+        self.assertEqual(len(cache), 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_corrupt(self):
+        """A corrupt entry is treated as a miss."""
+        cache = Cache(self.directory.name)
+        cache.put('key', [(0, 1), (1, 0)])
+        path = cache.path / ('key' + Cache.SUFFIX)
+        path.write_bytes(path.read_bytes()[:-1])
+        self.assertIsNone(cache.get('key'))
+
+    def test_evict(self):
+        """Entries beyond the limit are evicted."""
+        cache = Cache(self.directory.name, 2)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, [(0,)])
+        self.assertEqual(len(cache), 2)
+
+    def test_combinatorial(self):
+        """A cache hit yields the same rows, mapped to the current values."""
+        cache = Cache(self.directory.name)
+        rows = []
+        for values in ((0, 1, 2), ('x', 'y', 'z')):
+            dimensions = [Dimension(str(n), values) for n in range(5)]
+            constraints = [Constraint([Extent('0', values[:1]),
+                                       Extent('1', values[1:2])])]
+            combinatorial = Combinatorial(dimensions, constraints, 2, 0)
+            combinatorial.cache = cache
+            rows.append(list(combinatorial))
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(list(combinatorial), rows[-1])
+        mapping = dict(zip((0, 1, 2), ('x', 'y', 'z')))
+        self.assertEqual([tuple(mapping[v] for v in r) for r in rows[0]],
+                         rows[1])
+
+    def test_key(self):
+        """The key reflects the structure of the model."""
+        dimensions = [Dimension(str(n), (0, 1, 2)) for n in range(4)]
+        keys = {Combinatorial(dimensions, (), 2, 0).key,
+                Combinatorial(dimensions, (), 2, 1).key,
+                Combinatorial(dimensions, (), 3, 0).key,
+                Combinatorial(dimensions[1:], (), 2, 0).key}
+        self.assertEqual(len(keys), 4)
+        self.assertEqual(Combinatorial(dimensions, (), 2, 0).key,
+                         Combinatorial(dimensions, (), 2, 0).key)
+        self.assertIsNone(Combinatorial(dimensions, (), 2).key)
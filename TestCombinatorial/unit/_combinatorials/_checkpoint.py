@@ -0,0 +1,82 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-11-11
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from os import listdir
+from os.path import exists, join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from combinatorials import Checkpoint
+
+
+class _Checkpoint(TestCase):
+
+    """Unit tests for Checkpoint class."""
+
+    def setUp(self):
+        """Create a temporary checkpoint directory."""
+        self.directory = TemporaryDirectory()
+        self.path = join(self.directory.name, 'checkpoint')
+        self.addCleanup(setattr, Checkpoint, 'INTERVAL', Checkpoint.INTERVAL)
+        Checkpoint.INTERVAL = 0
+
+    def tearDown(self):
+        """Remove the temporary checkpoint directory."""
+        self.directory.cleanup()
+
+    def test_save_load(self):
+        """The state is loaded as saved, for the same key only."""
+        checkpoint = Checkpoint(self.path, 'key')
+        self.assertIsNone(checkpoint.load())
+        checkpoint.save(3, [[0, 1], [2]])
+        self.assertEqual(checkpoint.load(), (3, [[0, 1], [2]]))
+        self.assertEqual(listdir(self.directory.name), ['checkpoint'])
+        self.assertIsNone(Checkpoint(self.path, 'other').load())
+        self.assertIsNone(Checkpoint(self.path, None).load())
+        checkpoint.remove()
+        self.assertFalse(exists(self.path))
+        checkpoint.remove()
+
+    def test_append(self):
+        """Saves append the new journal entries, and a torn save is
+        ignored."""
+        checkpoint = Checkpoint(self.path, 'key')
+        journal = [[0, [1]]]
+        checkpoint.save(1, journal)
+        journal.append([1, [2, 3]])
+        checkpoint.save(2, journal)
+        with open(self.path) as file:
+            lines = file.readlines()
+        self.assertEqual(len(lines), 3)
+        self.assertNotIn('[0, [1]]', lines[2])
+        self.assertEqual(checkpoint.load(), (2, journal))
+        with open(self.path, 'a') as file:
+            file.write('{"count": 3, "jour')
+        self.assertEqual(checkpoint.load(), (2, journal))
+        # A new run replaces the file.
+        Checkpoint(self.path, 'key').save(0, [])
+        self.assertEqual(checkpoint.load(), (0, []))
+
+    def test_interval(self):
+        """The state is saved at most every interval."""
+        Checkpoint.INTERVAL = 60.0
+        checkpoint = Checkpoint(self.path, 'key')
+        checkpoint.save(1, [])
+        self.assertFalse(exists(self.path))
+
+    def test_corrupt(self):
+        """A corrupt checkpoint is not loaded."""
+        with open(self.path, 'w') as file:
+            file.write('{')
+        self.assertIsNone(Checkpoint(self.path, 'key').load())
+
+    def test_no_path(self):
+        """A checkpoint without a path does nothing."""
+        checkpoint = Checkpoint(None, 'key')
+        checkpoint.save(1, [])
+        self.assertIsNone(checkpoint.load())
+        checkpoint.remove()
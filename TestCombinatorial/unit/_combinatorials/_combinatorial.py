@@ -6,9 +6,15 @@
 :License:       MIT
 """
 
-from itertools import product
+from asyncio import CancelledError, create_task, run, sleep
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations, product
+from os.path import exists, join
+from tempfile import TemporaryDirectory
+from threading import active_count
 from unittest import TestCase
-from combinatorials import Combinatorial, Dimension, Generator_
+from combinatorials import Cache, Checkpoint, Combinatorial, Constraint
+from combinatorials import Dimension, Extent, Generator_
 from combinatorials import MinusOneGenerator, SubCombination
 
 
@@ -73,6 +79,12 @@ class _Combinatorial(TestCase):
         else:
             return count
 
+    @classmethod
+    def get_covered(cls, rows: list[tuple]) -> list[tuple]:
+        """Get the pairs of values covered by each row."""
+        return [(c, tuple(r[n] for n in c)) for r in rows
+                for c in combinations(range(len(r)), 2)]
+
     # Test core iterations.
 
     def test_null(self):
@@ -186,3 +198,334 @@ class _Combinatorial(TestCase):
         self.assertEqual(combinatorial.generator.coverage, 2)
         self.assertEqual(self.validate(combinatorial),
                          combinatorial.generator.minimum)
+
+    # Test executed rows.
+
+    def test_executed_complete(self):
+        """Test that no rows are generated when the executed rows are
+        complete.
+        """
+        dimensions = [Dimension('a', [0, 1, 2]),
+                      Dimension('b', [0, 1, 2]),
+                      Dimension('c', [0, 1, 2, 3])]
+        executed = list(Combinatorial(dimensions, (), 2, 0))
+        combinatorial = Combinatorial(dimensions, (), 2, 0, executed)
+        self.assertEqual(list(combinatorial), [])
+
+    def test_executed_cartesian(self):
+        """Test that executed rows are excluded from the cartesian product."""
+        dimensions = [Dimension('a', [0, 1, 2]),
+                      Dimension('b', [0, 1])]
+        executed = [(0, 0), (2, 1)]
+        combinatorial = Combinatorial(dimensions, (), 0, 0, executed)
+        self.assertEqual(combinatorial.generator.__class__, Generator_)
+        self.assertEqual(sorted(combinatorial),
+                         [(0, 1), (1, 0), (1, 1), (2, 0)])
+
+    def test_executed_extended(self):
+        """Test that extending a dimension generates only the rows needed
+        to complete coverage.
+        """
+        dimensions = [Dimension(str(n), [0, 1, 2]) for n in range(5)]
+        dimensions.append(Dimension('single', ['x']))
+        executed = list(Combinatorial(dimensions, (), 2, 0))
+        dimensions[2] = Dimension('2', [0, 1, 2, 3])
+        combinatorial = Combinatorial(dimensions, (), 2, 0, executed)
+        rows = list(combinatorial)
+        self.assertLess(len(rows), len(executed))
+        # Every pair is covered by the union of the rows.
+        for first, second in combinations(range(5), 2):
+            pairs = {(r[first], r[second]) for r in executed + rows}
+            self.assertEqual(pairs, set(product(dimensions[first].values,
+                                                dimensions[second].values)))
+
+    def test_memoise(self):
+        """Test that recorded rows are replayed until invalidated."""
+        dimensions = [Dimension(str(n), 'abc') for n in range(5)]
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        self.assertRaises(TypeError, len, combinatorial)
+        combinatorial.memoise = True
+        with TemporaryDirectory() as directory:
+            combinatorial.cache = Cache(directory)
+            rows = list(combinatorial)
+            combinatorial.cache.clear()
+            self.assertEqual(len(combinatorial), len(rows))
+            self.assertEqual(list(combinatorial), rows)
+            # Replay does not generate, so nothing is cached.
+            self.assertEqual(len(combinatorial.cache), 0)
+            combinatorial.invalidate()
+            self.assertEqual(list(combinatorial), rows)
+            self.assertEqual(len(combinatorial.cache), 1)
+
+    def test_memoise_length(self):
+        """Test that the length records the rows."""
+        combinatorial = Combinatorial([], (), 2, 0)
+        combinatorial.memoise = True
+        self.assertEqual(len(combinatorial), 1)
+        self.assertEqual(list(combinatorial), [()])
+        self.assertTrue(Combinatorial([Dimension('a', [])], (), 1, 0))
+
+    def test_shared_dimensions(self):
+        """Test that combinatorials sharing dimensions do not interfere and
+        leave the dimensions unmodified.
+        """
+        dimensions = [Dimension(str(n), 'abc') for n in range(5)]
+        first = Combinatorial(dimensions, (), 2, 1)
+        second = Combinatorial(dimensions, (), 3, 2)
+        expected = list(first), list(second)
+        # Interleave the runs.
+        results = list(zip(*zip(first, second)))
+        self.assertEqual(list(results[0]), expected[0][:len(results[0])])
+        self.assertEqual(list(results[1]), expected[1][:len(results[1])])
+        for dimension in dimensions:
+            self.assertIsNone(dimension.feature)
+            self.assertEqual([f.count for f in dimension.features],
+                             [0, 0, 0])
+
+    def test_threads(self):
+        """Test that a combinatorial can be iterated in concurrent
+        threads.
+        """
+        dimensions = [Dimension(str(n), 'abcd') for n in range(6)]
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        expected = list(combinatorial)
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda _: list(combinatorial),
+                                        range(8)))
+        for rows in results:
+            self.assertEqual(rows, expected)
+
+    def test_row_shard(self):
+        """Test that indexed rows are accessed by rank and shard."""
+        dimensions = [Dimension('a', [0, 1, 2]), Dimension('b', [0, 1]),
+                      Dimension('c', [0, 1, 2, 3]), Dimension('d', ['x'])]
+        constraints = [Constraint([Extent('a', [0]), Extent('b', [1])])]
+        for coverage, constraints_ in ((0, ()), (0, constraints), (2, ())):
+            combinatorial = Combinatorial(dimensions, constraints_,
+                                          coverage, 1)
+            self.assertTrue(combinatorial.indexed)
+            rows = list(combinatorial)
+            self.assertEqual(len(combinatorial), len(rows))
+            self.assertEqual([combinatorial.row(n)
+                              for n in range(len(rows))], rows)
+            for count in (1, 3, 5):
+                self.assertEqual([r for n in range(count)
+                                  for r in combinatorial.shard(n, count)],
+                                 rows)
+        self.assertEqual(len(Combinatorial(dimensions, constraints, 0, 1)),
+                         20)
+
+    def test_not_indexed(self):
+        """Test that search generators and post-generation stages are not
+        indexed.
+        """
+        dimensions = [Dimension(str(n), 'abc') for n in range(5)]
+        self.assertFalse(Combinatorial(dimensions, (), 2, 0).indexed)
+        combinatorial = Combinatorial(dimensions, (), 0, 0)
+        self.assertTrue(combinatorial.indexed)
+        combinatorial.reduce = True
+        self.assertFalse(combinatorial.indexed)
+        self.assertEqual(len(Combinatorial([Dimension('a', [])], (), 1, 0)),
+                         0)
+
+    def test_background(self):
+        """Test that rows are generated in a background thread."""
+        dimensions = [Dimension(str(n), 'abc') for n in range(5)]
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        rows = list(combinatorial)
+        self.assertEqual(list(combinatorial.background(2)), rows)
+        # Closing stops the producer.
+        count = active_count()
+        iterator = combinatorial.background(1)
+        self.assertEqual(next(iterator), rows[0])
+        iterator.close()
+        self.assertEqual(active_count(), count)
+
+    def test_background_exception(self):
+        """Test that an exception in generation is raised in the consumer,
+        including one that is not an Exception.
+        """
+
+        class Failing(Combinatorial):
+
+            def __iter__(self):
+                yield ('a',)
+                raise ValueError('generation')
+
+        iterator = Failing([Dimension('a', 'a')]).background()
+        self.assertEqual(next(iterator), ('a',))
+        self.assertRaises(ValueError, next, iterator)
+
+        class Interrupted(Combinatorial):
+
+            def __iter__(self):
+                yield ('a',)
+                raise KeyboardInterrupt
+
+        iterator = Interrupted([Dimension('a', 'a')]).background()
+        self.assertEqual(next(iterator), ('a',))
+        self.assertRaises(KeyboardInterrupt, next, iterator)
+
+    def test_aiter(self):
+        """Test asynchronous iteration in chunks and cancellation."""
+        dimensions = [Dimension(str(n), 'abc') for n in range(5)]
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        rows = list(combinatorial)
+
+        async def collect(chunk: int) -> list[tuple]:
+            return [r async for r in combinatorial.aiter(chunk)]
+
+        async def cancel() -> list[tuple]:
+            collected = []
+
+            async def consume():
+                async for row in combinatorial.aiter(1):
+                    collected.append(row)
+                    await sleep(0)
+
+            task = create_task(consume())
+            while len(collected) < 2:
+                await sleep(0.001)
+            task.cancel()
+            with self.assertRaises(CancelledError):
+                await task
+            return collected
+
+        for chunk in (1, 4, 100):
+            self.assertEqual(run(collect(chunk)), rows)
+        collected = run(cancel())
+        self.assertEqual(collected, rows[:len(collected)])
+        self.assertLess(len(collected), len(rows))
+
+    def test_iter_batches(self):
+        """Test that blocks of rows are yielded as columns of positions."""
+        dimensions = [Dimension('a', [0, 1, 2]), Dimension('b', 'xyz'),
+                      Dimension('c', [None]), Dimension('d', range(300))]
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        rows = list(combinatorial)
+        batches = list(combinatorial.iter_batches(128))
+        self.assertEqual([len(b[0]) for b in batches],
+                         [128] * (len(rows) // 128) + [len(rows) % 128])
+        self.assertEqual(batches[0][3].itemsize, 2)
+        tables = combinatorial.tables
+        self.assertEqual([tuple(t[i] for i, t in zip(r, tables))
+                          for b in batches for r in zip(*b)], rows)
+
+    def test_checkpoint(self):
+        """Test that a resumed iteration yields the remaining rows."""
+        constraint = Constraint([Extent('0', 'a'), Extent('1', 'b')])
+        models = [
+            ([Dimension(str(n), 'abc') for n in range(5)], (), 2, False),
+            ([Dimension(str(n), 'abcd'[:n % 3 + 2]) for n in range(6)],
+             [constraint], 3, False),
+            ([Dimension(str(n), 'abc') for n in range(5)], (), 2, True),
+            ([Dimension(str(n), 'abc') for n in range(3)], (), 0, False)]
+
+        def get(seed: int) -> Combinatorial:
+            """Get a Combinatorial that checkpoints every row."""
+            result = Combinatorial(dimensions, constraints, coverage, seed)
+            result.reduce = reduce
+            result.checkpoint = path
+            return result
+
+        def interrupt(combinatorial: Combinatorial, count: int):
+            """Stop iteration once the rows are consumed."""
+            iterator = iter(combinatorial)
+            for _ in range(count + 1):
+                next(iterator)
+            iterator.close()
+            self.assertTrue(exists(path))
+
+        self.addCleanup(setattr, Checkpoint, 'INTERVAL', Checkpoint.INTERVAL)
+        Checkpoint.INTERVAL = 0
+        with TemporaryDirectory() as directory:
+            path = join(directory, 'checkpoint')
+            for dimensions, constraints, coverage, reduce in models:
+                rows = list(get(0))
+                self.assertFalse(exists(path))
+                for count in (1, 5):
+                    # A different key does not resume.
+                    interrupt(get(1), count)
+                    self.assertEqual(list(get(0)), rows)
+                    self.assertFalse(exists(path))
+                    # The same key resumes, without recording.
+                    interrupt(get(0), count)
+                    combinatorial = get(0)
+                    combinatorial.memoise = True
+                    self.assertEqual(list(combinatorial), rows[count:])
+                    self.assertFalse(exists(path))
+                    self.assertEqual(list(combinatorial), rows)
+        with self.assertRaises(AssertionError):
+            Combinatorial(models[0][0]).checkpoint = 'checkpoint'
+
+    def test_target_limit(self):
+        """Test that iteration stops at the target coverage or limit."""
+        dimensions = [Dimension(str(n), 'abc') for n in range(6)]
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        rows = list(combinatorial)
+        self.assertIsNone(combinatorial.achieved)
+        total = len(set(self.get_covered(rows)))
+
+        def get_fraction(rows_: list[tuple]) -> float:
+            """Get the fraction of sub-combinations covered by the rows."""
+            return len(set(self.get_covered(rows_))) / total
+
+        combinatorial.target = 0.9
+        self.assertFalse(combinatorial.indexed)
+        partial = list(combinatorial)
+        self.assertEqual(partial, rows[:len(partial)])
+        self.assertLess(len(partial), len(rows))
+        self.assertAlmostEqual(combinatorial.achieved,
+                               get_fraction(partial))
+        self.assertGreaterEqual(combinatorial.achieved, 0.9)
+        self.assertLess(get_fraction(partial[:-1]), 0.9)
+        combinatorial.target = 1
+        self.assertEqual(list(combinatorial), rows)
+        self.assertEqual(combinatorial.achieved, 1)
+        combinatorial.target = None
+        for limit in (0, 5, 100):
+            combinatorial.limit = limit
+            self.assertEqual(list(combinatorial), rows[:limit])
+            self.assertAlmostEqual(combinatorial.achieved,
+                                   get_fraction(rows[:limit]))
+        # Measures are published as each iteration ends.
+        combinatorial.limit = 5
+        first, second = iter(combinatorial), iter(combinatorial)
+        next(first)
+        self.assertEqual(list(second), rows[:5])
+        achieved = combinatorial.achieved
+        self.assertEqual(len(combinatorial.curve), 5)
+        next(first)
+        self.assertEqual(combinatorial.achieved, achieved)
+        first.close()
+        self.assertAlmostEqual(combinatorial.achieved,
+                               get_fraction(rows[:2]))
+        self.assertEqual(len(combinatorial.curve), 2)
+        # Executed rows are covered already.
+        combinatorial = Combinatorial(dimensions, (), 2, 0, rows[:5])
+        combinatorial.limit = 1
+        row = list(combinatorial)
+        self.assertAlmostEqual(
+            combinatorial.achieved,
+            (get_fraction(rows[:5] + row) - get_fraction(rows[:5])) /
+            (1 - get_fraction(rows[:5])))
+        # Replayed rows report the measures of the recording iteration.
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        combinatorial.memoise = True
+        combinatorial.target = 0.8
+        partial = list(combinatorial)
+        self.assertAlmostEqual(combinatorial.achieved,
+                               get_fraction(partial))
+        self.assertEqual(len(combinatorial.curve), len(partial))
+        curve = combinatorial.curve
+        self.assertEqual([r for r in combinatorial], partial)
+        self.assertEqual(combinatorial.curve, curve)
+        # Rows covering constrained indexes do not count them.
+        dimensions = [Dimension(str(n), range(s))
+                      for n, s in enumerate((2, 2, 3))]
+        constraint = Constraint([Extent('2', [0]), Extent('1', [1])])
+        combinatorial = Combinatorial(dimensions, [constraint], 2, 2)
+        combinatorial.target = 1
+        list(combinatorial)
+        self.assertEqual(combinatorial.achieved, 1)
+        self.assertEqual(max(combinatorial.curve), 1)
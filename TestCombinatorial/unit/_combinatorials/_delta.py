@@ -0,0 +1,97 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-09-23
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from itertools import combinations, product
+from unittest import TestCase
+from combinatorials import Combinatorial, Constraint, Delta, Dimension
+from combinatorials import Extent
+
+
+class _Delta(TestCase):
+
+    """Unit tests for Delta class."""
+
+    def assertCovered(self, dimensions: list[Dimension],
+                      rows: list[tuple], excluded: set[tuple] = frozenset()):
+        """Assert every pair of values is covered, other than those
+        excluded.
+        """
+        for position, other in combinations(range(len(dimensions)), 2):
+            first, second = dimensions[position], dimensions[other]
+            pairs = {(r[position], r[other]) for r in rows}
+            for pair in product(first.values, second.values):
+                if ((first.identity, pair[0]),
+                        (second.identity, pair[1])) not in excluded:
+                    self.assertIn(pair, pairs)
+
+    def get_dimensions(self) -> list[Dimension]:
+        """Get the previous dimensions."""
+        return [Dimension('a', [0, 1, 2]),
+                Dimension('b', ['x', 'y', 'z']),
+                Dimension('c', [True, False]),
+                Dimension('d', [0, 1, 2])]
+
+    def test_unchanged(self):
+        """An unchanged model retains all rows and generates none."""
+        previous = self.get_dimensions()
+        rows = list(Combinatorial(previous, (), 2, 0))
+        delta = Delta(self.get_dimensions(), (), 2, 1, previous, rows)
+        self.assertEqual(delta.retained, rows)
+        self.assertEqual(delta.discarded, [])
+        self.assertEqual(list(delta), [])
+
+    def test_reordered(self):
+        """Rows are remapped by identity and value, not position."""
+        previous = self.get_dimensions()
+        rows = list(Combinatorial(previous, (), 2, 0))
+        dimensions = list(reversed(self.get_dimensions()))
+        delta = Delta(dimensions, (), 2, 0, previous, rows)
+        self.assertEqual(delta.retained, [tuple(reversed(r)) for r in rows])
+        self.assertEqual(list(delta), [])
+
+    def test_value_removed(self):
+        """Rows with a removed value are discarded and replaced."""
+        previous = self.get_dimensions()
+        rows = list(Combinatorial(previous, (), 2, 0))
+        dimensions = self.get_dimensions()
+        dimensions[1] = Dimension('b', ['x', 'y', 'w'])
+        delta = Delta(dimensions, (), 2, 0, previous, rows)
+        self.assertEqual(len(delta.retained) + len(delta.discarded),
+                         len(rows))
+        self.assertEqual(delta.discarded,
+                         [r for r in rows if r[1] == 'z'])
+        generated = list(delta)
+        self.assertLess(len(generated), len(rows))
+        self.assertCovered(dimensions, delta.retained + generated)
+
+    def test_dimension_added(self):
+        """Rows are discarded for a new dimension unless it is single."""
+        previous = self.get_dimensions()
+        rows = list(Combinatorial(previous, (), 2, 0))
+        dimensions = self.get_dimensions() + [Dimension('e', ['only'])]
+        delta = Delta(dimensions, (), 2, 0, previous, rows)
+        self.assertEqual(delta.retained, [r + ('only',) for r in rows])
+        dimensions = self.get_dimensions() + [Dimension('e', [0, 1])]
+        delta = Delta(dimensions, (), 2, 0, previous, rows)
+        self.assertEqual(delta.retained, [])
+        self.assertCovered(dimensions, list(delta))
+
+    def test_constraint_added(self):
+        """Rows constrained in the new model are discarded."""
+        previous = self.get_dimensions()
+        rows = list(Combinatorial(previous, (), 2, 0))
+        dimensions = self.get_dimensions()
+        constraints = [Constraint([Extent('a', [0]), Extent('c', [True])])]
+        delta = Delta(dimensions, constraints, 2, 0, previous, rows)
+        self.assertEqual(delta.discarded,
+                         [r for r in rows if r[0] == 0 and r[2] is True])
+        generated = list(delta)
+        for row in generated:
+            self.assertFalse(row[0] == 0 and row[2] is True)
+        self.assertCovered(dimensions, delta.retained + generated,
+                           {(('a', 0), ('c', True))})
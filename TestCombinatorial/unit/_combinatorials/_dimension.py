@@ -116,3 +116,17 @@ class _Dimension(TestCase):
         # Wrap around.
         self.assertEqual([f.index for f in dimension.get_features(-5)],
                          [0, 3, 2, 1])
+
+    def test_get_features_costs(self):
+        """Test get_features and get_index ordered by weighted usage."""
+        dimension = Dimension('identity', ('a', 'b', 'c'), costs=(4, 1, 2))
+        self.assertEqual([f.cost for f in dimension.features], [4, 1, 2])
+        self.assertEqual([dimension.get_index() for _ in range(6)],
+                         [0, 1, 2, 1, 1, 2])
+        self.assertEqual([f.index for f in dimension.get_features()],
+                         [1, 0, 2])
+        # The costs follow the values when randomised.
+        dimension.initialise(Random(0))
+        self.assertEqual(sorted((f.value, f.cost)
+                                for f in dimension.features),
+                         [('a', 4), ('b', 1), ('c', 2)])
@@ -0,0 +1,136 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-21
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from itertools import combinations
+from typing import Optional
+from unittest import TestCase
+from combinatorials import Combinatorial, Constraint, Dimension, Evaluator
+from combinatorials import Extent, Generator_, SequenceGenerator
+
+
+class _Evaluator(TestCase):
+
+    """Unit tests for Evaluator class."""
+
+    def setUp(self):
+        """Evaluate every row in the workers."""
+        self.threshold = Evaluator.THRESHOLD
+        Evaluator.THRESHOLD = 1
+
+    def tearDown(self):
+        """Restore the threshold."""
+        Evaluator.THRESHOLD = self.threshold
+
+    def get_model(self) -> tuple[list[Dimension], list[Constraint]]:
+        """Get the dimensions and constraints of the configuration."""
+        dimensions = [Dimension(str(n), [0, 1, 2]) for n in range(6)]
+        constraints = [Constraint([Extent('0', [0]), Extent('1', [1])]),
+                       Constraint([Extent('2', [2]), Extent('5', [0, 1])])]
+        return dimensions, constraints
+
+    def get_rows(self, coverage: int, workers: int, candidates: int = 0,
+                 budget: Optional[float] = None) -> list[tuple]:
+        """Get the rows of the Combinatorial."""
+        combinatorial = Combinatorial(*self.get_model(), coverage, 1)
+        combinatorial.workers = workers
+        combinatorial.candidates = candidates
+        combinatorial.budget = budget
+        return list(combinatorial)
+
+    @classmethod
+    def get_covered(cls, rows: list[tuple], coverage: int) -> set[tuple]:
+        """Get the sub-combinations covered by the rows."""
+        return {(c, tuple(r[n] for n in c)) for r in rows
+                for c in combinations(range(len(r)), coverage)}
+
+    def test_workers(self):
+        """The rows are independent of the number of workers."""
+        for coverage in (2, 3):
+            rows = self.get_rows(coverage, 0)
+            self.assertEqual(self.get_rows(coverage, 1), rows)
+            self.assertEqual(self.get_rows(coverage, 2), rows)
+
+    def test_sequence(self):
+        """The rows of the SequenceGenerator are independent of the number
+        of workers.
+        """
+        results = []
+        for workers in (0, 3):
+            generator = SequenceGenerator(*self.get_model(), 2, 1)
+            generator.workers = workers
+            results.append([tuple(f.index for f in c) for c in
+                            generator.iterate(SequenceGenerator.OPTION)])
+        self.assertEqual(results[0], results[1])
+
+    def test_candidates(self):
+        """Limited rows are complete and independent of the number of
+        workers.
+        """
+        for coverage in (2, 3):
+            covered = self.get_covered(self.get_rows(coverage, 0), coverage)
+            for candidates in (1, 5):
+                rows = self.get_rows(coverage, 0, candidates)
+                self.assertEqual(self.get_covered(rows, coverage), covered)
+                self.assertEqual(self.get_rows(coverage, 2, candidates),
+                                 rows)
+
+    def test_budget(self):
+        """Rows are complete once the budget is spent."""
+        combinatorial = Combinatorial(*self.get_model(), 2, 1)
+        self.assertIsNotNone(combinatorial.key)
+        combinatorial.budget = 0
+        self.assertIsNone(combinatorial.key)
+        covered = self.get_covered(self.get_rows(2, 0), 2)
+        self.assertEqual(self.get_covered(self.get_rows(2, 0, 0, 0), 2),
+                         covered)
+        self.assertEqual(self.get_rows(2, 0, 0, 0),
+                         self.get_rows(2, 0, Generator_.FALLBACK))
+        self.addCleanup(setattr, Generator_, 'FALLBACK', Generator_.FALLBACK)
+        Generator_.FALLBACK = 1
+        self.assertEqual(self.get_rows(2, 0, 5, 0), self.get_rows(2, 0, 1))
+
+    def test_deadline(self):
+        """A row being evaluated when the budget is spent takes the best
+        candidate so far.
+        """
+        rows = self.get_rows(2, 0, 1)
+        self.addCleanup(setattr, Generator_, 'get_limit',
+                        Generator_.get_limit)
+        Generator_.get_limit = lambda generator: (0, 0.0)
+        self.assertEqual(self.get_rows(2, 0), rows)
+        self.assertEqual(self.get_rows(2, 0, 0, 3600), self.get_rows(2, 0))
+
+    def test_costs(self):
+        """Costed rows are complete, cheaper and independent of the number
+        of workers.
+        """
+        for coverage in (2, 3):
+            dimensions, constraints = self.get_model()
+            covered = self.get_covered(self.get_rows(coverage, 0), coverage)
+            costed = [Dimension(d.identity, d.values, costs=[1, 2, 8])
+                      for d in dimensions]
+            costs = []
+            for workers in (0, 2):
+                combinatorial = Combinatorial(costed, constraints, coverage,
+                                              1)
+                combinatorial.workers = workers
+                rows = list(combinatorial)
+                self.assertEqual(self.get_covered(rows, coverage), covered)
+                costs.append((rows, combinatorial.cost))
+            self.assertEqual(costs[0], costs[1])
+            combinatorial = Combinatorial(*self.get_model(), coverage, 1)
+            rows = list(combinatorial)
+            self.assertEqual(combinatorial.cost, len(rows) * len(dimensions))
+            # The cost is published as each iteration ends.
+            iterator = iter(combinatorial)
+            next(iterator)
+            self.assertEqual(combinatorial.cost, len(rows) * len(dimensions))
+            iterator.close()
+            self.assertEqual(combinatorial.cost, len(dimensions))
+            self.assertLess(costs[0][1], sum(
+                [1, 2, 8][v] for r in rows for v in r))
@@ -9,7 +9,8 @@
 from collections.abc import Collection, Generator
 from itertools import combinations_with_replacement, product
 from unittest import TestCase
-from combinatorials import Configuration, Dimension, Generator_
+from combinatorials import Configuration, Dimension, FillGenerator
+from combinatorials import Generator_, Option, SequenceGenerator
 from combinatorials import SubCombination
 
 
@@ -95,3 +96,30 @@ class _Generator(TestCase):
         """Test that a full spread of generators validates."""
         for generator in self.get_generators():
             self.validate(generator)
+
+    def test_retirement_options(self):
+        """Test that each retirement option validates."""
+        for option in (Option.NONE, Option.RETIRE_MOST,
+                       Option.RETIRE_FEWEST, Option.RETIRE_WEIGHTED):
+            for sizes, coverage in (((3, 3, 3, 3, 3), 2), ((2, 3, 4, 2), 2),
+                                    ((2, 2, 2, 2, 2), 3)):
+                dimensions = self.get_dimensions(sizes)
+                generator = SequenceGenerator(dimensions, (), coverage, 0)
+                generator.OPTION = generator.OPTION | option
+                self.validate(generator)
+
+    def test_retirement_rows(self):
+        """Test that the default retirement order keeps the row counts of
+        the initial order and that RETIRE_FEWEST does not reduce them."""
+        for generator_class, counts in ((FillGenerator, (17, 20, 42)),
+                                        (SequenceGenerator, (15, 22, 42))):
+            for sizes, count in zip(((3,) * 8, (2, 3, 4, 5, 3, 2),
+                                     (4, 2, 7, 6, 3, 3)), counts):
+                rows = []
+                for option in (Option.NONE, Option.RETIRE_FEWEST):
+                    generator = generator_class(self.get_dimensions(sizes),
+                                                (), 2, 0)
+                    rows.append(sum(1 for _ in generator.iterate(
+                        generator.OPTION | option)))
+                self.assertEqual(rows[0], count)
+                self.assertLessEqual(rows[0], rows[1])
@@ -0,0 +1,105 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-07
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from unittest import TestCase
+from combinatorials import Combinatorial, Constraint, Dimension, Extent
+from combinatorials import Library, LibraryGenerator, Tally
+
+
+class _Library(TestCase):
+
+    """Unit tests for Library class."""
+
+    def assertCovering(self, sizes: tuple[int, ...], coverage: int,
+                       rows: list[tuple[int, ...]]):
+        """Assert the rows cover every sub-combination index."""
+        tally = Tally([range(s) for s in sizes], coverage, rows)
+        self.assertNotIn(0, tally.counts)
+
+    def test_arrays(self):
+        """Every construction is valid and stored."""
+        arrays = Library.arrays()
+        self.assertEqual(len(arrays), 15)
+        for sizes, coverage, rows in arrays:
+            self.assertCovering(sizes, coverage, rows)
+
+    def test_exact(self):
+        """Exact matches return the stored array."""
+        self.assertEqual(len(Library.get((3, 3, 3, 3), 2)), 9)
+        self.assertEqual(len(Library.get((5,) * 6, 3)), 125)
+        self.assertEqual(len(Library.get((2,) * 11, 3)), 12)
+
+    def test_reduced(self):
+        """Arrays are reduced by dropping dimensions and collapsing
+        features.
+        """
+        for sizes, coverage, count in (((2,) * 9, 2, 6), ((2,) * 8, 3, 12),
+                                       ((4, 4, 3, 4, 3), 2, 16),
+                                       ((7, 6, 7, 5, 7), 2, 49)):
+            rows = Library.get(sizes, coverage)
+            self.assertEqual(len(rows), count)
+            self.assertCovering(sizes, coverage, rows)
+            self.assertEqual(len(set(rows)), len(rows))
+
+    def test_unsupported(self):
+        """Configurations without a close array are not served."""
+        self.assertIsNone(Library.get((3,) * 5, 2))
+        self.assertIsNone(Library.get((9, 9, 9), 2))
+        self.assertIsNone(Library.get((3, 3, 3), 3))
+
+    def test_combinatorial(self):
+        """The Combinatorial selects the library for supported shapes."""
+        dimensions = [Dimension(str(n), 'abc') for n in range(4)]
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        self.assertEqual(combinatorial.generator.__class__, LibraryGenerator)
+        self.assertEqual(len(list(combinatorial)), 9)
+        constraints = [Constraint([Extent('0', 'a'), Extent('1', 'b')])]
+        combinatorial = Combinatorial(dimensions, constraints, 2, 0)
+        self.assertNotEqual(combinatorial.generator.__class__,
+                            LibraryGenerator)
+
+    def test_shape(self):
+        """Sizes of the same shape share a reduction, arranged in the order
+        of the sizes.
+        """
+        rows = Library.get((4, 3, 4, 3, 4), 2)
+        self.assertCovering((4, 3, 4, 3, 4), 2, rows)
+        self.assertIn(((4, 4, 4, 3, 3), 2), Library._results)
+        self.assertNotIn(((4, 3, 4, 3, 4), 2), Library._results)
+        self.assertEqual(sorted(tuple(r[n] for n in (0, 2, 4, 1, 3))
+                                for r in rows),
+                         sorted(Library.get((4, 4, 4, 3, 3), 2)))
+
+    def test_bound(self):
+        """The lower bound holds for the arrays and generated rows."""
+        self.assertEqual(Library.get_bound((2,) * 10, 2), 6)
+        self.assertEqual(Library.get_bound((2,) * 11, 3), 12)
+        self.assertEqual(Library.get_bound((3, 8, 2, 5), 2), 40)
+        self.assertEqual(Library.get_bound((4,) * 5, 3), 64)
+        for sizes, rows in (((8, 2, 2, 2), 16), ((2,) * 5, 6),
+                            ((2,) * 4, 5)):
+            self.assertEqual(Library.get_bound(sizes, 2), rows)
+            dimensions = [Dimension(str(n), range(s))
+                          for n, s in enumerate(sizes)]
+            self.assertGreaterEqual(
+                len(list(Combinatorial(dimensions, (), 2, 0))), rows)
+
+    def test_greedy(self):
+        """Arrays longer than the lower bound are not selected."""
+        for sizes in ((8, 2, 2, 2), (4, 3, 3, 2, 2), (2, 2, 8, 2)):
+            self.assertIsNotNone(Library.get(sizes, 2))
+            dimensions = [Dimension(str(n), range(s))
+                          for n, s in enumerate(sizes)]
+            combinatorial = Combinatorial(dimensions, (), 2, 0)
+            self.assertNotEqual(combinatorial.generator.__class__,
+                                LibraryGenerator)
+            self.assertLess(len(list(combinatorial)),
+                            len(Library.get(sizes, 2)))
+        dimensions = [Dimension(str(n), range(2)) for n in range(10)]
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        self.assertEqual(combinatorial.generator.__class__, LibraryGenerator)
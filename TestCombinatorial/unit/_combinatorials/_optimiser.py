@@ -0,0 +1,87 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-09-16
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from unittest import TestCase
+from combinatorials import Combinatorial, Constraint, Dimension, Extent
+from combinatorials import Optimiser, SequenceGenerator, Tally
+
+
+class _Optimiser(TestCase):
+
+    """Unit tests for Optimiser class."""
+
+    def get_rows(self, generator: SequenceGenerator) -> list[list[int]]:
+        """Return the rows of the generator as feature indexes."""
+        return [[f.index for f in c]
+                for c in generator.iterate(generator.OPTION)]
+
+    def test_optimise(self):
+        """Optimisation reduces the rows and retains coverage."""
+        dimensions = [Dimension(str(n), [0, 1]) for n in range(7)]
+        generator = SequenceGenerator(dimensions, (), 3, 0)
+        rows = self.get_rows(generator)
+        optimised = Optimiser(generator, 2000).optimise(rows)
+        self.assertLess(len(optimised), len(rows))
+        self.assertTrue(Tally(dimensions, 3, optimised).covers(
+            Tally(dimensions, 3, rows)))
+        self.assertEqual(len(set(optimised)), len(optimised))
+
+    def test_seed(self):
+        """Optimisation is repeatable for a seed."""
+        dimensions = [Dimension(str(n), [0, 1, 2]) for n in range(6)]
+        generator = SequenceGenerator(dimensions, (), 2, 0)
+        rows = self.get_rows(generator)
+        self.assertEqual(Optimiser(generator, 1000, seed=1).optimise(rows),
+                         Optimiser(generator, 1000, seed=1).optimise(rows))
+
+    def test_budget(self):
+        """An exhausted budget returns the original rows."""
+        dimensions = [Dimension(str(n), [0, 1, 2]) for n in range(6)]
+        generator = SequenceGenerator(dimensions, (), 2, 0)
+        rows = self.get_rows(generator)
+        self.assertEqual(Optimiser(generator, 0).optimise(rows),
+                         [tuple(r) for r in rows])
+        self.assertEqual(Optimiser(generator, 1000, 0).optimise(rows),
+                         [tuple(r) for r in rows])
+
+    def test_constrained(self):
+        """Optimised rows are never constrained."""
+        dimensions = [Dimension('a', [0, 1, 2]),
+                      Dimension('b', [0, 1, 2]),
+                      Dimension('c', [0, 1]),
+                      Dimension('d', [0, 1, 2])]
+        constraints = [Constraint([Extent('a', [0]), Extent('c', [1])]),
+                       Constraint([Extent('b', [2]), Extent('d', [0, 1])])]
+        generator = SequenceGenerator(dimensions, constraints, 2, 0)
+        rows = self.get_rows(generator)
+        optimised = Optimiser(generator, 2000).optimise(rows)
+        self.assertTrue(Tally(dimensions, 2, optimised).covers(
+            Tally(dimensions, 2, rows)))
+        for row in optimised:
+            generator.load(row)
+            self.assertFalse(generator.is_constrained())
+
+    def test_combinatorial(self):
+        """An optimised Combinatorial is no longer."""
+        counts = []
+        for optimise in (0, 1000):
+            dimensions = [Dimension(str(n), [0, 1, 2, 3]) for n in range(5)]
+            combinatorial = Combinatorial(dimensions, (), 2, 0)
+            combinatorial.optimise = optimise
+            counts.append(len(list(combinatorial)))
+        self.assertLessEqual(counts[1], counts[0])
+
+    def test_cartesian(self):
+        """An optimised Cartesian product keeps every row."""
+        for coverage in (0, 2):
+            dimensions = [Dimension('a', [1, 2, 3]), Dimension('b', [1]),
+                          Dimension('c', [1, 2])]
+            combinatorial = Combinatorial(dimensions, (), coverage, 1)
+            rows = list(combinatorial)
+            combinatorial.optimise = 100
+            self.assertEqual(sorted(combinatorial), sorted(rows))
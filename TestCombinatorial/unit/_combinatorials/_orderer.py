@@ -0,0 +1,82 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-11-18
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from itertools import product
+from unittest import TestCase
+from combinatorials import Combinatorial, Dimension, Orderer
+from combinatorials import SequenceGenerator, Tally
+
+
+class _Orderer(TestCase):
+
+    """Unit tests for Orderer class."""
+
+    def test_greedy(self):
+        """Each row covers the most new indexes of the remaining rows, then
+        the most new indexes of lower coverage.
+        """
+        dimensions = [Dimension(n, [0, 1, 2]) for n in 'abcd']
+        generator = SequenceGenerator(dimensions, (), 2, 0)
+        rows = list(product(range(3), range(3), range(2), [0, 1, None]))
+        ordered = Orderer(generator).order(rows)
+        self.assertEqual(sorted(ordered, key=str), sorted(rows, key=str))
+        tallies = [Tally(dimensions, 2), Tally(dimensions, 1)]
+        remaining = list(rows)
+        for row in ordered:
+            gains = [tuple(sum(1 for i in t.indexes(r) if not t.counts[i])
+                           for t in tallies) for r in remaining]
+            # The first of the rows with the largest gain.
+            self.assertEqual(remaining.index(row),
+                             gains.index(max(gains)))
+            remaining.remove(row)
+            for tally in tallies:
+                tally.add(row)
+
+    def test_combinatorial(self):
+        """Ordered rows front-load the coverage curve."""
+        dimensions = [Dimension(str(n), 'abc') for n in range(6)]
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        rows = list(combinatorial)
+        self.assertEqual(combinatorial.curve, [])
+        combinatorial.limit = len(rows)
+        list(combinatorial)
+        curve = combinatorial.curve
+        combinatorial.limit = None
+        combinatorial.order = True
+        self.assertFalse(combinatorial.indexed)
+        ordered = list(combinatorial)
+        self.assertEqual(sorted(ordered), sorted(rows))
+        self.assertEqual(len(combinatorial.curve), len(rows))
+        self.assertEqual(combinatorial.curve[-1], 1)
+        self.assertEqual(combinatorial.curve, sorted(combinatorial.curve))
+        self.assertGreaterEqual(sum(combinatorial.curve), sum(curve))
+
+    def test_odometer(self):
+        """Rows of equal coverage are ordered for diversity."""
+        dimensions = [Dimension(str(n), 'abcd') for n in range(3)]
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        rows = list(combinatorial)
+        self.assertEqual(len({r[0] for r in rows[:4]}), 1)
+        combinatorial.order = True
+        ordered = list(combinatorial)
+        self.assertEqual(sorted(ordered), sorted(rows))
+        self.assertGreater(
+            len({(n, v) for r in ordered[:4] for n, v in enumerate(r)}),
+            len({(n, v) for r in rows[:4] for n, v in enumerate(r)}))
+
+    def test_cartesian(self):
+        """An ordered Cartesian product has the same rows."""
+        for coverage in (0, 2):
+            dimensions = [Dimension('a', [1]), Dimension('b', [1, 2, 3]),
+                          Dimension('c', [1, 2])]
+            combinatorial = Combinatorial(dimensions, (), coverage, 1)
+            rows = list(combinatorial)
+            combinatorial.order = True
+            self.assertEqual(sorted(combinatorial), sorted(rows))
+            self.assertEqual(len(combinatorial.curve), len(rows))
+            self.assertEqual(combinatorial.curve[-1], 1)
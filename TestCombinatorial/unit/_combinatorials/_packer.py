@@ -0,0 +1,50 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-28
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from itertools import product
+from unittest import TestCase
+from combinatorials import Combinatorial, Dimension, Packer
+
+
+class _Packer(TestCase):
+
+    """Unit tests for Packer class."""
+
+    def get_dimensions(self) -> list[Dimension]:
+        """Get dimensions including one of a single value."""
+        return [Dimension('a', [0, 1, 2]), Dimension('b', ['x']),
+                Dimension('c', [object() for _ in range(100)]),
+                Dimension('d', [True, False])]
+
+    def test_pack(self):
+        """Packed rows are the ranks of the cartesian product."""
+        packer = Packer(self.get_dimensions())
+        self.assertEqual(packer.size, 2)
+        ranks = [packer.pack(p) for p in product(range(3), range(1),
+                                                 range(100), range(2))]
+        self.assertEqual(sorted(ranks), list(range(600)))
+        for positions in ((0, 0, 0, 0), (2, 0, 99, 1), (1, 0, 57, 0)):
+            packed = packer.pack(positions)
+            self.assertEqual(packer.unpack(packed), positions)
+            self.assertEqual(packer.from_bytes(packer.to_bytes(packed)),
+                             packed)
+
+    def test_size(self):
+        """Bytes are sized to the largest packed row."""
+        self.assertEqual(Packer([Dimension('a', range(256))]).size, 1)
+        self.assertEqual(Packer([Dimension('a', range(257))]).size, 2)
+        self.assertEqual(Packer([]).size, 1)
+
+    def test_iter_packed(self):
+        """Packed rows decode to the rows of the Combinatorial."""
+        dimensions = self.get_dimensions()
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        packer = combinatorial.packer
+        self.assertEqual([packer.decode(p)
+                          for p in combinatorial.iter_packed()],
+                         list(combinatorial))
@@ -0,0 +1,57 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-14
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from itertools import combinations, product
+from unittest import TestCase
+from combinatorials import Dimension, FillGenerator, Option, Portfolio
+from combinatorials import SequenceGenerator
+
+
+class _Portfolio(TestCase):
+
+    """Unit tests for Portfolio class."""
+
+    def get_dimensions(self) -> list[Dimension]:
+        """Get the dimensions, including a single value dimension."""
+        dimensions = [Dimension(str(n), [0, 1, 2]) for n in range(5)]
+        dimensions.append(Dimension('single', ['x']))
+        return dimensions
+
+    def test_variants(self):
+        """Variants are the product of the generators, options and seeds,
+        unsupported generators being skipped.
+        """
+        portfolio = Portfolio(self.get_dimensions(), (), 2, range(3),
+                              (Option.NONE, Option.FEATURE_RANDOM))
+        self.assertEqual(len(portfolio.variants), 12)
+        self.assertEqual(portfolio.variants[0],
+                         (FillGenerator, Option.NONE, 0))
+        self.assertIsNone(portfolio.rows)
+        portfolio = Portfolio(self.get_dimensions(), (), 0)
+        self.assertEqual(portfolio.variants, [])
+
+    def test_run(self):
+        """The shortest covering rows are returned."""
+        dimensions = self.get_dimensions()
+        portfolio = Portfolio(dimensions, (), 2, range(2),
+                              generators=(SequenceGenerator,), workers=2)
+        results = list(portfolio)
+        self.assertEqual(len(results), len(portfolio.variants))
+        self.assertEqual(len(portfolio.rows), min(r[3] for r in results))
+        self.assertIn(portfolio.variant, portfolio.variants)
+        for first, second in combinations(range(len(dimensions)), 2):
+            pairs = {(r[first], r[second]) for r in portfolio.rows}
+            self.assertEqual(pairs, set(product(dimensions[first].values,
+                                                dimensions[second].values)))
+
+    def test_target(self):
+        """Pending variants are cancelled once the target is reached."""
+        portfolio = Portfolio(self.get_dimensions(), (), 2, range(8),
+                              workers=1, target=1000)
+        self.assertEqual(len(list(portfolio)), 1)
+        self.assertEqual(portfolio.run(), portfolio.rows)
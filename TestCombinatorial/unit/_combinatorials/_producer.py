@@ -0,0 +1,50 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-28
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from collections.abc import Generator
+from threading import active_count, get_ident
+from unittest import TestCase
+from combinatorials import Producer
+
+
+class _Producer(TestCase):
+
+    """Unit tests for Producer class."""
+
+    def test_iterate(self):
+        """Items are produced in another thread, once per iteration."""
+
+        def produce() -> Generator[int, None, None]:
+            for item in range(10):
+                yield item, get_ident()
+
+        producer = Producer(list(produce()), 3)
+        self.assertEqual(list(producer), list(produce()))
+        items = list(Producer(produce(), 3))
+        self.assertEqual([i for i, _ in items], list(range(10)))
+        self.assertNotIn(get_ident(), {t for _, t in items})
+
+    def test_close(self):
+        """Closing the iterator stops the producer."""
+        count = active_count()
+        iterator = iter(Producer(range(1000), 1))
+        self.assertEqual(next(iterator), 0)
+        iterator.close()
+        self.assertEqual(active_count(), count)
+
+    def test_exception(self):
+        """Exceptions in production are raised in the iterating thread."""
+        for exception in (ValueError, KeyboardInterrupt):
+
+            def produce() -> Generator[int, None, None]:
+                yield 0
+                raise exception
+
+            iterator = iter(Producer(produce()))
+            self.assertEqual(next(iterator), 0)
+            self.assertRaises(exception, next, iterator)
@@ -0,0 +1,86 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-09-09
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from itertools import product
+from unittest import TestCase
+from combinatorials import Combinatorial, Constraint, Dimension, Extent
+from combinatorials import MinusOneGenerator, Reducer, SequenceGenerator
+from combinatorials import Tally
+
+
+class _Reducer(TestCase):
+
+    """Unit tests for Reducer class."""
+
+    def test_remove(self):
+        """Redundant rows of a full product are removed."""
+        dimensions = [Dimension('a', [0, 1]),
+                      Dimension('b', [0, 1]),
+                      Dimension('c', [0, 1])]
+        generator = MinusOneGenerator(dimensions, (), 2)
+        rows = list(product(range(2), range(2), range(2)))
+        reduced = Reducer(generator).reduce(rows)
+        self.assertLess(len(reduced), len(rows))
+        self.assertTrue(Tally(dimensions, 2, reduced).covers(
+            Tally(dimensions, 2, rows)))
+
+    def test_merge(self):
+        """Rows that differ only in don't care features are merged."""
+        dimensions = [Dimension('a', [0, 1]),
+                      Dimension('b', [0, 1]),
+                      Dimension('c', [0, 1])]
+        generator = MinusOneGenerator(dimensions, (), 2)
+        rows = [(0, 0, 0), (0, 1, 1), (1, 0, 1), (1, 1, 0),
+                (0, 0, None), (None, 1, 1)]
+        self.assertEqual(Reducer(generator).reduce(rows), rows[:4])
+
+    def test_constrained(self):
+        """Reduced rows are never constrained."""
+        dimensions = [Dimension('a', [0, 1, 2]),
+                      Dimension('b', [0, 1, 2]),
+                      Dimension('c', [0, 1]),
+                      Dimension('d', [0, 1])]
+        constraints = [Constraint([Extent('a', [0]), Extent('c', [1])])]
+        generator = SequenceGenerator(dimensions, constraints, 2, 0)
+        rows = [[f.index for f in c]
+                for c in generator.iterate(generator.OPTION)]
+        reduced = Reducer(generator).reduce(rows)
+        self.assertTrue(Tally(dimensions, 2, reduced).covers(
+            Tally(dimensions, 2, rows)))
+        for row in reduced:
+            generator.load(row)
+            self.assertFalse(generator.is_constrained())
+
+    def test_combinatorial(self):
+        """A reduced Combinatorial is no longer and retains coverage."""
+        for sizes in ((4, 3, 3, 2, 2, 5), (3, 3, 3, 3, 3, 3, 3)):
+            counts = []
+            for reduce in (False, True):
+                dimensions = [Dimension(str(n), list(range(s)))
+                              for n, s in enumerate(sizes)]
+                combinatorial = Combinatorial(dimensions, (), 2, 0)
+                combinatorial.reduce = reduce
+                rows = [[dimensions[n].values.index(v)
+                         for n, v in enumerate(c)] for c in combinatorial]
+                full = [[dimensions[n].values.index(v)
+                         for n, v in enumerate(c)]
+                        for c in product(*[d.values for d in dimensions])]
+                self.assertTrue(Tally(dimensions, 2, rows).covers(
+                    Tally(dimensions, 2, full)))
+                counts.append(len(rows))
+            self.assertLessEqual(counts[1], counts[0])
+
+    def test_cartesian(self):
+        """A reduced Cartesian product is unchanged."""
+        for coverage in (0, 2):
+            dimensions = [Dimension('a', [1]), Dimension('b', [1, 2, 3]),
+                          Dimension('c', [1, 2])]
+            combinatorial = Combinatorial(dimensions, (), coverage, 1)
+            rows = list(combinatorial)
+            combinatorial.reduce = True
+            self.assertEqual(list(combinatorial), rows)
@@ -0,0 +1,105 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-09-02
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from random import Random
+from unittest import TestCase
+from combinatorials import Dimension, Option, RetirementQueue
+from combinatorials import SubCombination
+
+
+class _RetirementQueue(TestCase):
+
+    """Unit tests for RetirementQueue class."""
+
+    def get_sub_combinations(self) -> list[SubCombination]:
+        """Get a set of SubCombinations with different uncovered counts."""
+        a = Dimension('a', [0, 1, 2])
+        b = Dimension('b', [0, 1])
+        c = Dimension('c', [0, 1, 2, 3])
+        return [SubCombination([a, b]), SubCombination([a, c]),
+                SubCombination([b, c])]
+
+    def test_initial(self):
+        """Default selection retires the first incomplete in the initial
+        order."""
+        sub_combinations = self.get_sub_combinations()[::-1]
+        queue = RetirementQueue(sub_combinations)
+        self.assertIs(queue.select(), sub_combinations[0])
+        retire = sub_combinations[0]
+        for index in range(len(retire)):
+            retire.sub_combination_index = index
+            queue.retire()
+        self.assertIs(queue.select(), sub_combinations[1])
+
+    def test_fewest(self):
+        """RETIRE_FEWEST selection retires the fewest uncovered first."""
+        sub_combinations = self.get_sub_combinations()
+        queue = RetirementQueue(sub_combinations, Option.RETIRE_FEWEST)
+        self.assertIs(queue.select(), sub_combinations[0])
+        # Ties resolve to the initial order.
+        for index in range(6):
+            sub_combinations[1].sub_combination_index = index
+            sub_combinations[1].cover()
+        queue = RetirementQueue(sub_combinations, Option.RETIRE_FEWEST)
+        self.assertIs(queue.select(), sub_combinations[0])
+        sub_combinations[1].sub_combination_index = 6
+        sub_combinations[1].cover()
+        queue = RetirementQueue(sub_combinations, Option.RETIRE_FEWEST)
+        self.assertIs(queue.select(), sub_combinations[1])
+
+    def test_most(self):
+        """RETIRE_MOST selection retires the most uncovered first."""
+        sub_combinations = self.get_sub_combinations()
+        queue = RetirementQueue(sub_combinations, Option.RETIRE_MOST)
+        self.assertIs(queue.select(), sub_combinations[1])
+
+    def test_incremental(self):
+        """Counts are updated as the queue covers SubCombinations."""
+        sub_combinations = self.get_sub_combinations()
+        a, b = sub_combinations[0].dimensions
+        c = sub_combinations[1].dimensions[1]
+        queue = RetirementQueue(sub_combinations, Option.RETIRE_FEWEST)
+        c.feature_index = 0
+        for feature_a in a.features:
+            for feature_b in b.features:
+                a.feature = feature_a
+                b.feature = feature_b
+                queue.cover()
+        self.assertEqual([s.uncovered for s in sub_combinations], [0, 9, 6])
+        self.assertEqual(len(queue), 2)
+        self.assertIs(queue.select(), sub_combinations[2])
+        self.assertEqual([id(s) for s in queue.sub_combinations],
+                         [id(s) for s in sub_combinations[1:]])
+
+    def test_retire(self):
+        """Retiring covers only the selected SubCombination."""
+        sub_combinations = self.get_sub_combinations()
+        queue = RetirementQueue(sub_combinations)
+        retire = queue.select()
+        for index in range(len(retire)):
+            retire.sub_combination_index = index
+            sub_combinations[1].dimensions[1].feature_index = 0
+            self.assertEqual(queue.retire(), index == len(retire) - 1)
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(sub_combinations[1].uncovered, 12)
+
+    def test_weighted(self):
+        """RETIRE_WEIGHTED selection only selects incomplete entries."""
+        sub_combinations = self.get_sub_combinations()
+        queue = RetirementQueue(sub_combinations, Option.RETIRE_WEIGHTED,
+                                Random(0))
+        selected = {id(queue.select()) for _ in range(100)}
+        self.assertEqual(selected, {id(s) for s in sub_combinations})
+        retire = sub_combinations[0]
+        for index in range(len(retire)):
+            retire.sub_combination_index = index
+            retire.cover()
+        queue = RetirementQueue(sub_combinations, Option.RETIRE_WEIGHTED,
+                                Random(0))
+        selected = {id(queue.select()) for _ in range(100)}
+        self.assertEqual(selected, {id(s) for s in sub_combinations[1:]})
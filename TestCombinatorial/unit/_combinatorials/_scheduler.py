@@ -0,0 +1,87 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-11-25
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from itertools import product
+from random import Random
+from unittest import TestCase
+from combinatorials import Combinatorial, Dimension, Scheduler
+
+
+class _Scheduler(TestCase):
+
+    """Unit tests for Scheduler class."""
+
+    def test_schedule(self):
+        """Rows are unchanged and cost no more to switch between."""
+        dimensions = [Dimension('a', 'abc', 10), Dimension('b', 'ab'),
+                      Dimension('c', 'abcd', 1), Dimension('d', 'ab', 2)]
+        scheduler = Scheduler(dimensions)
+        rows = list(product(range(3), range(2), range(4), range(2)))
+        Random(0).shuffle(rows)
+        rows = rows[:20]
+        scheduled = scheduler.schedule(rows)
+        self.assertEqual(sorted(scheduled), sorted(rows))
+        self.assertLessEqual(scheduler.cost(scheduled), scheduler.cost(rows))
+        # The costly dimension changes once per value.
+        self.assertEqual(sum(1 for r, s in zip(scheduled, scheduled[1:])
+                             if r[0] != s[0]), 2)
+        self.assertEqual(scheduler.cost([]), 0)
+        self.assertEqual(scheduler.schedule([]), [])
+
+    def test_reflect(self):
+        """Rows of all values are ordered as a Gray code, so consecutive
+        rows differ in a single dimension."""
+        dimensions = [Dimension(n, 'abc', 1) for n in 'abc']
+        scheduler = Scheduler(dimensions)
+        rows = list(product(range(3), repeat=3))
+        scheduled = scheduler.schedule(rows)
+        self.assertEqual(sorted(scheduled), rows)
+        self.assertEqual(scheduler.cost(scheduled), len(rows) - 1)
+
+    def test_combinatorial(self):
+        """Scheduled rows of a Combinatorial switch the costly dimension
+        least."""
+        dimensions = [Dimension(str(n), 'abc', 0 if n else 5)
+                      for n in range(5)]
+        combinatorial = Combinatorial(dimensions, (), 2, 0)
+        rows = list(combinatorial)
+        scheduler = Scheduler(dimensions)
+        combinatorial.schedule = True
+        self.assertFalse(combinatorial.indexed)
+        scheduled = list(combinatorial)
+        self.assertEqual(sorted(scheduled), sorted(rows))
+        self.assertEqual(len(combinatorial.curve), len(rows))
+        self.assertEqual(sum(1 for r, s in zip(scheduled, scheduled[1:])
+                             if r[0] != s[0]), 2)
+        positions = [tuple('abc'.index(v) for v in r) for r in scheduled]
+        self.assertEqual(scheduler.cost(positions), 10)
+
+    def test_improve(self):
+        """Improvement by 2-opt costs no more than the grouped order."""
+        dimensions = [Dimension(str(n), 'abcd', n + 1) for n in range(4)]
+        scheduler = Scheduler(dimensions)
+        rows = list(product(range(4), repeat=4))
+        Random(0).shuffle(rows)
+        rows = rows[:200]
+        scheduled = scheduler.schedule(rows)
+        self.assertEqual(sorted(scheduled), sorted(rows))
+        self.assertLessEqual(scheduler.cost(scheduled), scheduler.cost(
+            Scheduler._group(list(rows), [3, 2, 1, 0])))
+
+    def test_cartesian(self):
+        """A scheduled Cartesian product has the same rows."""
+        for coverage in (0, 2):
+            dimensions = [Dimension('a', [1]), Dimension('b', [1, 2, 3], 2),
+                          Dimension('c', [1, 2], 1)]
+            combinatorial = Combinatorial(dimensions, (), coverage, 1)
+            rows = list(combinatorial)
+            combinatorial.schedule = True
+            scheduled = list(combinatorial)
+            self.assertEqual(sorted(scheduled), sorted(rows))
+            self.assertEqual(sum(1 for r, s in zip(scheduled, scheduled[1:])
+                                 if r[1] != s[1]), 2)
@@ -0,0 +1,45 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-10-28
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from asyncio import run
+from collections.abc import Generator
+from threading import Event
+from unittest import TestCase
+from combinatorials import Streamer
+
+
+class _Streamer(TestCase):
+
+    """Unit tests for Streamer class."""
+
+    def test_iterate(self):
+        """Items are produced in chunks of any size."""
+
+        async def collect(chunk: int) -> list[int]:
+            return [i async for i in Streamer(range(10), chunk)]
+
+        for chunk in (1, 3, 10, 100):
+            self.assertEqual(run(collect(chunk)), list(range(10)))
+
+    def test_close(self):
+        """Leaving the iteration early closes the iterator."""
+        closed = Event()
+
+        def produce() -> Generator[int, None, None]:
+            try:
+                yield from range(10)
+            finally:
+                closed.set()
+
+        async def first() -> int:
+            async for item in Streamer(produce(), 2):
+                return item
+
+        self.assertEqual(run(first()), 0)
+        # The close runs in the worker thread.
+        self.assertTrue(closed.wait(5))
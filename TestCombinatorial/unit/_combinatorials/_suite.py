@@ -0,0 +1,79 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-11-11
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from combinatorials import Combinatorial, Dimension, Suite
+
+
+class _Suite(TestCase):
+
+    """Unit tests for Suite class."""
+
+    def get_combinatorial(self) -> Combinatorial:
+        """Get a Combinatorial including a dimension of a single value."""
+        return Combinatorial([Dimension('a', [0, 1, 2]),
+                              Dimension('b', ['x']),
+                              Dimension('c', range(300)),
+                              Dimension('d', [True, False])], (), 2, 5)
+
+    def test_write(self):
+        """Rows and metadata read back from the file."""
+        combinatorial = self.get_combinatorial()
+        rows = list(combinatorial)
+        with TemporaryDirectory() as directory:
+            path = join(directory, 'rows.cmbs')
+            self.assertEqual(Suite.write(combinatorial, path), len(rows))
+            with Suite(path) as suite:
+                self.assertEqual(len(suite), len(rows))
+                self.assertEqual(list(suite), rows)
+                self.assertEqual(suite[len(rows) - 1], rows[-1])
+                self.assertEqual(suite.identities, ['a', 'b', 'c', 'd'])
+                self.assertEqual(suite.tables, combinatorial.tables)
+                self.assertEqual(suite.coverage, 2)
+                self.assertEqual(suite.seed, 5)
+                self.assertEqual(suite.generator,
+                                 str(combinatorial.generator))
+
+    def test_column(self):
+        """Columns are sliced by row range."""
+        combinatorial = self.get_combinatorial()
+        tables = combinatorial.tables
+        rows = [tuple(t.index(v) for t, v in zip(tables, r))
+                for r in combinatorial]
+        with TemporaryDirectory() as directory:
+            path = join(directory, 'rows.cmbs')
+            Suite.write(combinatorial, path)
+            with Suite(path) as suite:
+                for start, stop in ((0, None), (7, 20), (20, 7),
+                                    (0, len(rows) + 10)):
+                    column = suite.column(2, start, stop)
+                    self.assertEqual(column.tolist(),
+                                     [r[2] for r in rows[start:stop]])
+                    column.release()
+
+    def test_empty(self):
+        """Configurations without columns or rows are written."""
+        with TemporaryDirectory() as directory:
+            path = join(directory, 'rows.cmbs')
+            for dimensions, count in (([], 1),
+                                      ([Dimension('a', [])], 0)):
+                combinatorial = Combinatorial(dimensions)
+                self.assertEqual(Suite.write(combinatorial, path), count)
+                with Suite(path) as suite:
+                    self.assertEqual(len(suite), count)
+                    self.assertEqual(list(suite), list(combinatorial))
+
+    def test_invalid(self):
+        """Other files are rejected."""
+        with TemporaryDirectory() as directory:
+            path = join(directory, 'rows.csv')
+            with open(path, 'wb') as stream:
+                stream.write(bytes(64))
+            self.assertRaises(ValueError, Suite, path)
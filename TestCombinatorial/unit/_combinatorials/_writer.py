@@ -0,0 +1,86 @@
+"""
+:Author:        David Stewart
+:Contact:       https://www.linkedin.com/in/david-s-stewart/
+:Date:          2024-11-04
+:Compatibility: Python 3.9
+:License:       MIT
+"""
+
+from csv import reader
+from gzip import open as open_gzip
+from json import loads
+from os.path import join
+from struct import calcsize, unpack
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from combinatorials import Combinatorial, Dimension, Writer
+
+
+class _Writer(TestCase):
+
+    """Unit tests for Writer class."""
+
+    def get_combinatorial(self) -> Combinatorial:
+        """Get a Combinatorial including a dimension of a single value."""
+        return Combinatorial([Dimension('a', [0, 1, 2]),
+                              Dimension('b', ['x']),
+                              Dimension('c', range(300)),
+                              Dimension('d', [True, False])], (), 2, 0)
+
+    def test_csv(self):
+        """Rows are written after a header of identities."""
+        combinatorial = self.get_combinatorial()
+        rows = list(combinatorial)
+        with TemporaryDirectory() as directory:
+            path = join(directory, 'rows.csv')
+            self.assertEqual(Writer(combinatorial).write(path), len(rows))
+            with open(path, newline='') as stream:
+                lines = list(reader(stream))
+        self.assertEqual(lines[0], ['a', 'b', 'c', 'd'])
+        self.assertEqual(lines[1:], [[str(v) for v in r] for r in rows])
+
+    def test_jsonl(self):
+        """Rows are written as objects keyed by identity."""
+        combinatorial = self.get_combinatorial()
+        rows = list(combinatorial)
+        with TemporaryDirectory() as directory:
+            path = join(directory, 'rows.jsonl')
+            Writer(combinatorial, 'jsonl').write(path)
+            with open(path) as stream:
+                objects = [loads(line) for line in stream]
+        self.assertEqual(objects, [dict(zip('abcd', r)) for r in rows])
+
+    def test_binary(self):
+        """Value positions are written as a row-major matrix."""
+        combinatorial = self.get_combinatorial()
+        dimensions = combinatorial.dimensions
+        rows = [tuple(list(d.values).index(v)
+                      for d, v in zip(dimensions, r)) for r in combinatorial]
+        with TemporaryDirectory() as directory:
+            path = join(directory, 'rows.bin')
+            Writer(combinatorial, 'binary').write(path)
+            with open(path, 'rb') as stream:
+                data = stream.read()
+        size = calcsize(Writer.HEADER)
+        marker, itemsize, columns = unpack(Writer.HEADER, data[:size])
+        self.assertEqual((marker, itemsize, columns), (Writer.MARKER, 2, 4))
+        data = data[size:]
+        self.assertEqual(len(data), len(rows) * itemsize * columns)
+        values = [int.from_bytes(data[n:n + itemsize], 'big')
+                  for n in range(0, len(data), itemsize)]
+        self.assertEqual([tuple(values[n:n + columns])
+                          for n in range(0, len(values), columns)], rows)
+
+    def test_compress(self):
+        """Compressed files decompress to the uncompressed content."""
+        combinatorial = self.get_combinatorial()
+        with TemporaryDirectory() as directory:
+            for format_ in Writer.FORMATS:
+                plain = join(directory, 'plain')
+                compressed = join(directory, 'compressed')
+                Writer(combinatorial, format_).write(plain)
+                Writer(combinatorial, format_, True).write(compressed)
+                with open(plain, 'rb') as stream:
+                    expected = stream.read()
+                with open_gzip(compressed, 'rb') as stream:
+                    self.assertEqual(stream.read(), expected)